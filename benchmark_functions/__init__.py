@@ -2,28 +2,75 @@
 Benchmark Functions Library
 
 A comprehensive collection of benchmark mathematical functions for optimization and testing.
+
+Submodules are imported on first attribute access, so importing the package
+is cheap and e.g. get_function("rastrigin", dim=50) only loads what it needs.
 """
 
-from .base import BenchmarkFunction
-from .ackley import Ackley
-from .forrester import Forrester
-from .gramacy_lee import GramacyLee
-from .griewank import Griewank
-from .rastrigin import Rastrigin
-from .rosenbrock import Rosenbrock
-from .schubert import Schubert
-from .schwefel import Schwefel
+import importlib
+from typing import List
+
+from .registry import FunctionInfo, get_function, list_functions, register_function
 
 __version__ = "0.1.0"
 
-__all__ = [
-    "BenchmarkFunction",
-    "Ackley",
-    "Forrester",
-    "GramacyLee",
-    "Griewank",
-    "Rastrigin",
-    "Rosenbrock",
-    "Schubert",
-    "Schwefel",
-] 
\ No newline at end of file
+# Public name -> submodule defining it, imported on first access
+_LAZY_ATTRIBUTES = {
+    "BenchmarkFunction": "base",
+    "BOUNDS_POLICIES": "bounds",
+    "Bounds": "bounds",
+    "BACKENDS": "backends",
+    "get_default_backend": "backends",
+    "set_default_backend": "backends",
+    "EvaluationMetrics": "metrics",
+    "Ackley": "ackley",
+    "Forrester": "forrester",
+    "GramacyLee": "gramacy_lee",
+    "Griewank": "griewank",
+    "Rastrigin": "rastrigin",
+    "Rosenbrock": "rosenbrock",
+    "Schubert": "schubert",
+    "Schwefel": "schwefel",
+    "ParallelEvaluator": "parallel",
+    "AsyncBenchmark": "async_eval",
+    "CachedFunction": "cache",
+    "TransformedFunction": "transforms",
+    "FunctionSuite": "suite",
+    "IncrementalEvaluator": "incremental",
+    "BestSoFar": "streaming",
+    "RunningStats": "streaming",
+    "filter_below": "streaming",
+    "filter_stream": "streaming",
+    "reduce_stream": "streaming",
+    "track": "streaming",
+    "evaluate_npy": "out_of_core",
+    "UniformSampler": "sampling",
+    "LatinHypercubeSampler": "sampling",
+    "HaltonSampler": "sampling",
+    "SobolSampler": "sampling",
+    "make_sampler": "sampling",
+    "RandomSearch": "harness",
+    "ScipyMinimize": "harness",
+    "ScipyGlobal": "harness",
+    "run_experiment": "harness",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + [
+    "FunctionInfo",
+    "get_function",
+    "list_functions",
+    "register_function",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
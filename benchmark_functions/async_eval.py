@@ -0,0 +1,171 @@
+"""
+Asyncio interface that simulates expensive, slow evaluations.
+"""
+
+import asyncio
+from typing import Callable, List, Optional, Union
+
+import numpy as np
+
+from .base import BenchmarkFunction
+
+# Latency distributions, each parameterized by its mean latency in seconds
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+class AsyncBenchmark:
+    """Asynchronous stand-in for a slow simulator backed by a benchmark function.
+
+    Every evaluation waits for an artificial latency drawn from a configurable
+    distribution, optionally under a concurrency limit, before its value is
+    returned. Evaluations requested concurrently are coalesced into a single
+    batched kernel call.
+
+    Example:
+        >>> bench = AsyncBenchmark(Forrester(), latency=0.5, distribution="exponential",
+        ...                        max_concurrency=4)
+        >>> values = asyncio.run(bench.evaluate_many(points))
+    """
+
+    def __init__(self, func: BenchmarkFunction, latency: float = 0.0,
+                 distribution: Union[str, Callable[[np.random.Generator], float]] = "constant",
+                 sigma: float = 0.5, max_concurrency: Optional[int] = None,
+                 coalesce_window: float = 0.0, seed: Optional[int] = None):
+        """Initialize the wrapper.
+
+        Args:
+            func: Benchmark function to evaluate
+            latency: Mean artificial latency per evaluation in seconds (default: 0.0)
+            distribution: One of LATENCY_DISTRIBUTIONS, or a callable drawing a
+                latency in seconds from a numpy Generator (default: 'constant')
+            sigma: Shape parameter of the lognormal distribution (default: 0.5)
+            max_concurrency: Maximum number of evaluations in flight, None for
+                no limit (default: None)
+            coalesce_window: Seconds to wait for more requests before running
+                a batch; 0 batches the requests made in the same event loop
+                iteration (default: 0.0)
+            seed: Seed for the latency random stream (default: None)
+        """
+        if not callable(distribution) and distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{distribution}', "
+                             f"expected one of {LATENCY_DISTRIBUTIONS} or a callable")
+        self.func = func
+        self.latency = latency
+        self.distribution = distribution
+        self.sigma = sigma
+        self.max_concurrency = max_concurrency
+        self.coalesce_window = coalesce_window
+        self.rng = np.random.default_rng(seed)
+
+        # Number of points evaluated and of batched kernel calls made
+        self.evaluations = 0
+        self.batch_calls = 0
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[tuple] = []
+        self._flush_scheduled = False
+
+    def sample_latency(self) -> float:
+        """Draw one artificial latency in seconds."""
+        if callable(self.distribution):
+            return max(0.0, float(self.distribution(self.rng)))
+        if self.latency <= 0:
+            return 0.0
+        if self.distribution == "constant":
+            return self.latency
+        if self.distribution == "uniform":
+            return self.rng.uniform(0, 2 * self.latency)
+        if self.distribution == "exponential":
+            return self.rng.exponential(self.latency)
+        # Lognormal with the requested mean
+        return self.rng.lognormal(np.log(self.latency) - self.sigma**2 / 2, self.sigma)
+
+    async def evaluate(self, x: Union[List[float], np.ndarray]) -> float:
+        """Evaluate the function at point x after a simulated latency.
+
+        Args:
+            x: Input point
+
+        Returns:
+            float: Function value at point x
+        """
+        x = np.asarray(x, dtype=float)
+        if x.shape != (self.func.dim,):
+            raise ValueError(f"Input dimension {x.shape} doesn't match function dimension {self.func.dim}")
+
+        if self.max_concurrency is None:
+            return await self._evaluate_with_latency(x)
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            # A semaphore is bound to the event loop it is first used in
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        async with self._semaphore:
+            return await self._evaluate_with_latency(x)
+
+    async def evaluate_many(self, points: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Evaluate several points concurrently.
+
+        Args:
+            points: Input points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Function values with shape (n,), in input order
+        """
+        values = await asyncio.gather(*(self.evaluate(x) for x in points))
+        return np.asarray(values)
+
+    async def _evaluate_with_latency(self, x: np.ndarray) -> float:
+        delay = self.sample_latency()
+        value = await self._submit(x)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return value
+
+    def _submit(self, x: np.ndarray) -> asyncio.Future:
+        """Queue x for the next coalesced batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((x, future))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            if self.coalesce_window > 0:
+                loop.call_later(self.coalesce_window, self._flush)
+            else:
+                loop.call_soon(self._flush)
+        return future
+
+    def _flush(self):
+        """Evaluate every queued point with one batched kernel call."""
+        pending, self._pending = self._pending, []
+        self._flush_scheduled = False
+        pending = [(x, future) for x, future in pending if not future.cancelled()]
+        if not pending:
+            return
+
+        self.batch_calls += 1
+        self.evaluations += len(pending)
+        try:
+            values = self.func.evaluate_batch(np.stack([x for x, _ in pending]))
+        except ValueError:
+            # Fall back to single points so only the offending requests fail
+            for x, future in pending:
+                try:
+                    future.set_result(self.func(x))
+                except Exception as error:
+                    future.set_exception(error)
+            return
+        except Exception as error:
+            # Any other failure fails the whole batch; an exception escaping
+            # this loop callback would leave the awaiting callers hanging
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), value in zip(pending, values):
+            future.set_result(value)
+
+    def __repr__(self) -> str:
+        return (f"AsyncBenchmark(func={self.func!r}, latency={self.latency}, "
+                f"distribution={self.distribution!r}, max_concurrency={self.max_concurrency})")
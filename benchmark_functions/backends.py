@@ -0,0 +1,213 @@
+"""
+Evaluation backends for the benchmark function kernels.
+
+The default 'numpy' backend runs the vectorized NumPy expressions in each
+function's _evaluate. The optional 'numba' backend runs fused, loop-compiled
+kernels that make a single pass over the input without allocating full-size
+temporaries. It requires Numba; when Numba is not installed the NumPy code is
+used instead. 'auto' picks Numba when it is available.
+
+Numba itself is only imported when the first kernel is compiled, so
+importing the package stays cheap for processes that never use it.
+"""
+
+import importlib.util
+import math
+import warnings
+from functools import lru_cache
+from typing import Callable, Optional
+
+import numpy as np
+
+BACKENDS = ("numpy", "numba", "auto")
+
+_default_backend = "numpy"
+
+
+@lru_cache(maxsize=None)
+def numba_available() -> bool:
+    """Return True if the Numba backend can be used, without importing Numba."""
+    return importlib.util.find_spec("numba") is not None
+
+
+def validate_backend(backend: Optional[str]) -> Optional[str]:
+    """Check that backend is one of BACKENDS or None.
+
+    Warns once per call if 'numba' is requested but Numba is not installed.
+
+    Args:
+        backend: Name of the backend, or None for the global default
+
+    Returns:
+        Optional[str]: The validated backend name
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if backend is None:
+        return None
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == "numba" and not numba_available():
+        warnings.warn("Numba is not installed, falling back to the NumPy backend", RuntimeWarning, stacklevel=3)
+    return backend
+
+
+def set_default_backend(backend: str):
+    """Select the backend used by instances that don't set their own.
+
+    Args:
+        backend: One of 'numpy', 'numba' or 'auto'
+    """
+    global _default_backend
+    if backend is None:
+        raise ValueError(f"Default backend must be one of {BACKENDS}")
+    _default_backend = validate_backend(backend)
+
+
+def get_default_backend() -> str:
+    """Return the global default backend."""
+    return _default_backend
+
+
+def use_numba(backend: Optional[str]) -> bool:
+    """Decide whether an instance with the given backend setting runs on Numba.
+
+    Args:
+        backend: Instance backend, or None for the global default
+
+    Returns:
+        bool: True if the compiled kernel should be used
+    """
+    if backend is None:
+        backend = _default_backend
+    return backend != "numpy" and numba_available()
+
+
+@lru_cache(maxsize=None)
+def get_jit_kernel(name: str) -> Optional[Callable]:
+    """Compile (once per process) and return the fused kernel for a function.
+
+    Args:
+        name: Kernel name, a key of _KERNELS
+
+    Returns:
+        Optional[Callable]: Compiled kernel taking (X, out, *params), or None
+        if Numba is not installed or no kernel exists for the name
+    """
+    if not numba_available() or name not in _KERNELS:
+        return None
+    import numba
+    return numba.njit(cache=True, nogil=True)(_KERNELS[name])
+
+
+# Loop kernels. They are plain Python so they can be compiled by Numba; each
+# takes a C-contiguous float32 or float64 (n, dim) array X and fills out[k]
+# for row k. Accumulators are float64 whatever the dtype of X.
+
+def _ackley(X, out, a, b, c):
+    n, d = X.shape
+    for k in range(n):
+        sum_sq = 0.0
+        sum_cos = 0.0
+        for i in range(d):
+            xi = X[k, i]
+            sum_sq += xi * xi
+            sum_cos += math.cos(c * xi)
+        out[k] = -a * math.exp(-b * math.sqrt(sum_sq / d)) - math.exp(sum_cos / d) + a + math.e
+
+
+def _forrester(X, out):
+    for k in range(X.shape[0]):
+        x = X[k, 0]
+        out[k] = (6 * x - 2)**2 * math.sin(12 * x - 4)
+
+
+def _gramacy_lee(X, out):
+    for k in range(X.shape[0]):
+        x = X[k, 0]
+        out[k] = math.sin(10 * math.pi * x) / (2 * x) + (x - 1)**4
+
+
+def _griewank(X, out, sqrt_i):
+    n, d = X.shape
+    for k in range(n):
+        total = 0.0
+        prod = 1.0
+        for i in range(d):
+            xi = X[k, i]
+            total += xi * xi
+            prod *= math.cos(xi / sqrt_i[i])
+        out[k] = 1 + total / 4000 - prod
+
+
+def _rastrigin(X, out):
+    n, d = X.shape
+    for k in range(n):
+        total = 0.0
+        for i in range(d):
+            xi = X[k, i]
+            total += xi * xi - 10 * math.cos(2 * math.pi * xi)
+        out[k] = 10 * d + total
+
+
+def _rosenbrock(X, out):
+    n, d = X.shape
+    for k in range(n):
+        total = 0.0
+        for i in range(d - 1):
+            xi = X[k, i]
+            t = X[k, i + 1] - xi * xi
+            total += 100 * t * t + (1 - xi)**2
+        out[k] = total
+
+
+def _schubert(X, out, j, j1):
+    n, d = X.shape
+    for k in range(n):
+        prod = 1.0
+        for i in range(d):
+            xi = X[k, i]
+            inner = 0.0
+            for m in range(j.shape[0]):
+                inner += j[m] * math.cos(j1[m] * xi + j[m])
+            prod *= inner
+        out[k] = prod
+
+
+def _schwefel(X, out):
+    n, d = X.shape
+    for k in range(n):
+        total = 0.0
+        for i in range(d):
+            xi = X[k, i]
+            total += xi * math.sin(math.sqrt(abs(xi)))
+        out[k] = 418.9829 * d - total
+
+
+_KERNELS = {
+    "ackley": _ackley,
+    "forrester": _forrester,
+    "gramacy_lee": _gramacy_lee,
+    "griewank": _griewank,
+    "rastrigin": _rastrigin,
+    "rosenbrock": _rosenbrock,
+    "schubert": _schubert,
+    "schwefel": _schwefel,
+}
+
+
+def run_jit_kernel(name: str, X: np.ndarray, *params) -> np.ndarray:
+    """Evaluate a batch with the compiled kernel for a function.
+
+    Args:
+        name: Kernel name
+        X: Batch of points with shape (n, dim)
+        *params: Function-specific constants passed after (X, out)
+
+    Returns:
+        np.ndarray: Function values with shape (n,)
+    """
+    out = np.empty(len(X), dtype=X.dtype)
+    get_jit_kernel(name)(np.ascontiguousarray(X), out, *params)
+    return out
@@ -2,9 +2,65 @@
 Base class for benchmark functions.
 """
 
-from abc import ABC, abstractmethod
+import copyreg
+from abc import ABC
+from functools import lru_cache
 import numpy as np
-from typing import Union, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, Union, List, Tuple, Optional
+from numpy.typing import DTypeLike
+from .bounds import Bounds, validate_policy, inside_mask, box_excess
+from .backends import validate_backend, use_numba, run_jit_kernel
+from .threads import evaluate_chunked
+from .metrics import EvaluationMetrics
+from .streaming import evaluate_stream
+from .grid import evaluate_grid
+from .incremental import IncrementalEvaluator
+from .stencil import evaluate_stencil
+from .utils import SharedTerms
+from .workspace import Workspace
+
+# Floating-point types the kernels can compute in
+FLOAT_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _owner(cls: type, name: str) -> Optional[type]:
+    """First class in the MRO of cls defining the attribute name."""
+    return next((klass for klass in cls.__mro__ if name in vars(klass)), None)
+
+
+@lru_cache(maxsize=None)
+def _follows_formula(cls: type, names: Tuple[str, ...]) -> bool:
+    """Whether the attributes names of cls were written for its current formula.
+
+    Each attribute must be defined by a subclass of every class defining one
+    of cls._formula_hooks; the defaults of BenchmarkFunction always are.
+    """
+    for name in names:
+        owner = _owner(cls, name)
+        if owner is None or owner is BenchmarkFunction:
+            continue
+        if not all(issubclass(owner, _owner(cls, hook)) for hook in cls._formula_hooks):
+            return False
+    return True
+
+
+def validate_dtype(dtype: DTypeLike) -> np.dtype:
+    """Check that dtype is one of FLOAT_DTYPES.
+    
+    Args:
+        dtype: Requested computation dtype
+        
+    Returns:
+        np.dtype: The validated dtype
+        
+    Raises:
+        ValueError: If the dtype is not supported
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype}, expected float32 or float64")
+    return dtype
+
 
 class BenchmarkFunction(ABC):
     """Base class for all benchmark functions.
@@ -12,28 +68,124 @@ class BenchmarkFunction(ABC):
     This abstract base class defines the interface that all benchmark functions
     must implement. It provides common functionality and enforces a consistent
     interface across all benchmark functions.
+    
+    Instances use __slots__; subclasses declare their own attributes in
+    __slots__ and list the ones rebuilt by _build_tables in _tables, so that
+    pickling only ships the constructor-level state.
     """
     
-    def __init__(self, name: str, dim: int, bounds: List[Tuple[float, float]]):
+    __slots__ = ("name", "dim", "_bounds", "_bounds_policy", "_backend", "dtype", "penalty",
+                 "_const_cache", "_workspace", "_metrics", "__weakref__")
+    
+    # Attributes derived from the others by _build_tables, not pickled
+    _tables: Tuple[str, ...] = ()
+    
+    # Name of the fused loop kernel in backends.py, None if there is none
+    _jit_kernel: Optional[str] = None
+    
+    # Whether the function implements _coordinate_terms and _combine_terms
+    _separable: bool = False
+    
+    # Methods defining the formula. Compiled kernels, term decompositions and
+    # shared kernels are only used while none of them is overridden by a
+    # subclass of the class providing them, see _follows_formula
+    _formula_hooks: Tuple[str, ...] = ("_evaluate",)
+    
+    def __init__(self, name: str, dim: int, bounds: Union[Bounds, List[Tuple[float, float]]],
+                 bounds_policy: str = "raise", backend: Optional[str] = None,
+                 dtype: DTypeLike = np.float64):
         """Initialize the benchmark function.
         
         Args:
             name: Name of the function
             dim: Dimension of the function
-            bounds: List of (min, max) tuples for each dimension
+            bounds: Bounds, or a list of (min, max) tuples for each dimension
+            bounds_policy: How out-of-bounds points are handled, one of
+                'raise', 'clip', 'penalty', 'nan' or 'trusted' (default: 'raise')
+            backend: Evaluation backend, one of 'numpy', 'numba' or 'auto';
+                None follows the global default (default: None)
+            dtype: Floating-point type used for inputs, constants and results,
+                float32 or float64 (default: float64)
         """
         self.name = name
         self.dim = dim
         self.bounds = bounds
+        self.bounds_policy = bounds_policy
+        self.backend = backend
+        self.dtype = validate_dtype(dtype)
         
-        # Validate bounds
-        if len(bounds) != dim:
-            raise ValueError(f"Number of bounds ({len(bounds)}) must match dimension ({dim})")
+        # Value returned for offending points under the 'penalty' policy,
+        # on top of their distance to the bounds box
+        self.penalty = 1e10
         
-        # Convert bounds to numpy array for easier computation
-        self._bounds_array = np.array(bounds)
+        # Constant tables converted to other dtypes, keyed by (name, dtype)
+        self._const_cache: Dict[Tuple[str, np.dtype], np.ndarray] = {}
+        
+        # Per-thread scratch buffers of the blocked high-dimensional kernels
+        self._workspace = Workspace()
+        
+        # Evaluation metrics, None while instrumentation is disabled
+        self._metrics: Optional[EvaluationMetrics] = None
+        
+    @property
+    def bounds(self) -> Bounds:
+        """Bounds of the function, a sequence of (min, max) pairs per dimension."""
+        return self._bounds
+    
+    @bounds.setter
+    def bounds(self, bounds: Union[Bounds, List[Tuple[float, float]]]):
+        bounds = Bounds(bounds)
+        if len(bounds) != self.dim:
+            raise ValueError(f"Number of bounds ({len(bounds)}) must match dimension ({self.dim})")
+        self._bounds = bounds
+    
+    @property
+    def _bounds_array(self) -> np.ndarray:
+        """Read-only (dim, 2) array of the bounds in the instance dtype."""
+        return self._bounds.array(self.dtype)
+    
+    @property
+    def _uniform_bounds(self) -> Optional[np.ndarray]:
+        """[min, max] in the instance dtype if the box is uniform, None otherwise."""
+        return self._bounds.uniform_pair(self.dtype)
+    
+    @property
+    def bounds_policy(self) -> str:
+        """Out-of-bounds policy applied by __call__ and evaluate_batch."""
+        return self._bounds_policy
+    
+    @bounds_policy.setter
+    def bounds_policy(self, policy: str):
+        self._bounds_policy = validate_policy(policy)
+        
+    @property
+    def backend(self) -> Optional[str]:
+        """Evaluation backend of this instance, None to follow the global default."""
+        return self._backend
+    
+    @backend.setter
+    def backend(self, backend: Optional[str]):
+        self._backend = validate_backend(backend)
+        
+    @property
+    def metrics(self) -> Optional[EvaluationMetrics]:
+        """Evaluation metrics of this instance, None while disabled."""
+        return self._metrics
+    
+    def enable_metrics(self) -> EvaluationMetrics:
+        """Start recording evaluation counts, latencies and bounds violations.
+        
+        Returns:
+            EvaluationMetrics: The metrics object, also used to register hooks
+        """
+        if self._metrics is None:
+            self._metrics = EvaluationMetrics()
+        return self._metrics
+    
+    def disable_metrics(self):
+        """Stop recording metrics and drop the registered hooks."""
+        self._metrics = None
         
-    @abstractmethod
     def __call__(self, x: Union[List[float], np.ndarray]) -> float:
         """Evaluate the function at point x.
         
@@ -44,9 +196,462 @@ class BenchmarkFunction(ABC):
             float: Function value at point x
             
         Raises:
-            ValueError: If input dimension doesn't match function dimension
+            ValueError: If input dimension doesn't match function dimension,
+                or the point is outside the function bounds under the 'raise' policy
+        """
+        x = self._as_point(x)
+        if self._metrics is None and self._point_inside(x):
+            return self._evaluate_point(x)
+        return self._evaluate_with_policy(x[np.newaxis, :])[0]
+    
+    def _point_inside(self, x: np.ndarray) -> bool:
+        """Whether a single point skips the bounds policy: trusted, or inside the box."""
+        return self._bounds_policy == "trusted" or self._bounds.contains(x)
+    
+    def _as_point(self, x: Union[List[float], np.ndarray], dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Convert x to a (dim,) array of the computation dtype."""
+        x = np.asarray(x, dtype=self.dtype if dtype is None else validate_dtype(dtype))
+        if x.shape != (self.dim,):
+            raise ValueError(f"Input dimension {x.shape} doesn't match function dimension {self.dim}")
+        return x
+    
+    def _as_batch(self, X: Union[List[List[float]], np.ndarray], dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Convert X to an (n, dim) array of the computation dtype."""
+        X = np.asarray(X, dtype=self.dtype if dtype is None else validate_dtype(dtype))
+        if X.ndim != 2 or X.shape[1] != self.dim:
+            raise ValueError(f"Input shape {X.shape} doesn't match (n, {self.dim})")
+        return X
+    
+    def evaluate_batch(self, X: Union[List[List[float]], np.ndarray],
+                       dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Evaluate the function at every row of X.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            dtype: Computation dtype for this call (default: the instance dtype)
+            
+        Returns:
+            np.ndarray: Function values with shape (n,)
+            
+        Raises:
+            ValueError: If X doesn't have shape (n, dim), or any point is
+                outside the function bounds under the 'raise' policy
+        """
+        return self._evaluate_with_policy(self._as_batch(X, dtype))
+    
+    def evaluate_threaded(self, X: Union[List[List[float]], np.ndarray],
+                          n_threads: Optional[int] = None, chunk_rows: Optional[int] = None,
+                          dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Evaluate the function at every row of X using a pool of threads.
+        
+        The batch is split into cache-sized row chunks that are evaluated
+        concurrently. Small batches are evaluated directly.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            n_threads: Number of threads, auto-tuned from the batch shape if None
+            chunk_rows: Rows per chunk, auto-tuned from dim if None
+            dtype: Computation dtype for this call (default: the instance dtype)
+            
+        Returns:
+            np.ndarray: Function values with shape (n,)
+        """
+        X = self._as_batch(X, dtype)
+        
+        def run(X: np.ndarray, with_grad: bool) -> np.ndarray:
+            return evaluate_chunked(self._apply_bounds_policy, X, n_threads, chunk_rows)
+            
+        return self._evaluate_with_policy(X, run=run)
+    
+    def evaluate_stream(self, chunks: Iterable[np.ndarray],
+                        memory_budget: Optional[int] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Lazily evaluate the function over a stream of point chunks.
+        
+        Each chunk is evaluated with evaluate_batch when it is requested, so
+        only one chunk and its values are held at a time. See streaming.py
+        for filter and reduction stages that consume the stream.
+        
+        Args:
+            chunks: Iterable of arrays with shape (n_i, dim)
+            memory_budget: If given, chunks are split so that evaluating one
+                needs roughly at most this many bytes (default: None)
+            
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: (points, values) for each chunk
+        """
+        return evaluate_stream(self, chunks, memory_budget)
+    
+    def evaluate_grid(self, resolution: Union[int, Tuple[int, int]], region: Optional[tuple] = None,
+                      axes: Tuple[int, int] = (0, 1), base_point: Optional[np.ndarray] = None,
+                      tile_rows: Optional[int] = None) -> tuple:
+        """Evaluate the function on a regular grid, e.g. for plotting.
+        
+        1D functions give a curve (x, values); others give a surface
+        (x, y, Z) over two coordinates with Z[i, j] = f at (x[j], y[i]).
+        Separable functions are evaluated by outer-broadcasting per-axis
+        terms, others in tiles of grid rows. See grid.py for details.
+        
+        Args:
+            resolution: Points per axis, an int or an (nx, ny) pair
+            region: (min, max) for a curve, or ((xmin, xmax), (ymin, ymax))
+                for a surface (default: the function bounds)
+            axes: Coordinates spanned by the surface (default: (0, 1))
+            base_point: Point providing the other coordinates of a slice of a
+                higher-dimensional function (default: centre of the bounds)
+            tile_rows: Grid rows per tile for non-separable functions
+            
+        Returns:
+            tuple: (x, values) for a curve or (x, y, Z) for a surface
+        """
+        return evaluate_grid(self, resolution, region, axes, base_point, tile_rows)
+    
+    def evaluate_stencil(self, x: Union[List[float], np.ndarray], offsets: Union[float, List[float], np.ndarray],
+                         dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Evaluate every single-axis perturbation of x, e.g. for pattern search.
+        
+        Functions with per-coordinate terms compute them at x once and only
+        swap in the perturbed term per stencil point, in O(m * dim) overall;
+        others evaluate the points in batches. See stencil.py for details.
+        
+        Args:
+            x: Centre point with shape (dim,)
+            offsets: Steps with shape (m,) applied along every axis, e.g.
+                [-h, h] for a compass stencil, or per-axis steps with shape (m, dim)
+            dtype: Computation dtype for this call (default: the instance dtype)
+            
+        Returns:
+            np.ndarray: Values with shape (m, dim); entry [j, i] is
+            f(x + offsets[j, i] e_i)
+            
+        Raises:
+            ValueError: If x or offsets have the wrong shape, or stencil points
+                are outside the bounds under the 'raise' policy
         """
-        pass
+        return evaluate_stencil(self, x, offsets, dtype)
+    
+    def value_and_grad(self, x: Union[List[float], np.ndarray],
+                       dtype: Optional[DTypeLike] = None) -> Tuple[Union[float, np.ndarray], np.ndarray]:
+        """Evaluate the function and its analytic gradient in one pass.
+        
+        Args:
+            x: Input point with shape (dim,) or batch of points with shape (n, dim)
+            dtype: Computation dtype for this call (default: the instance dtype)
+            
+        Returns:
+            Tuple: (value, gradient) with shapes ((), (dim,)) for a single point
+            or ((n,), (n, dim)) for a batch
+            
+        Raises:
+            ValueError: If the input shape doesn't match the function dimension,
+                or a point is outside the function bounds under the 'raise' policy
+        """
+        if np.ndim(x) == 1:
+            x = self._as_point(x, dtype)
+            values, grads = self._evaluate_with_policy(x[np.newaxis, :], with_grad=True)
+            return values[0], grads[0]
+        
+        return self._evaluate_with_policy(self._as_batch(x, dtype), with_grad=True)
+    
+    def gradient(self, x: Union[List[float], np.ndarray], dtype: Optional[DTypeLike] = None) -> np.ndarray:
+        """Evaluate the analytic gradient of the function.
+        
+        Args:
+            x: Input point with shape (dim,) or batch of points with shape (n, dim)
+            dtype: Computation dtype for this call (default: the instance dtype)
+            
+        Returns:
+            np.ndarray: Gradient with shape (dim,) or (n, dim)
+        """
+        return self.value_and_grad(x, dtype)[1]
+    
+    def _evaluate_with_policy(self, X: np.ndarray, with_grad: bool = False, run=None):
+        """Evaluate a batch under the bounds policy, recording metrics if enabled.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            with_grad: Also return the gradient at every point
+            run: Callable run(X, with_grad) performing the evaluation
+                (default: _apply_bounds_policy)
+            
+        Returns:
+            The result of run
+        """
+        if run is None:
+            run = self._apply_bounds_policy
+        metrics = self._metrics
+        if metrics is None:
+            return run(X, with_grad)
+        return metrics.observe(self, X, with_grad, run)
+    
+    def _apply_bounds_policy(self, X: np.ndarray, with_grad: bool = False,
+                             inside: Optional[np.ndarray] = None):
+        """Validate a batch against the bounds and evaluate it.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            with_grad: Also return the gradient at every point
+            inside: Precomputed mask of the rows inside the bounds, if known
+            
+        Returns:
+            np.ndarray of values with shape (n,), or a (values, gradients)
+            tuple when with_grad is True
+        """
+        kernel = self._value_and_grad if with_grad else self._run_kernel
+        policy = self._bounds_policy
+        if policy == "trusted":
+            return kernel(X)
+        
+        if inside is None:
+            uniform = self._bounds.uniform_pair(X.dtype)
+            inside = inside_mask(X, self._bounds.array(X.dtype) if uniform is None else None, uniform)
+        if inside.all():
+            return kernel(X)
+        
+        if self._metrics is not None:
+            self._metrics.record_violations(np.count_nonzero(~inside))
+        if policy == "raise":
+            if len(X) == 1:
+                raise ValueError(f"Input point {X[0]} is outside the function bounds")
+            raise ValueError(f"{np.count_nonzero(~inside)} input point(s) are outside the function bounds")
+        bounds_array = self._bounds.array(X.dtype)
+        if policy == "clip":
+            return kernel(np.clip(X, bounds_array[:, 0], bounds_array[:, 1]))
+        
+        # 'nan' and 'penalty' only evaluate the rows inside the bounds
+        outside = ~inside
+        values = np.empty(len(X), dtype=X.dtype)
+        grads = np.empty(X.shape, dtype=X.dtype) if with_grad else None
+        if with_grad:
+            values[inside], grads[inside] = kernel(X[inside])
+        else:
+            values[inside] = kernel(X[inside])
+        
+        if policy == "nan":
+            values[outside] = np.nan
+            if with_grad:
+                grads[outside] = np.nan
+        else:
+            excess = box_excess(X[outside], bounds_array)
+            distance = np.sqrt(np.sum(excess**2, axis=1))
+            values[outside] = self.penalty + distance
+            if with_grad:
+                grads[outside] = excess / distance[:, np.newaxis]
+        
+        return (values, grads) if with_grad else values
+    
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate the function on a validated batch of points.
+        
+        This is the vectorized kernel shared by __call__ and evaluate_batch.
+        Subclasses implement it with reductions along axis 1.
+        
+        Subclasses written against the earlier API, where __call__ was the
+        abstract method, keep working: the default evaluates each row with
+        their __call__, one point at a time.
+        
+        Args:
+            X: Batch of input points with shape (n, dim), already handled
+                according to the bounds policy
+            
+        Returns:
+            np.ndarray: Function values with shape (n,)
+            
+        Raises:
+            NotImplementedError: If the subclass overrides neither _evaluate
+                nor __call__
+        """
+        if type(self).__call__ is BenchmarkFunction.__call__:
+            raise NotImplementedError(f"{type(self).__name__} must implement _evaluate")
+        return np.array([self(x) for x in X], dtype=X.dtype).reshape(len(X))
+    
+    def _run_kernel(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate a validated batch on the selected backend.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            
+        Returns:
+            np.ndarray: Function values with shape (n,)
+        """
+        if self._use_jit():
+            return run_jit_kernel(self._jit_kernel, X, *self._jit_params(X.dtype))
+        return self._evaluate(X)
+    
+    def _use_jit(self) -> bool:
+        """Whether the compiled kernel is selected and still matches the formula."""
+        return (self._jit_kernel is not None and use_numba(self._backend)
+                and _follows_formula(type(self), ("_jit_kernel",)))
+    
+    def _follows_formula(self, *names: str) -> bool:
+        """Whether the fast paths given by the attributes names compute this instance's formula.
+        
+        A subclass overriding _evaluate (or another of _formula_hooks) keeps
+        the inherited _jit_kernel, _separable and term methods, which still
+        describe the parent formula; callers then take the generic path.
+        """
+        return _follows_formula(type(self), names)
+    
+    def _evaluate_point(self, x: np.ndarray) -> float:
+        """Evaluate a single validated point with shape (dim,).
+        
+        Functions whose batch kernel has a large fixed cost per call
+        override this with scalar arithmetic.
+        """
+        return self._run_kernel(x[np.newaxis, :])[0]
+    
+    def _run_shared(self, terms: SharedTerms) -> np.ndarray:
+        """Evaluate the batch terms.X, reusing the intermediates in terms.
+        
+        Args:
+            terms: SharedTerms of the batch
+            
+        Returns:
+            np.ndarray: Function values with shape (n,)
+        """
+        if self._use_jit() or not self._follows_formula("_evaluate_shared"):
+            return self._run_kernel(terms.X)
+        return self._evaluate_shared(terms)
+    
+    def _evaluate_shared(self, terms: SharedTerms) -> np.ndarray:
+        """NumPy kernel reading common intermediates from a SharedTerms.
+        
+        Subclasses whose formula contains one of the shared terms override
+        this; the default evaluates terms.X directly.
+        """
+        return self._run_kernel(terms.X)
+    
+    def _jit_params(self, dtype: np.dtype) -> tuple:
+        """Function constants passed to the compiled kernel after (X, out)."""
+        return ()
+    
+    def _const(self, name: str, dtype: np.dtype) -> Optional[np.ndarray]:
+        """Constant table attribute name in the given dtype.
+        
+        Tables are stored in the instance dtype; calls in another dtype use
+        a converted copy that is cached, so kernels never upcast.
+        
+        Args:
+            name: Attribute name of the table
+            dtype: Requested dtype
+            
+        Returns:
+            Optional[np.ndarray]: The table, or None if the attribute is None
+        """
+        table = getattr(self, name)
+        if table is None or table.dtype == dtype:
+            return table
+        key = (name, dtype)
+        converted = self._const_cache.get(key)
+        if converted is None:
+            converted = self._const_cache[key] = table.astype(dtype)
+        return converted
+    
+    def _value_and_grad(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate the function and its gradient on a validated batch.
+        
+        Subclasses override this with an analytic gradient that reuses the
+        intermediates of the value computation.
+        
+        Args:
+            X: Batch of input points with shape (n, dim)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: values with shape (n,) and
+            gradients with shape (n, dim)
+        """
+        raise NotImplementedError("Gradient not implemented for this function")
+    
+    def _coordinate_terms(self, T: np.ndarray, idx: np.ndarray) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Per-coordinate terms of a separable function.
+        
+        Separable functions (with _separable set) decompose as
+        f(x) = _combine_terms(sum_i a_i(x_i), prod_i m_i(x_i)).
+        
+        Args:
+            T: Coordinate values with shape (n, k)
+            idx: Coordinate indices of the k columns of T
+            
+        Returns:
+            Tuple: additive terms a and multiplicative terms m, each with
+            shape (n, k), or None if the function has no such part
+        """
+        raise NotImplementedError("Function is not separable")
+    
+    def _combine_terms(self, add_sum: Optional[np.ndarray], mul_prod: Optional[np.ndarray]) -> np.ndarray:
+        """Combine summed additive and multiplied multiplicative terms into values."""
+        raise NotImplementedError("Function is not separable")
+    
+    def incremental(self, x: Union[List[float], np.ndarray]) -> "IncrementalEvaluator":
+        """Stateful evaluation handle updating the value in O(k) when k coordinates change.
+        
+        Args:
+            x: Starting point with shape (dim,)
+            
+        Returns:
+            IncrementalEvaluator: Handle with value, propose() and update()
+            
+        Raises:
+            NotImplementedError: If the function doesn't support incremental evaluation
+        """
+        return IncrementalEvaluator(self, x)
+    
+    def _affected_terms(self, idx: np.ndarray) -> np.ndarray:
+        """Distinct indices of the incremental terms depending on coordinates idx.
+        
+        Terms are indexed from 0; applied to all coordinates this gives every
+        term. Separable functions have one term per coordinate.
+        """
+        return idx
+    
+    def _separable_terms(self, T: np.ndarray, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-coordinate contributions to the running sums and products.
+        
+        Functions with one term per coordinate decompose as
+        f(x) = _combine_incremental(sums, prods), where each entry of sums
+        (prods) is the sum (product) over all coordinates of one channel
+        returned here. Separable functions get this from _coordinate_terms;
+        Ackley has two additive channels.
+        
+        Args:
+            T: Coordinate values with shape (n, k)
+            idx: Coordinate indices of the k columns of T
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: additive contributions with shape
+            (n_sums, n, k) and multiplicative ones with shape (n_prods, n, k)
+        """
+        if not self._separable:
+            raise NotImplementedError("Function has no per-coordinate terms")
+        add, mul = self._coordinate_terms(T, idx)
+        empty = np.empty((0,) + T.shape, dtype=T.dtype)
+        return (empty if add is None else add[np.newaxis]), (empty if mul is None else mul[np.newaxis])
+    
+    def _incremental_terms(self, x: np.ndarray, terms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Contributions of some terms to the running sums and products.
+        
+        Terms are combined by _combine_incremental. By default there is one
+        term per coordinate, given by _separable_terms; functions coupling
+        coordinates override this and _affected_terms.
+        
+        Args:
+            x: Point with shape (dim,)
+            terms: Indices of the terms, as returned by _affected_terms
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: additive contributions with shape
+            (n_sums, k) and multiplicative ones with shape (n_prods, k)
+        """
+        try:
+            sums, prods = self._separable_terms(x[terms][np.newaxis, :], terms)
+        except NotImplementedError:
+            raise NotImplementedError("Incremental evaluation not implemented for this function") from None
+        return sums[:, 0], prods[:, 0]
+    
+    def _combine_incremental(self, sums: np.ndarray, prods: np.ndarray) -> Union[float, np.ndarray]:
+        """Combine running sums and products, with shapes (n_sums, ...) and (n_prods, ...), into values."""
+        add_sum = sums[:1] if len(sums) else None
+        mul_prod = prods[:1] if len(prods) else None
+        return self._combine_terms(add_sum, mul_prod)[0]
     
     def check_bounds(self, x: Union[List[float], np.ndarray]) -> bool:
         """Check if point x is within the function bounds.
@@ -57,11 +662,20 @@ class BenchmarkFunction(ABC):
         Returns:
             bool: True if point is within bounds, False otherwise
         """
-        x = np.asarray(x)
-        if x.shape != (self.dim,):
-            raise ValueError(f"Input dimension {x.shape} doesn't match function dimension {self.dim}")
+        x = self._as_point(x)
+        return inside_mask(x[np.newaxis, :], self._bounds_array, self._uniform_bounds)[0]
+    
+    def check_bounds_batch(self, X: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Check which rows of X are within the function bounds.
         
-        return np.all((x >= self._bounds_array[:, 0]) & (x <= self._bounds_array[:, 1]))
+        Args:
+            X: Batch of input points with shape (n, dim)
+            
+        Returns:
+            np.ndarray: Boolean array of shape (n,), True where the point is within bounds
+        """
+        X = self._as_batch(X)
+        return inside_mask(X, self._bounds_array, self._uniform_bounds)
     
     def get_global_minimum(self) -> Tuple[float, Optional[np.ndarray]]:
         """Get the global minimum value and its location if known.
@@ -78,4 +692,28 @@ class BenchmarkFunction(ABC):
     
     def __repr__(self) -> str:
         """Detailed string representation of the function."""
-        return f"{self.__class__.__name__}(name='{self.name}', dim={self.dim}, bounds={self.bounds})" 
\ No newline at end of file
+        return f"{self.__class__.__name__}(name='{self.name}', dim={self.dim}, bounds={self.bounds!r})"
+    
+    def _build_tables(self):
+        """Compute the attributes listed in _tables from the others."""
+    
+    def __reduce__(self):
+        """Pickle the constructor-level state only; tables are rebuilt on load."""
+        skipped = set(self._tables) | {"_const_cache", "_workspace", "__weakref__"}
+        state = {}
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                if slot not in skipped and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        # Attributes of subclasses that don't declare __slots__
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            state.update((name, value) for name, value in instance_dict.items() if name not in skipped)
+        return (copyreg.__newobj__, (type(self),), state)
+    
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._const_cache = {}
+        self._workspace = Workspace()
+        self._build_tables() 
\ No newline at end of file
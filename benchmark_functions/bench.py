@@ -0,0 +1,308 @@
+"""
+Performance benchmark suite with regression baselines.
+
+Measures throughput (points/s), per-call latency and peak memory of every
+benchmark function across dimensions and batch sizes, and the import time of
+the package in a fresh interpreter, writes the results to JSON and
+optionally compares them against a stored baseline.
+
+Usage:
+    python -m benchmark_functions.bench --output results.json
+    python -m benchmark_functions.bench --baseline results.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .ackley import Ackley
+from .base import BenchmarkFunction
+from .forrester import Forrester
+from .gramacy_lee import GramacyLee
+from .griewank import Griewank
+from .rastrigin import Rastrigin
+from .rosenbrock import Rosenbrock
+from .schubert import Schubert
+from .schwefel import Schwefel
+
+# Functions with a configurable dimension, and those fixed to 1D
+SCALABLE_FUNCTIONS = {
+    "Ackley": Ackley,
+    "Griewank": Griewank,
+    "Rastrigin": Rastrigin,
+    "Rosenbrock": Rosenbrock,
+    "Schubert": Schubert,
+    "Schwefel": Schwefel,
+}
+FIXED_FUNCTIONS = {
+    "Forrester": Forrester,
+    "GramacyLee": GramacyLee,
+}
+
+DEFAULT_DIMS = (1, 2, 10, 100, 10000)
+DEFAULT_BATCH_SIZES = (1, 100, 10000)
+
+# Cases with more elements (batch size * dim) than this are skipped
+DEFAULT_MAX_ELEMENTS = 10_000_000
+
+# Statements timed in a fresh interpreter by bench_import
+IMPORT_CASES = {
+    "import": "import benchmark_functions",
+    "get_function": "import benchmark_functions; benchmark_functions.get_function('rastrigin', dim=50)",
+}
+
+
+def _make_function(name: str, dim: int) -> Optional[BenchmarkFunction]:
+    if name in SCALABLE_FUNCTIONS:
+        return SCALABLE_FUNCTIONS[name](dim=dim)
+    if dim == 1:
+        return FIXED_FUNCTIONS[name]()
+    return None
+
+
+def _time_calls(fn, min_time: float, repeat: int) -> List[float]:
+    """Per-call wall times of fn, batching calls so each sample lasts min_time."""
+    start = time.perf_counter()
+    fn()
+    calls = max(1, int(min_time / max(time.perf_counter() - start, 1e-9)))
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter() - start) / calls)
+    return samples
+
+
+def _peak_memory(fn) -> int:
+    """Peak bytes allocated by one call of fn, as traced by tracemalloc."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(func: BenchmarkFunction, batch_size: int, mode: str = "batch",
+               repeat: int = 5, min_time: float = 0.05, seed: int = 0) -> Dict[str, object]:
+    """Benchmark one function at one batch size.
+
+    Args:
+        func: Benchmark function to measure
+        batch_size: Number of points per measurement
+        mode: 'batch' for evaluate_batch, 'scalar' for one __call__ per point
+        repeat: Number of timing samples (default: 5)
+        min_time: Minimum duration of each sample in seconds (default: 0.05)
+        seed: Seed for the input points (default: 0)
+
+    Returns:
+        Dict[str, object]: Case description and measurements
+    """
+    rng = np.random.default_rng(seed)
+    lower, upper = func._bounds_array[:, 0], func._bounds_array[:, 1]
+    X = rng.uniform(lower, upper, size=(batch_size, func.dim))
+
+    if mode == "batch":
+        fn = lambda: func.evaluate_batch(X)
+    elif mode == "scalar":
+        fn = lambda: [func(x) for x in X]
+    else:
+        raise ValueError(f"Unknown mode '{mode}', expected 'batch' or 'scalar'")
+
+    samples = _time_calls(fn, min_time, repeat)
+    best = min(samples)
+    return {
+        "function": type(func).__name__,
+        "dim": func.dim,
+        "batch_size": batch_size,
+        "mode": mode,
+        "latency_s": best,
+        "median_latency_s": float(np.median(samples)),
+        "points_per_s": batch_size / best,
+        "peak_bytes": _peak_memory(fn),
+    }
+
+
+def bench_import(statement: str, repeat: int = 5) -> Dict[str, object]:
+    """Time a statement in fresh interpreters, excluding interpreter start-up.
+
+    Args:
+        statement: Python code to time, e.g. 'import benchmark_functions'
+        repeat: Number of interpreters to start (default: 5)
+
+    Returns:
+        Dict[str, object]: Best and median wall time in seconds
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")])))
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    samples = [float(subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                                    capture_output=True, text=True).stdout)
+               for _ in range(repeat)]
+    return {"import_s": min(samples), "median_import_s": float(np.median(samples))}
+
+
+def run_suite(functions: Optional[Sequence[str]] = None, dims: Sequence[int] = DEFAULT_DIMS,
+              batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES, modes: Sequence[str] = ("batch", "scalar"),
+              repeat: int = 5, min_time: float = 0.05,
+              max_elements: int = DEFAULT_MAX_ELEMENTS, verbose: bool = False,
+              import_repeat: int = 5) -> Dict[str, object]:
+    """Run the benchmark matrix.
+
+    Scalar mode is only measured at the smallest batch size, since its cost
+    per point doesn't depend on the batch size.
+
+    Args:
+        functions: Class names to benchmark (default: all)
+        dims: Dimensions to benchmark; 1D-only functions only run at dim 1
+        batch_sizes: Batch sizes to benchmark
+        modes: Subset of ('batch', 'scalar')
+        repeat: Number of timing samples per case
+        min_time: Minimum duration of each sample in seconds
+        max_elements: Skip cases with more than this many input elements
+        verbose: Print each case as it completes
+        import_repeat: Interpreters started per IMPORT_CASES entry, 0 to
+            skip the import-time cases (default: 5)
+
+    Returns:
+        Dict[str, object]: Environment metadata, a list of results and a
+        list of import timings
+    """
+    names = list(functions) if functions else list(SCALABLE_FUNCTIONS) + list(FIXED_FUNCTIONS)
+    results = []
+    for name in names:
+        if name not in SCALABLE_FUNCTIONS and name not in FIXED_FUNCTIONS:
+            raise ValueError(f"Unknown function '{name}'")
+        for dim in dims:
+            func = _make_function(name, dim)
+            if func is None:
+                continue
+            for mode in modes:
+                sizes = [min(batch_sizes)] if mode == "scalar" else batch_sizes
+                for batch_size in sizes:
+                    if batch_size * dim > max_elements:
+                        continue
+                    result = bench_case(func, batch_size, mode, repeat, min_time)
+                    results.append(result)
+                    if verbose:
+                        print(_format_result(result), flush=True)
+
+    imports = []
+    if import_repeat > 0:
+        for case, statement in IMPORT_CASES.items():
+            imports.append(dict(case=case, **bench_import(statement, import_repeat)))
+            if verbose:
+                print(f"{'import':>11} {case:<31} {imports[-1]['import_s'] * 1e3:>10.1f} ms", flush=True)
+    return {
+        "metadata": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+        "imports": imports,
+    }
+
+
+def _case_key(result: Dict[str, object]) -> tuple:
+    return (result["function"], result["dim"], result["batch_size"], result["mode"])
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object],
+            threshold: float = 0.2, memory_threshold: Optional[float] = None) -> List[Dict[str, object]]:
+    """Find cases that regressed against a baseline.
+
+    Args:
+        current: Output of run_suite
+        baseline: Stored output of run_suite
+        threshold: Allowed fractional throughput loss, and import time
+            growth (default: 0.2)
+        memory_threshold: Allowed fractional peak memory growth, None to
+            ignore memory (default: None)
+
+    Returns:
+        List[Dict[str, object]]: One entry per regressed case with the
+        current and baseline values and the metric that regressed
+    """
+    reference = {_case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        base = reference.get(_case_key(result))
+        if base is None:
+            continue
+        if result["points_per_s"] < base["points_per_s"] * (1 - threshold):
+            regressions.append({"case": _case_key(result), "metric": "points_per_s",
+                                "current": result["points_per_s"], "baseline": base["points_per_s"]})
+        if memory_threshold is not None and result["peak_bytes"] > base["peak_bytes"] * (1 + memory_threshold):
+            regressions.append({"case": _case_key(result), "metric": "peak_bytes",
+                                "current": result["peak_bytes"], "baseline": base["peak_bytes"]})
+
+    reference_imports = {r["case"]: r for r in baseline.get("imports", [])}
+    for result in current.get("imports", []):
+        base = reference_imports.get(result["case"])
+        if base is not None and result["import_s"] > base["import_s"] * (1 + threshold):
+            regressions.append({"case": ("import", result["case"]), "metric": "import_s",
+                                "current": result["import_s"], "baseline": base["import_s"]})
+    return regressions
+
+
+def _format_result(result: Dict[str, object]) -> str:
+    return (f"{result['function']:>11} dim={result['dim']:<6} n={result['batch_size']:<6} "
+            f"{result['mode']:<6} {result['points_per_s']:>14,.0f} pts/s "
+            f"{result['latency_s'] * 1e6:>12.1f} us/call {result['peak_bytes'] / 1024:>10.1f} KiB")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark_functions.bench",
+                                     description="Benchmark throughput, latency and memory of every function.")
+    parser.add_argument("--functions", nargs="+", help="class names to benchmark (default: all)")
+    parser.add_argument("--dims", nargs="+", type=int, default=list(DEFAULT_DIMS))
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--modes", nargs="+", choices=("batch", "scalar"), default=["batch", "scalar"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per timing sample")
+    parser.add_argument("--max-elements", type=int, default=DEFAULT_MAX_ELEMENTS,
+                        help="skip cases with more than this many input elements")
+    parser.add_argument("--import-repeat", type=int, default=5,
+                        help="fresh interpreters per import-time case, 0 to skip")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed fractional throughput loss against the baseline")
+    parser.add_argument("--memory-threshold", type=float, default=None,
+                        help="allowed fractional peak memory growth against the baseline")
+    args = parser.parse_args(argv)
+
+    current = run_suite(args.functions, args.dims, args.batch_sizes, args.modes,
+                        args.repeat, args.min_time, args.max_elements, verbose=True,
+                        import_repeat=args.import_repeat)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.memory_threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']}: {regression['metric']} "
+                  f"{regression['current']:.4g} vs baseline {regression['baseline']:.4g}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
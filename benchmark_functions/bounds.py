@@ -0,0 +1,253 @@
+"""
+Vectorized bounds handling for benchmark functions.
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Supported out-of-bounds policies:
+#   raise   - raise ValueError if any point is outside the bounds
+#   clip    - project offending points onto the box before evaluating
+#   penalty - return a large penalty plus the distance to the box
+#   nan     - return NaN for offending points
+#   trusted - skip bounds checking entirely
+BOUNDS_POLICIES = ("raise", "clip", "penalty", "nan", "trusted")
+
+
+def validate_policy(policy: str) -> str:
+    """Check that policy is one of BOUNDS_POLICIES.
+
+    Args:
+        policy: Name of the out-of-bounds policy
+
+    Returns:
+        str: The validated policy name
+
+    Raises:
+        ValueError: If the policy is unknown
+    """
+    if policy not in BOUNDS_POLICIES:
+        raise ValueError(f"Unknown bounds policy '{policy}', expected one of {BOUNDS_POLICIES}")
+    return policy
+
+
+class Bounds(Sequence):
+    """Per-dimension (min, max) bounds of a box, stored compactly.
+
+    A uniform box, with the same pair in every dimension, is stored as two
+    floats whatever its dimension; array() returns a read-only broadcast
+    view of it, so nothing of size dim is allocated. Other boxes keep one
+    (dim, 2) float64 array.
+
+    Bounds behaves as the list of (min, max) tuples used before: it has a
+    length, can be indexed and iterated, and compares equal to such a list.
+
+    Example:
+        >>> bounds = Bounds.uniform(-5.12, 5.12, dim=1_000_000)
+        >>> bounds[0], len(bounds)
+        ((-5.12, 5.12), 1000000)
+    """
+
+    __slots__ = ("dim", "_pair", "_array", "_arrays", "_pairs")
+
+    def __init__(self, bounds: Union["Bounds", Sequence, np.ndarray]):
+        """Initialize from (min, max) pairs.
+
+        Args:
+            bounds: Sequence of (min, max) pairs or an array of shape (dim, 2)
+
+        Raises:
+            ValueError: If bounds is not a sequence of pairs
+        """
+        if isinstance(bounds, Bounds):
+            self._set(bounds.dim, bounds._pair, bounds._array)
+            return
+        array = np.array(bounds, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError(f"Bounds must be (min, max) pairs, got shape {array.shape}")
+        pair = uniform_box(array) if len(array) else None
+        if pair is not None:
+            self._set(len(array), (float(pair[0]), float(pair[1])), None)
+        else:
+            array.flags.writeable = False
+            self._set(len(array), None, array)
+
+    def _set(self, dim: int, pair: Optional[Tuple[float, float]], array: Optional[np.ndarray]):
+        self.dim = dim
+        self._pair = pair
+        self._array = array
+        # Views and pairs keyed by the requested dtype, built on first request
+        self._arrays: Dict[np.dtype, np.ndarray] = {}
+        self._pairs: Dict[np.dtype, np.ndarray] = {}
+
+    @classmethod
+    def uniform(cls, lower: float, upper: float, dim: int) -> "Bounds":
+        """Box with the same (lower, upper) pair in every dimension.
+
+        Args:
+            lower: Lower bound of every coordinate
+            upper: Upper bound of every coordinate
+            dim: Number of dimensions
+
+        Returns:
+            Bounds: The compact box
+        """
+        bounds = cls.__new__(cls)
+        bounds._set(dim, (float(lower), float(upper)), None)
+        return bounds
+
+    @property
+    def is_uniform(self) -> bool:
+        """True if every dimension shares the same (min, max) pair."""
+        return self._pair is not None
+
+    def array(self, dtype: np.dtype = np.float64) -> np.ndarray:
+        """Read-only (dim, 2) array of the bounds in the given dtype.
+
+        Args:
+            dtype: Floating-point dtype (default: float64)
+
+        Returns:
+            np.ndarray: A broadcast view of the pair for uniform boxes, a
+            converted copy otherwise; cached per dtype
+        """
+        array = self._arrays.get(dtype)
+        if array is None:
+            if self._pair is not None:
+                array = np.broadcast_to(self.uniform_pair(dtype), (self.dim, 2))
+            else:
+                array = self._array.astype(dtype)
+                array.flags.writeable = False
+            self._arrays[dtype] = array
+        return array
+
+    def uniform_pair(self, dtype: np.dtype = np.float64) -> Optional[np.ndarray]:
+        """Read-only [min, max] in the given dtype for a uniform box, None otherwise."""
+        if self._pair is None:
+            return None
+        pair = self._pairs.get(dtype)
+        if pair is None:
+            pair = self._pairs[dtype] = np.array(self._pair, dtype=dtype)
+            pair.flags.writeable = False
+        return pair
+
+    def contains(self, x: np.ndarray) -> bool:
+        """Whether a single point with shape (dim,) lies inside the box.
+
+        Uniform boxes compare against the stored pair directly. Rounding
+        the pair to x.dtype is monotonic, so a point inside it is inside
+        the rounded box too; other points fall back to the exact check.
+
+        Args:
+            x: Point with shape (dim,)
+
+        Returns:
+            bool: True if every coordinate is within its (min, max) pair
+        """
+        if self._pair is not None:
+            lower, upper = self._pair
+            if lower <= x.min() and x.max() <= upper:
+                return True
+        bounds_array = self.array(x.dtype)
+        return bool(np.all((x >= bounds_array[:, 0]) & (x <= bounds_array[:, 1])))
+
+    def __len__(self) -> int:
+        return self.dim
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tuple[float, float], List[Tuple[float, float]]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.dim))]
+        if not -self.dim <= index < self.dim:
+            raise IndexError("bounds index out of range")
+        if self._pair is not None:
+            return self._pair
+        lower, upper = self._array[index]
+        return float(lower), float(upper)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        if self._pair is not None:
+            return (self._pair for _ in range(self.dim))
+        return (tuple(row) for row in self._array.tolist())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Bounds):
+            if self._pair is not None or other._pair is not None:
+                return self.dim == other.dim and self._pair == other._pair
+            return bool(np.array_equal(self._array, other._array))
+        if not isinstance(other, (Sequence, np.ndarray)) or isinstance(other, str):
+            return NotImplemented
+        try:
+            return self == Bounds(other)
+        except ValueError:
+            return False
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (_restore_bounds, (self.dim, self._pair, self._array))
+
+    def __repr__(self) -> str:
+        if self._pair is not None:
+            return f"Bounds.uniform({self._pair[0]}, {self._pair[1]}, dim={self.dim})"
+        pairs = [f"({lower}, {upper})" for lower, upper in self._array[:3].tolist()]
+        if self.dim > 3:
+            pairs.append(f"... {self.dim - 3} more")
+        return f"Bounds([{', '.join(pairs)}])"
+
+
+def _restore_bounds(dim: int, pair: Optional[Tuple[float, float]], array: Optional[np.ndarray]) -> Bounds:
+    bounds = Bounds.__new__(Bounds)
+    bounds._set(dim, pair, array)
+    return bounds
+
+
+def uniform_box(bounds_array: np.ndarray) -> Optional[np.ndarray]:
+    """Return the common (min, max) pair if every dimension shares it.
+
+    Args:
+        bounds_array: Array of shape (dim, 2) with per-dimension bounds
+
+    Returns:
+        Optional[np.ndarray]: [min, max] in the dtype of bounds_array for a
+        uniform box, None otherwise
+    """
+    lower, upper = bounds_array[:, 0], bounds_array[:, 1]
+    if np.all(lower == lower[0]) and np.all(upper == upper[0]):
+        return bounds_array[0].copy()
+    return None
+
+
+def inside_mask(X: np.ndarray, bounds_array: np.ndarray,
+                uniform: Optional[np.ndarray] = None) -> np.ndarray:
+    """Check which rows of a batch lie inside the bounds.
+
+    For uniform boxes the check reduces each row to its min and max first,
+    so no (n, dim) boolean temporaries are created.
+
+    Args:
+        X: Batch of points with shape (n, dim)
+        bounds_array: Array of shape (dim, 2) with per-dimension bounds
+        uniform: Optional [min, max] pair shared by all dimensions
+
+    Returns:
+        np.ndarray: Boolean array of shape (n,), True where the row is inside
+    """
+    if uniform is not None:
+        lo, hi = uniform
+        return (np.min(X, axis=1) >= lo) & (np.max(X, axis=1) <= hi)
+    return np.all((X >= bounds_array[:, 0]) & (X <= bounds_array[:, 1]), axis=1)
+
+
+def box_excess(X: np.ndarray, bounds_array: np.ndarray) -> np.ndarray:
+    """Offset of each point from its projection onto the bounds box.
+
+    Args:
+        X: Batch of points with shape (n, dim)
+        bounds_array: Array of shape (dim, 2) with per-dimension bounds
+
+    Returns:
+        np.ndarray: Offsets with shape (n, dim), zero inside the box
+    """
+    return X - np.clip(X, bounds_array[:, 0], bounds_array[:, 1])
@@ -0,0 +1,177 @@
+"""
+In-memory LRU memoization of benchmark function evaluations.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from .base import BenchmarkFunction
+
+# Approximate per-entry bookkeeping cost in bytes (dict slot, linked-list
+# node, key and value objects), added to the key length for the memory budget
+ENTRY_OVERHEAD = 120
+
+
+class CachedFunction:
+    """Benchmark function wrapper that memoizes evaluations.
+
+    Points are keyed on the bytes of their float64 representation, or of
+    their coordinates rounded to a grid of spacing quantum when one is
+    given (all points in a grid cell then share the value of the first one
+    evaluated). Entries are evicted in least-recently-used order once either
+    max_entries or max_bytes is exceeded.
+
+    Batched lookups only evaluate the rows that miss the cache, and evaluate
+    each distinct missing point once. Attributes not defined here (dim,
+    bounds, get_global_minimum, ...) are forwarded to the wrapped function.
+    The cache is not thread-safe.
+
+    Example:
+        >>> func = CachedFunction(Rastrigin(dim=10), max_entries=10000)
+        >>> func(x)
+        >>> func.stats()["hits"]
+    """
+
+    def __init__(self, func: BenchmarkFunction, max_entries: Optional[int] = 100000,
+                 max_bytes: Optional[int] = None, quantum: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            func: Benchmark function to wrap
+            max_entries: Maximum number of cached points, None for no limit (default: 100000)
+            max_bytes: Approximate memory budget in bytes, None for no limit (default: None)
+            quantum: Grid spacing used to quantize keys, None for exact keys (default: None)
+        """
+        if quantum is not None and quantum <= 0:
+            raise ValueError(f"quantum must be positive, got {quantum}")
+        self.func = func
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.quantum = quantum
+
+        self._cache: "OrderedDict[bytes, float]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getattr__(self, name: str):
+        if name == "func":  # Not set yet, e.g. while unpickling
+            raise AttributeError(name)
+        return getattr(self.func, name)
+
+    def _keys(self, X: np.ndarray) -> List[bytes]:
+        """Cache keys for every row of X."""
+        if self.quantum is None:
+            # Adding 0.0 maps -0.0 to 0.0 so both share a key
+            K = np.ascontiguousarray(X + 0.0, dtype=np.float64)
+        else:
+            K = np.ascontiguousarray(np.round(X / self.quantum), dtype=np.int64)
+        row = K.view(np.dtype((np.void, K.itemsize * K.shape[1]))).ravel()
+        return [r.tobytes() for r in row]
+
+    def __call__(self, x: Union[List[float], np.ndarray]) -> float:
+        """Evaluate the function at point x, using the cache.
+
+        Args:
+            x: Input point
+
+        Returns:
+            float: Function value at point x
+        """
+        x = np.asarray(x)
+        if x.shape != (self.func.dim,):
+            raise ValueError(f"Input dimension {x.shape} doesn't match function dimension {self.func.dim}")
+
+        key = self._keys(x[np.newaxis, :])[0]
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = self.func(x)
+        self._store(key, value)
+        return value
+
+    def evaluate_batch(self, X: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Evaluate the function at every row of X, evaluating only cache misses.
+
+        Args:
+            X: Batch of input points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Function values with shape (n,)
+        """
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.func.dim:
+            raise ValueError(f"Input shape {X.shape} doesn't match (n, {self.func.dim})")
+
+        keys = self._keys(X)
+        out = np.empty(len(X), dtype=self.func.dtype)
+        cache = self._cache
+        # Distinct missing keys -> rows sharing the key; the first is evaluated
+        missing: Dict[bytes, List[int]] = {}
+        for i, key in enumerate(keys):
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+                out[i] = value
+            elif key in missing:
+                missing[key].append(i)
+            else:
+                missing[key] = [i]
+
+        n_missing = sum(len(rows) for rows in missing.values())
+        self.hits += len(X) - n_missing
+        self.misses += n_missing
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            values = self.func.evaluate_batch(X[first_rows])
+            for (key, rows), value in zip(missing.items(), values):
+                out[rows] = value
+                self._store(key, value)
+        return out
+
+    def _store(self, key: bytes, value: float):
+        """Insert an entry and evict least-recently-used ones over budget."""
+        self._cache[key] = value
+        self._bytes += len(key) + ENTRY_OVERHEAD
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            old_key, _ = self._cache.popitem(last=False)
+            self._bytes -= len(old_key) + ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss statistics.
+
+        Returns:
+            Dict[str, float]: hits, misses, hit_rate, entries, bytes and evictions
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._cache),
+            "bytes": self._bytes,
+            "evictions": self.evictions,
+        }
+
+    def clear(self):
+        """Drop all cached entries and reset the statistics."""
+        self._cache.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __repr__(self) -> str:
+        return f"CachedFunction(func={self.func!r}, max_entries={self.max_entries}, quantum={self.quantum})"
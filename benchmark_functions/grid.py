@@ -0,0 +1,121 @@
+"""
+Grid evaluation of 1D curves and 2D landscapes.
+
+Functions that decompose per coordinate as
+
+    f(x) = combine(sum_i a_i(x_i), prod_i m_i(x_i))
+
+(Rastrigin, Schwefel, Griewank, Schubert) set _separable and implement
+_coordinate_terms and _combine_terms. Their surfaces are built by
+outer-broadcasting the per-axis terms, without materializing coordinate
+meshes. Other functions are
+evaluated in tiles of grid rows, so very high resolutions stay within a
+bounded amount of memory.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Approximate memory budget for the points of one tile in the generic path
+TILE_BYTES = 32 * 2**20
+
+
+def _axis_region(func, axis: int, region) -> Tuple[float, float]:
+    if region is None:
+        return tuple(func._bounds_array[axis])
+    return tuple(region)
+
+
+def evaluate_grid(func, resolution: Union[int, Sequence[int]],
+                  region: Optional[Sequence] = None, axes: Tuple[int, int] = (0, 1),
+                  base_point: Optional[np.ndarray] = None, tile_rows: Optional[int] = None):
+    """Evaluate a function on a regular grid.
+
+    For 1D functions the result is a curve (x, values). Otherwise the result
+    is a surface (x, y, Z) over the two coordinates in axes, with the other
+    coordinates held at base_point, and Z[i, j] = f at (x[j], y[i]) as
+    expected by matplotlib's contour and pcolormesh.
+
+    Args:
+        func: Benchmark function
+        resolution: Points per axis, an int or an (nx, ny) pair
+        region: (min, max) for a curve, or ((xmin, xmax), (ymin, ymax)) for a
+            surface (default: the function bounds)
+        axes: Coordinates spanned by the surface (default: (0, 1))
+        base_point: Point providing the fixed coordinates of a slice
+            (default: centre of the bounds)
+        tile_rows: Grid rows per tile in the generic path (default: derived
+            from TILE_BYTES)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] for a curve, or
+        Tuple[np.ndarray, np.ndarray, np.ndarray] for a surface
+
+    Raises:
+        ValueError: If the axes are invalid, or the region is outside the
+            bounds under the 'raise' policy
+    """
+    if func.dim == 1:
+        n = resolution if np.isscalar(resolution) else resolution[0]
+        lo, hi = _axis_region(func, 0, region)
+        x = np.linspace(lo, hi, n, dtype=func.dtype)
+        return x, func.evaluate_batch(x[:, np.newaxis])
+
+    i, j = axes
+    if i == j or not (0 <= i < func.dim and 0 <= j < func.dim):
+        raise ValueError(f"Invalid axes {axes} for a function of dimension {func.dim}")
+    nx, ny = (resolution, resolution) if np.isscalar(resolution) else resolution
+    region_x, region_y = (None, None) if region is None else region
+    x = np.linspace(*_axis_region(func, i, region_x), nx, dtype=func.dtype)
+    y = np.linspace(*_axis_region(func, j, region_y), ny, dtype=func.dtype)
+
+    if base_point is None:
+        base_point = func._bounds_array.mean(axis=1)
+    base_point = np.asarray(base_point, dtype=func.dtype)
+    if base_point.shape != (func.dim,):
+        raise ValueError(f"Base point dimension {base_point.shape} doesn't match function dimension {func.dim}")
+
+    corners = np.tile(base_point, (4, 1))
+    corners[:, i] = [x[0], x[0], x[-1], x[-1]]
+    corners[:, j] = [y[0], y[-1], y[0], y[-1]]
+    inside = func.bounds_policy == "trusted" or func.check_bounds_batch(corners).all()
+
+    # The term decomposition skips metrics and describes the class that
+    # defined it, not subclasses overriding the formula
+    if (inside and func._separable and func._metrics is None
+            and func._follows_formula("_separable", "_coordinate_terms", "_combine_terms")):
+        return x, y, _separable_grid(func, x, y, i, j, base_point)
+    return x, y, _tiled_grid(func, x, y, i, j, base_point, tile_rows)
+
+
+def _separable_grid(func, x, y, i, j, base_point) -> np.ndarray:
+    """Build the surface from outer sums and products of per-axis terms."""
+    others = np.array([k for k in range(func.dim) if k not in (i, j)], dtype=int)
+    add_x, mul_x = func._coordinate_terms(x[:, np.newaxis], np.array([i]))
+    add_y, mul_y = func._coordinate_terms(y[:, np.newaxis], np.array([j]))
+    add_0, mul_0 = func._coordinate_terms(base_point[np.newaxis, others], others)
+
+    add_sum = mul_prod = None
+    if add_x is not None:
+        add_sum = np.sum(add_0) + add_y[:, 0, np.newaxis] + add_x[np.newaxis, :, 0]
+    if mul_x is not None:
+        mul_prod = np.prod(mul_0) * np.outer(mul_y[:, 0], mul_x[:, 0])
+    return func._combine_terms(add_sum, mul_prod)
+
+
+def _tiled_grid(func, x, y, i, j, base_point, tile_rows) -> np.ndarray:
+    """Evaluate the surface in tiles of grid rows through evaluate_batch."""
+    nx, ny = len(x), len(y)
+    if tile_rows is None:
+        tile_rows = max(1, TILE_BYTES // (nx * func.dim * func.dtype.itemsize))
+    Z = np.empty((ny, nx), dtype=func.dtype)
+    tile = np.empty((min(tile_rows, ny) * nx, func.dim), dtype=func.dtype)
+    tile[:] = base_point
+    for start in range(0, ny, tile_rows):
+        stop = min(start + tile_rows, ny)
+        points = tile[:(stop - start) * nx]
+        points[:, i] = np.tile(x, stop - start)
+        points[:, j] = np.repeat(y[start:stop], nx)
+        Z[start:stop] = func.evaluate_batch(points).reshape(stop - start, nx)
+    return Z
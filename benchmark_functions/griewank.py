@@ -3,8 +3,12 @@ Griewank function implementation.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import Optional, Tuple
+from numpy.typing import DTypeLike
 from .base import BenchmarkFunction
+from .bounds import Bounds
+from .utils import SharedTerms, exclusive_prod
+from .workspace import BLOCKED_MIN_DIM, blocked_reduce
 
 class Griewank(BenchmarkFunction):
     """Griewank function.
@@ -17,35 +21,105 @@ class Griewank(BenchmarkFunction):
         
     Global minimum:
         f(0,0,...,0) = 0
+        
+    Precision:
+        float32 evaluation (dtype=np.float32) over uniform samples of the bounds:
+        Relative error against float64 below 2e-6 (dim 2 to 100); the absolute error
+        grows with the magnitude of f, about 1e-3 at dim 100.
     """
     
-    def __init__(self, dim: int = 2):
+    __slots__ = ("_sqrt_i",)
+    _tables = ("_sqrt_i",)
+    
+    _separable = True
+    _jit_kernel = "griewank"
+    
+    def __init__(self, dim: int = 2, bounds_policy: str = "raise", backend: Optional[str] = None,
+                 dtype: DTypeLike = np.float64):
         """Initialize the Griewank function.
         
         Args:
             dim: Dimension of the function (default: 2)
+            bounds_policy: Out-of-bounds policy, see BenchmarkFunction (default: 'raise')
+            backend: Evaluation backend, see BenchmarkFunction (default: None)
+            dtype: Computation dtype, float32 or float64 (default: float64)
         """
-        bounds = [(-600, 600) for _ in range(dim)]
-        super().__init__(name="Griewank", dim=dim, bounds=bounds)
+        bounds = Bounds.uniform(-600, 600, dim)
+        super().__init__(name="Griewank", dim=dim, bounds=bounds, bounds_policy=bounds_policy, backend=backend,
+                         dtype=dtype)
+        self._build_tables()
         
-    def __call__(self, x: List[float]) -> float:
-        """Evaluate the Griewank function at point x.
+    def _build_tables(self):
+        # Per-coordinate divisors sqrt(i) of the cosine product
+        self._sqrt_i = np.sqrt(np.arange(1, self.dim + 1, dtype=self.dtype))
+        
+    def _jit_params(self, dtype: np.dtype) -> tuple:
+        return (self._const("_sqrt_i", dtype),)
+    
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate the Griewank function on a batch of points.
         
         Args:
-            x: Input point
+            X: Input points with shape (n, dim)
             
         Returns:
-            float: Function value at point x
+            np.ndarray: Function values with shape (n,)
         """
-        x = np.asarray(x)
-        if not self.check_bounds(x):
-            raise ValueError(f"Input point {x} is outside the function bounds")
-            
-        term1 = np.sum(x**2 / 4000)
-        term2 = np.prod(np.cos(x / np.sqrt(np.arange(1, self.dim + 1))))
+        if self.dim >= BLOCKED_MIN_DIM:
+            return self._evaluate_blocked(X)
+        term1 = np.sum(X**2 / 4000, axis=1)
+        term2 = np.prod(np.cos(X / self._const("_sqrt_i", X.dtype)), axis=1)
+        
+        return 1 + term1 - term2
+    
+    def _evaluate_blocked(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate in cache-sized column blocks without dim-sized temporaries."""
+        sqrt_i = self._const("_sqrt_i", X.dtype)
+        
+        def squares(start: int, stop: int, buf: np.ndarray):
+            np.square(X[:, start:stop], out=buf)
+        
+        def cosines(start: int, stop: int, buf: np.ndarray):
+            np.divide(X[:, start:stop], sqrt_i[start:stop], out=buf)
+            np.cos(buf, out=buf)
+        
+        term1 = blocked_reduce(self._workspace, X, self.dim, squares) / 4000
+        term2 = blocked_reduce(self._workspace, X, self.dim, cosines, ufunc=np.multiply)
         
         return 1 + term1 - term2
     
+    def _evaluate_shared(self, terms: SharedTerms) -> np.ndarray:
+        term2 = np.prod(np.cos(terms.X / self._const("_sqrt_i", terms.X.dtype)), axis=1)
+        return 1 + terms.sum_square / 4000 - term2
+    
+    def _value_and_grad(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate the Griewank function and its gradient on a batch of points.
+        
+        The product rule uses exclusive prefix/suffix products, so points with
+        a zero cosine factor are handled without dividing by it.
+        
+        Args:
+            X: Input points with shape (n, dim)
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: values with shape (n,) and gradients with shape (n, dim)
+        """
+        sqrt_i = self._const("_sqrt_i", X.dtype)
+        scaled = X / sqrt_i
+        cos = np.cos(scaled)
+        others = exclusive_prod(cos)
+        values = 1 + np.sum(X**2, axis=1) / 4000 - others[:, 0] * cos[:, 0]
+        
+        grads = X / 2000 + np.sin(scaled) / sqrt_i * others
+        
+        return values, grads
+    
+    def _coordinate_terms(self, T: np.ndarray, idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return T**2 / 4000, np.cos(T / self._const("_sqrt_i", T.dtype)[idx])
+    
+    def _combine_terms(self, add_sum: np.ndarray, mul_prod: np.ndarray) -> np.ndarray:
+        return 1 + add_sum - mul_prod
+    
     def get_global_minimum(self) -> Tuple[float, np.ndarray]:
         """Get the global minimum value and its location.
         
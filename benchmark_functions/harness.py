@@ -0,0 +1,453 @@
+"""
+Optimizer benchmarking: run matrices, evaluations-to-target and ECDF/ERT summaries.
+
+An experiment runs every optimizer on every (function, dim, seed)
+combination, optionally on a process pool. Each run sees a Problem: a
+counted objective with an evaluation budget. The Problem records, for a
+ladder of target precisions above the known global minimum
+(reference_minimum), the number of evaluations after which the best value
+found first reached each target. The run ends when the budget is spent or
+the last target is reached.
+
+Results are summarized the COCO way:
+
+    ERT   expected running time, the evaluations spent over all runs
+          (until the target was hit, or in total for unsuccessful runs)
+          divided by the number of successful runs
+    ECDF  fraction of (run, target) pairs solved within a budget of
+          evaluations per dimension, aggregated over functions
+
+Optimizers are callables optimizer(problem, rng) that evaluate problem and
+problem.evaluate_batch. Adapters for scipy.optimize (SciPy is the optional
+'scipy' extra) and a NumPy random-search baseline are provided. Optimizers
+sent to a process pool must be picklable, e.g. module-level functions or
+instances of the adapter classes.
+"""
+
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .registry import get_function
+from .sampling import UniformSampler
+
+# Target precisions f - f_opt, 10^2 down to 10^-8 with 5 steps per decade as in COCO
+DEFAULT_PRECISIONS = np.logspace(2, -8, 51)
+
+
+class BudgetExhausted(Exception):
+    """Raised by a Problem to end a run, when the budget is spent or the last target is hit."""
+
+
+def reference_minimum(func) -> float:
+    """Value the targets of a function are measured from.
+
+    The stated minimum of get_global_minimum is rounded, and some functions
+    state it for one dimension only, so targets below its error would be
+    unreachable or hit at once. The reference is instead the function value
+    at the stated location, which holds at every dimension and precision.
+
+    Args:
+        func: Benchmark function
+
+    Returns:
+        float: f(x*) at the location returned by get_global_minimum
+
+    Raises:
+        ValueError: If the function doesn't give a location of its minimum
+            at its dimension
+    """
+    location = func.get_global_minimum()[1]
+    if location is None or np.shape(location) != (func.dim,):
+        raise ValueError(f"{func} has no known minimum location at dim={func.dim}, "
+                         "so its targets have no valid reference")
+    location = np.asarray(location, dtype=np.float64)[np.newaxis, :]
+    return float(func.evaluate_batch(location, dtype=np.float64)[0])
+
+
+class Problem:
+    """One optimization run: a counted objective with targets and a budget.
+
+    Attributes:
+        func: The benchmark function
+        dim: Dimension of the search space
+        bounds: (dim, 2) array of the search box
+        x0: Starting point drawn uniformly in the box
+        budget: Maximum number of evaluations
+        evaluations: Evaluations used so far
+        best_value: Best value found so far
+        hits: Evaluations after which each target was first reached, inf if not yet
+    """
+
+    def __init__(self, func, budget: int, precisions: np.ndarray, seed: int, stop_at_target: bool = True):
+        """Initialize the problem.
+
+        Args:
+            func: Benchmark function to minimize
+            budget: Maximum number of evaluations
+            precisions: Target precisions above the global minimum, decreasing
+            seed: Seed of the starting point
+            stop_at_target: End the run when the last target is reached (default: True)
+
+        Raises:
+            ValueError: If the function has no valid reference minimum, see
+                reference_minimum
+        """
+        self.func = func
+        self.dim = func.dim
+        self.bounds = np.array(func._bounds_array, dtype=np.float64)
+        self.budget = budget
+        self.f_opt = reference_minimum(func)
+        self.targets = self.f_opt + np.asarray(precisions, dtype=np.float64)
+        self.stop_at_target = stop_at_target
+        self.x0 = UniformSampler(func, seed=seed, dtype=np.float64).sample(1)[0]
+
+        self.evaluations = 0
+        self.best_value = np.inf
+        self.hits = np.full(len(self.targets), np.inf)
+
+    def evaluate_batch(self, X: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Evaluate and count a batch of points.
+
+        Only the rows fitting in the remaining budget are evaluated.
+
+        Args:
+            X: Batch of points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Values with shape (n,)
+
+        Raises:
+            BudgetExhausted: If the budget was already spent, or the last
+                target was reached and stop_at_target is set
+        """
+        X = np.asarray(X, dtype=np.float64)
+        remaining = self.budget - self.evaluations
+        if remaining <= 0 or (self.stop_at_target and np.isfinite(self.hits[-1])):
+            raise BudgetExhausted()
+        if len(X) > remaining:
+            X = X[:remaining]
+        values = np.asarray(self.func.evaluate_batch(X), dtype=np.float64)
+
+        # Evaluation count at which the running best first drops to each target
+        best = np.minimum.accumulate(np.minimum(values, self.best_value))
+        missed = np.isinf(self.hits)
+        if missed.any():
+            reached = best[:, np.newaxis] <= self.targets[missed]
+            first = np.argmax(reached, axis=0)
+            found = reached[first, np.arange(len(first))]
+            hits = self.hits[missed]
+            hits[found] = self.evaluations + first[found] + 1
+            self.hits[missed] = hits
+        self.evaluations += len(values)
+        self.best_value = float(best[-1])
+        return values
+
+    def __call__(self, x: Union[List[float], np.ndarray]) -> float:
+        """Evaluate and count a single point.
+
+        Raises:
+            BudgetExhausted: If the budget is spent or the last target was reached
+        """
+        return float(self.evaluate_batch(np.asarray(x, dtype=np.float64).reshape(1, -1))[0])
+
+    def random_point(self, rng: np.random.Generator) -> np.ndarray:
+        """Uniformly random point of the search box, e.g. to restart from."""
+        return rng.uniform(self.bounds[:, 0], self.bounds[:, 1])
+
+
+Optimizer = Callable[[Problem, np.random.Generator], None]
+
+
+class RandomSearch:
+    """Baseline: uniform random sampling in batches."""
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+
+    def __call__(self, problem: Problem, rng: np.random.Generator):
+        while True:
+            problem.evaluate_batch(rng.uniform(problem.bounds[:, 0], problem.bounds[:, 1],
+                                               size=(self.batch_size, problem.dim)))
+
+
+# Local methods of scipy.optimize.minimize that accept bounds
+_BOUNDED_METHODS = {"nelder-mead", "powell", "l-bfgs-b", "tnc", "slsqp", "trust-constr", "cobyla", "cobyqa"}
+
+
+class ScipyMinimize:
+    """scipy.optimize.minimize with independent uniform restarts until the run ends.
+
+    Gradient-based methods estimate derivatives by finite differences, whose
+    evaluations are counted like any other.
+    """
+
+    def __init__(self, method: str = "L-BFGS-B", **options):
+        """Initialize the adapter.
+
+        Args:
+            method: Method name passed to scipy.optimize.minimize
+            **options: Passed as the options dict of minimize
+        """
+        self.method = method
+        self.options = options
+
+    def __call__(self, problem: Problem, rng: np.random.Generator):
+        from scipy.optimize import minimize
+
+        bounds = problem.bounds if self.method.lower() in _BOUNDED_METHODS else None
+        x0 = problem.x0
+        while True:
+            used = problem.evaluations
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                minimize(problem, x0, method=self.method, bounds=bounds, options=self.options)
+            if problem.evaluations == used:
+                return
+            x0 = problem.random_point(rng)
+
+    def __repr__(self) -> str:
+        return f"ScipyMinimize({self.method!r})"
+
+
+class ScipyGlobal:
+    """A global optimizer of scipy.optimize, e.g. differential_evolution, restarted until the run ends."""
+
+    def __init__(self, method: str = "differential_evolution", **options):
+        """Initialize the adapter.
+
+        Args:
+            method: Name of the scipy.optimize function, which takes
+                (func, bounds, ...) and a seed, e.g. 'differential_evolution'
+                or 'dual_annealing'
+            **options: Passed as keyword arguments to the method
+        """
+        self.method = method
+        self.options = options
+
+    def __call__(self, problem: Problem, rng: np.random.Generator):
+        import scipy.optimize
+
+        method = getattr(scipy.optimize, self.method)
+        while True:
+            used = problem.evaluations
+            child = np.random.default_rng(rng.integers(2**63))
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                try:
+                    method(problem, problem.bounds, rng=child, **self.options)
+                except TypeError:  # SciPy < 1.15
+                    method(problem, problem.bounds, seed=child, **self.options)
+            if problem.evaluations == used:
+                return
+
+    def __repr__(self) -> str:
+        return f"ScipyGlobal({self.method!r})"
+
+
+class RunRecord(NamedTuple):
+    """Outcome of one run.
+
+    Attributes:
+        optimizer: Name of the optimizer
+        function: Name of the function
+        dim: Dimension
+        seed: Seed of the run
+        budget: Evaluation budget
+        evaluations: Evaluations used
+        f_opt: Reference minimum, see reference_minimum
+        best_value: Best value found
+        precisions: Target precisions above f_opt
+        hits: Evaluations to reach each target, inf where not reached
+        elapsed: Wall time of the run in seconds
+    """
+    optimizer: str
+    function: str
+    dim: int
+    seed: int
+    budget: int
+    evaluations: int
+    f_opt: float
+    best_value: float
+    precisions: np.ndarray
+    hits: np.ndarray
+    elapsed: float
+
+
+def run_single(optimizer_name: str, optimizer: Optimizer, function: str, dim: int, seed: int,
+               budget_per_dim: int = 1000, precisions: np.ndarray = DEFAULT_PRECISIONS,
+               bounds_policy: str = "penalty", stop_at_target: bool = True) -> RunRecord:
+    """Run one optimizer once on one function.
+
+    Args:
+        optimizer_name: Name recorded for the optimizer
+        optimizer: Callable optimizer(problem, rng)
+        function: Registry name of the function
+        dim: Dimension
+        seed: Seed of the starting point and of the optimizer's generator
+        budget_per_dim: Evaluation budget per dimension (default: 1000)
+        precisions: Target precisions above the global minimum (default: DEFAULT_PRECISIONS)
+        bounds_policy: Bounds policy of the function; points outside the box
+            are penalized by default (default: 'penalty')
+        stop_at_target: End the run when the last target is reached (default: True)
+
+    Returns:
+        RunRecord: Outcome of the run
+
+    Raises:
+        ValueError: If the function has no valid reference minimum at dim
+    """
+    func = get_function(function, dim=dim, bounds_policy=bounds_policy)
+    precisions = np.asarray(precisions, dtype=np.float64)
+    problem = Problem(func, budget_per_dim * func.dim, precisions, seed, stop_at_target)
+    rng = np.random.default_rng([seed, 1])
+    start = time.perf_counter()
+    try:
+        optimizer(problem, rng)
+    except BudgetExhausted:
+        pass
+    return RunRecord(optimizer_name, function, func.dim, seed, problem.budget, problem.evaluations,
+                     problem.f_opt, problem.best_value, precisions, problem.hits,
+                     time.perf_counter() - start)
+
+
+def _run_task(args: tuple) -> RunRecord:
+    return run_single(*args[:5], **args[5])
+
+
+def run_experiment(optimizers: Dict[str, Optimizer], functions: Sequence[str], dims: Sequence[int],
+                   seeds: Iterable[int] = range(5), processes: Optional[int] = None,
+                   **options) -> List[RunRecord]:
+    """Run every optimizer on every (function, dim, seed) combination.
+
+    Fixed-dimension functions only run at their own dimension. Function
+    and dim pairs without a valid reference minimum (see reference_minimum)
+    are skipped with a warning.
+
+    Args:
+        optimizers: Optimizers by name
+        functions: Registry names of the functions
+        dims: Dimensions
+        seeds: Seeds, one run per seed (default: range(5))
+        processes: Worker processes; 1 runs in the calling process
+            (default: os.cpu_count())
+        **options: Passed to run_single, e.g. budget_per_dim or precisions
+
+    Returns:
+        List[RunRecord]: One record per run, in matrix order
+    """
+    seeds = list(seeds)
+    tasks = []
+    for function in functions:
+        for dim in dims:
+            try:
+                func = get_function(function, dim=dim)
+            except ValueError:  # Fixed-dimension function
+                continue
+            try:
+                reference_minimum(func)
+            except ValueError as error:
+                warnings.warn(f"Skipping {function} at dim={dim}: {error}")
+                continue
+            for name, optimizer in optimizers.items():
+                tasks.extend((name, optimizer, function, dim, seed, options) for seed in seeds)
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) <= 1:
+        return [_run_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_run_task, tasks))
+
+
+def _target_index(record: RunRecord, precision: float) -> int:
+    matches = np.flatnonzero(np.isclose(record.precisions, precision, rtol=1e-9, atol=0))
+    if not len(matches):
+        raise ValueError(f"Precision {precision} is not among the recorded targets")
+    return int(matches[0])
+
+
+def expected_running_time(records: Sequence[RunRecord],
+                          precision: float = 1e-8) -> Dict[Tuple[str, str, int], float]:
+    """ERT to reach a target precision, per (optimizer, function, dim).
+
+    Args:
+        records: Run records
+        precision: Target precision, one of the recorded precisions (default: 1e-8)
+
+    Returns:
+        Dict[Tuple[str, str, int], float]: ERT in evaluations, inf if no run succeeded
+
+    Raises:
+        ValueError: If precision wasn't recorded
+    """
+    spent: Dict[Tuple[str, str, int], float] = {}
+    successes: Dict[Tuple[str, str, int], int] = {}
+    for record in records:
+        key = (record.optimizer, record.function, record.dim)
+        hit = record.hits[_target_index(record, precision)]
+        spent[key] = spent.get(key, 0.0) + (hit if np.isfinite(hit) else record.evaluations)
+        successes[key] = successes.get(key, 0) + bool(np.isfinite(hit))
+    return {key: float(spent[key] / successes[key]) if successes[key] else np.inf for key in spent}
+
+
+def ecdf(records: Sequence[RunRecord],
+         budgets: Optional[np.ndarray] = None) -> Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]]:
+    """Runtime ECDF per (optimizer, dim), aggregated over functions, runs and targets.
+
+    Args:
+        records: Run records
+        budgets: Budgets in evaluations per dimension at which the ECDF is
+            evaluated (default: 50 log-spaced values from 1 to the largest budget)
+
+    Returns:
+        Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]]: (budgets, fraction
+        of (run, target) pairs reached within each budget)
+    """
+    if budgets is None:
+        largest = max((record.budget / record.dim for record in records), default=1)
+        budgets = np.logspace(0, np.log10(max(largest, 1)), 50)
+    budgets = np.asarray(budgets, dtype=np.float64)
+
+    hits: Dict[Tuple[str, int], List[np.ndarray]] = {}
+    for record in records:
+        hits.setdefault((record.optimizer, record.dim), []).append(record.hits / record.dim)
+    curves = {}
+    for key, runs in hits.items():
+        runtimes = np.sort(np.concatenate(runs))
+        curves[key] = (budgets, np.searchsorted(runtimes, budgets, side="right") / len(runtimes))
+    return curves
+
+
+def summarize(records: Sequence[RunRecord], precisions: Sequence[float] = (1e1, 1e-1, 1e-3, 1e-5, 1e-8)) -> List[dict]:
+    """Table of ERTs and success rates per (optimizer, function, dim).
+
+    Args:
+        records: Run records
+        precisions: Target precisions reported (default: 1e1 to 1e-8)
+
+    Returns:
+        List[dict]: One row per group with keys optimizer, function, dim, runs,
+        successes (at the smallest precision), median_precision of the best
+        values, and ert_<precision> for each precision
+    """
+    groups: Dict[Tuple[str, str, int], List[RunRecord]] = {}
+    for record in records:
+        groups.setdefault((record.optimizer, record.function, record.dim), []).append(record)
+    erts = {precision: expected_running_time(records, precision) for precision in precisions}
+
+    rows = []
+    for key, runs in groups.items():
+        last = _target_index(runs[0], min(precisions))
+        row = {
+            "optimizer": key[0], "function": key[1], "dim": key[2], "runs": len(runs),
+            "successes": sum(bool(np.isfinite(run.hits[last])) for run in runs),
+            "median_precision": float(np.median([run.best_value - run.f_opt for run in runs])),
+        }
+        for precision in precisions:
+            row[f"ert_{precision:g}"] = erts[precision][key]
+        rows.append(row)
+    return rows
@@ -0,0 +1,255 @@
+"""
+Incremental re-evaluation for moves that change a few coordinates.
+
+Functions that support it decompose into terms: running sums and running
+products over term contributions, combined into the value at the end (see
+BenchmarkFunction._incremental_terms). The evaluator caches every term
+contribution. Changing k coordinates recomputes only the terms that depend
+on them, and adjusts the running sums and products by the difference, in
+O(k) instead of O(dim).
+
+Products are kept as a count of zero factors and the product of the
+non-zero factors, stored as a normalized mantissa and a binary exponent.
+Dividing out a factor is then exact for zeros, and long products of small
+factors (Griewank) or large ones (Schubert) cannot underflow or overflow on
+the way. Rounding drift is bounded by recomputing the aggregates from the
+cached terms once as many coordinates have changed as there are terms,
+which keeps the amortized cost of a move O(k).
+"""
+
+import math
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .base import BenchmarkFunction
+
+# Mantissas multiplied at once before renormalizing; 0.5**512 is a normal float64
+_PRODUCT_CHUNK = 512
+
+# Products of at most this many factors are computed in plain Python
+_SHORT_PRODUCT = 64
+
+# Methods the incremental formula comes from, overridden consistently with _evaluate
+TERM_METHODS = ("_separable", "_separable_terms", "_coordinate_terms", "_combine_terms",
+                "_affected_terms", "_incremental_terms", "_combine_incremental")
+
+
+def _scaled_product(factors: np.ndarray) -> Tuple[int, float, int]:
+    """Product of factors as (zero count, mantissa, exponent) of the non-zero part."""
+    if len(factors) <= _SHORT_PRODUCT:
+        # Moves touch a handful of terms, where plain Python beats NumPy calls
+        zeros, mantissa, exponent = 0, 1.0, 0
+        for factor in factors.tolist():
+            if factor == 0:
+                zeros += 1
+            else:
+                factor_mantissa, factor_exponent = math.frexp(factor)
+                mantissa *= factor_mantissa
+                exponent += factor_exponent
+        mantissa, shift = math.frexp(mantissa)
+        return zeros, mantissa, exponent + shift
+
+    factors = np.asarray(factors, dtype=np.float64)
+    nonzero = factors[factors != 0]
+    mantissas, exponents = np.frexp(nonzero)
+    mantissa, exponent = 1.0, int(exponents.sum())
+    for start in range(0, len(mantissas), _PRODUCT_CHUNK):
+        mantissa, shift = math.frexp(mantissa * float(np.prod(mantissas[start:start + _PRODUCT_CHUNK])))
+        exponent += shift
+    return len(factors) - len(nonzero), mantissa, exponent
+
+
+class _Aggregates:
+    """Running sums and scaled products over cached term contributions."""
+
+    __slots__ = ("sums", "zeros", "mantissas", "exponents")
+
+    def __init__(self, sums: np.ndarray, prods: np.ndarray):
+        self.sums = np.sum(sums, axis=1, dtype=np.float64)
+        scaled = [_scaled_product(row) for row in prods]
+        self.zeros = [zeros for zeros, _, _ in scaled]
+        self.mantissas = [mantissa for _, mantissa, _ in scaled]
+        self.exponents = [exponent for _, _, exponent in scaled]
+
+    def replaced(self, old: Tuple[np.ndarray, np.ndarray], new: Tuple[np.ndarray, np.ndarray]) -> "_Aggregates":
+        """Aggregates after replacing the old term contributions by new ones."""
+        result = _Aggregates.__new__(_Aggregates)
+        result.sums = self.sums + (new[0].sum(axis=1, dtype=np.float64) - old[0].sum(axis=1, dtype=np.float64))
+        result.zeros, result.mantissas, result.exponents = [], [], []
+        for q in range(len(self.zeros)):
+            zeros_old, mantissa_old, exponent_old = _scaled_product(old[1][q])
+            zeros_new, mantissa_new, exponent_new = _scaled_product(new[1][q])
+            mantissa, shift = math.frexp(self.mantissas[q] * mantissa_new / mantissa_old)
+            result.zeros.append(self.zeros[q] + zeros_new - zeros_old)
+            result.mantissas.append(mantissa)
+            result.exponents.append(self.exponents[q] + exponent_new - exponent_old + shift)
+        return result
+
+    def products(self) -> np.ndarray:
+        """Current products, with float64 overflow and underflow only at the end."""
+        products = np.zeros(len(self.zeros))
+        if not self.zeros:
+            return products
+        with np.errstate(over="ignore"):
+            for q, (zeros, mantissa, exponent) in enumerate(zip(self.zeros, self.mantissas, self.exponents)):
+                if not zeros:
+                    products[q] = np.ldexp(mantissa, exponent)
+        return products
+
+
+class IncrementalEvaluator:
+    """Stateful evaluation of one point under moves of a few coordinates.
+
+    Supported by Ackley, Griewank, Rastrigin, Rosenbrock, Schubert and
+    Schwefel. Moves that stay inside the bounds cost O(k) for k changed
+    coordinates. While coordinates are outside the bounds, the value is
+    computed by a full evaluation under the function's bounds policy.
+
+    Example:
+        >>> state = Rastrigin(dim=10000).incremental(x)
+        >>> candidate = state.propose([17], [0.5])  # value after the move, state unchanged
+        >>> if candidate < state.value:
+        ...     state.update([17], [0.5])
+    """
+
+    def __init__(self, func: "BenchmarkFunction", x: Union[List[float], np.ndarray]):
+        """Initialize the evaluator at a starting point.
+
+        Args:
+            func: Benchmark function implementing _incremental_terms
+            x: Starting point with shape (dim,)
+
+        Raises:
+            NotImplementedError: If the function doesn't support incremental evaluation
+            ValueError: If x has the wrong shape, or is outside the bounds
+                under the 'raise' policy
+        """
+        if not func._follows_formula(*TERM_METHODS):
+            raise NotImplementedError(f"{type(func).__name__} overrides the formula of the terms it inherits, "
+                                      "so it has no incremental evaluation")
+        self.func = func
+        self._x = func._as_point(x).copy()
+        bounds = func._bounds_array.astype(func.dtype, copy=False)
+        self._lower, self._upper = bounds[:, 0], bounds[:, 1]
+        self._outside_mask = self._out_of_bounds(self._x, slice(None))
+        self._outside = int(np.count_nonzero(self._outside_mask))
+        if self._outside and func.bounds_policy == "raise":
+            raise ValueError(f"Point is outside the bounds of {func.name}")
+
+        all_terms = func._affected_terms(np.arange(func.dim))
+        self._sums, self._prods = func._incremental_terms(self._x, all_terms)
+        self._aggregates = _Aggregates(self._sums, self._prods)
+        self._n_terms = len(all_terms)
+        self._changed = 0
+        self._value = self._combine(self._aggregates, self._outside)
+
+    @property
+    def x(self) -> np.ndarray:
+        """Current point, a read-only view."""
+        view = self._x.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def value(self) -> float:
+        """Function value at the current point."""
+        return self._value
+
+    def _out_of_bounds(self, values: np.ndarray, idx) -> np.ndarray:
+        return ~((values >= self._lower[idx]) & (values <= self._upper[idx]))
+
+    def _combine(self, aggregates: _Aggregates, outside: int, record: bool = True) -> float:
+        """Value from the aggregates, or a full evaluation of _x when outside the bounds.
+
+        With metrics enabled, the value counts as one evaluation of _x and
+        runs the hooks, unless record is False.
+        """
+        if outside and self.func.bounds_policy != "trusted":
+            return self.func(self._x)
+        metrics = self.func._metrics
+        if metrics is None or not record:
+            value = self.func._combine_incremental(aggregates.sums, aggregates.products())
+            return float(np.asarray(value, dtype=self.func.dtype))
+
+        def run(X: np.ndarray, with_grad: bool) -> np.ndarray:
+            value = self.func._combine_incremental(aggregates.sums, aggregates.products())
+            return np.asarray(value, dtype=self.func.dtype).reshape(1)
+
+        return float(metrics.observe(self.func, self._x[np.newaxis, :].copy(), False, run)[0])
+
+    def _move(self, idx: Union[List[int], np.ndarray], values: Union[List[float], np.ndarray]):
+        """Terms, aggregates and value after a move, without committing it."""
+        idx = np.asarray(idx, dtype=np.intp).reshape(-1)
+        values = np.asarray(values, dtype=self.func.dtype).reshape(-1)
+        if len(idx) != len(values):
+            raise ValueError(f"Got {len(idx)} indices but {len(values)} values")
+        indices = idx.tolist()
+        if len(indices) and (min(indices) < 0 or max(indices) >= self.func.dim or len(set(indices)) != len(indices)):
+            raise ValueError(f"Indices must be distinct and in [0, {self.func.dim})")
+        outside_mask = self._out_of_bounds(values, idx)
+        n_outside = int(np.count_nonzero(outside_mask))
+        if n_outside and self.func.bounds_policy == "raise":
+            raise ValueError(f"Point is outside the bounds of {self.func.name}")
+
+        old_values = self._x[idx]
+        outside = self._outside + n_outside - int(np.count_nonzero(self._outside_mask[idx]))
+        terms = self.func._affected_terms(idx)
+        self._x[idx] = values
+        try:
+            new = self.func._incremental_terms(self._x, terms)
+            old = (self._sums[:, terms], self._prods[:, terms])
+            aggregates = self._aggregates.replaced(old, new)
+            value = self._combine(aggregates, outside)
+        finally:
+            self._x[idx] = old_values
+        return idx, values, terms, new, aggregates, outside_mask, outside, value
+
+    def propose(self, idx: Union[List[int], np.ndarray], values: Union[List[float], np.ndarray]) -> float:
+        """Value the function would take after a move, leaving the state unchanged.
+
+        Args:
+            idx: Indices of the coordinates to change
+            values: Their new values
+
+        Returns:
+            float: Function value after the move
+
+        Raises:
+            ValueError: If indices repeat or are out of range, or values are
+                outside the bounds under the 'raise' policy
+        """
+        return self._move(idx, values)[-1]
+
+    def update(self, idx: Union[List[int], np.ndarray], values: Union[List[float], np.ndarray]) -> float:
+        """Change some coordinates of the current point.
+
+        Args:
+            idx: Indices of the coordinates to change
+            values: Their new values
+
+        Returns:
+            float: Function value at the new point
+
+        Raises:
+            ValueError: If indices repeat or are out of range, or values are
+                outside the bounds under the 'raise' policy
+        """
+        idx, values, terms, new, aggregates, outside_mask, outside, value = self._move(idx, values)
+        self._x[idx] = values
+        self._outside_mask[idx] = outside_mask
+        self._sums[:, terms], self._prods[:, terms] = new
+        self._outside = outside
+        self._changed += len(idx)
+        if self._changed >= self._n_terms:
+            # Drop the rounding drift of the running sums and products
+            aggregates = _Aggregates(self._sums, self._prods)
+            value = self._combine(aggregates, outside, record=False)
+            self._changed = 0
+        self._aggregates = aggregates
+        self._value = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"IncrementalEvaluator({self.func.name}, dim={self.func.dim}, value={self._value!r})"
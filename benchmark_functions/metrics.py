@@ -0,0 +1,141 @@
+"""
+Opt-in evaluation metrics and observer hooks for benchmark functions.
+"""
+
+import threading
+import time
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Upper edges of the latency histogram buckets in seconds, 1us to 10s in
+# half-decade steps; the last bucket collects everything slower
+LATENCY_BUCKETS = tuple(10.0 ** (e / 2) for e in range(-12, 3))
+
+PreHook = Callable[[object, np.ndarray], None]
+PostHook = Callable[[object, np.ndarray, np.ndarray, float], None]
+
+
+class EvaluationMetrics:
+    """Counters, latency histogram and hooks for one benchmark function.
+
+    Every public evaluation (__call__, evaluate_batch, evaluate_threaded,
+    value_and_grad, ...) is recorded as one call covering len(X) points.
+    Counters are updated under a lock, so snapshot() can be polled from a
+    monitoring thread.
+
+    Pre hooks are called as hook(func, X) before an evaluation, post hooks
+    as hook(func, X, values, elapsed_seconds) after it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pre_hooks: List[PreHook] = []
+        self.post_hooks: List[PostHook] = []
+        self.reset()
+
+    def reset(self):
+        """Zero all counters, keeping the registered hooks."""
+        with self._lock:
+            self.calls = 0
+            self.points = 0
+            self.gradient_calls = 0
+            self.violations = 0
+            self.total_time = 0.0
+            self.max_latency = 0.0
+            self._histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def add_hook(self, pre: Optional[PreHook] = None, post: Optional[PostHook] = None):
+        """Register hooks called before and/or after every evaluation.
+
+        Args:
+            pre: Called as pre(func, X) before the evaluation
+            post: Called as post(func, X, values, elapsed) after the evaluation
+        """
+        if pre is not None:
+            self.pre_hooks.append(pre)
+        if post is not None:
+            self.post_hooks.append(post)
+
+    def record(self, n_points: int, elapsed: float, with_grad: bool = False):
+        """Record one evaluation call.
+
+        Args:
+            n_points: Number of points evaluated
+            elapsed: Wall time of the call in seconds
+            with_grad: Whether gradients were computed
+        """
+        bucket = bisect_right(LATENCY_BUCKETS, elapsed)
+        with self._lock:
+            self.calls += 1
+            self.points += n_points
+            self.gradient_calls += with_grad
+            self.total_time += elapsed
+            if elapsed > self.max_latency:
+                self.max_latency = elapsed
+            self._histogram[bucket] += 1
+
+    def record_violations(self, count: int):
+        """Record points found outside the function bounds."""
+        with self._lock:
+            self.violations += count
+
+    def observe(self, func, X: np.ndarray, with_grad: bool, run: Callable):
+        """Run an evaluation with hooks and timing.
+
+        Args:
+            func: The benchmark function being evaluated
+            X: Batch of input points with shape (n, dim)
+            with_grad: Whether gradients are computed
+            run: Callable run(X, with_grad) performing the evaluation
+
+        Returns:
+            The result of run
+        """
+        for hook in self.pre_hooks:
+            hook(func, X)
+        start = time.perf_counter()
+        result = run(X, with_grad)
+        elapsed = time.perf_counter() - start
+        self.record(len(X), elapsed, with_grad)
+        if self.post_hooks:
+            values = result[0] if with_grad else result
+            for hook in self.post_hooks:
+                hook(func, X, values, elapsed)
+        return result
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return a consistent copy of the counters.
+
+        Returns:
+            Dict[str, object]: calls, points, gradient_calls, violations,
+            total_time, mean_latency, max_latency, and latency_histogram as a
+            list of (bucket upper edge in seconds, count) pairs with an
+            infinite last edge
+        """
+        with self._lock:
+            calls = self.calls
+            snapshot = {
+                "calls": calls,
+                "points": self.points,
+                "gradient_calls": self.gradient_calls,
+                "violations": self.violations,
+                "total_time": self.total_time,
+                "mean_latency": self.total_time / calls if calls else 0.0,
+                "max_latency": self.max_latency,
+                "latency_histogram": list(zip(LATENCY_BUCKETS + (float("inf"),), self._histogram)),
+            }
+        return snapshot
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"EvaluationMetrics(calls={self.calls}, points={self.points}, violations={self.violations})"
@@ -0,0 +1,89 @@
+"""
+Out-of-core evaluation of point files stored as .npy.
+"""
+
+import json
+import os
+from typing import Callable, Optional
+
+import numpy as np
+
+from .base import BenchmarkFunction
+from .streaming import rows_for_budget
+
+# Memory budget per chunk when neither chunk_rows nor memory_budget is given
+DEFAULT_MEMORY_BUDGET = 64 * 2**20
+
+
+def _write_checkpoint(path: str, state: dict):
+    """Atomically replace the checkpoint file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def evaluate_npy(func: BenchmarkFunction, input_path: str, output_path: str,
+                 chunk_rows: Optional[int] = None, memory_budget: Optional[int] = None,
+                 checkpoint_path: Optional[str] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> np.ndarray:
+    """Evaluate a function over an (n, dim) .npy file chunk by chunk.
+
+    The input is memory-mapped read-only and values are written into a
+    memory-mapped (n,) .npy output of dtype func.dtype, so neither array is loaded fully
+    into memory. After every chunk the output is flushed and the number of
+    completed rows is recorded in a JSON checkpoint; calling this again with
+    the same paths resumes after the last completed chunk. The checkpoint is
+    removed once the whole file has been evaluated.
+
+    Args:
+        func: Benchmark function to evaluate
+        input_path: Path of the input .npy file with shape (n, func.dim)
+        output_path: Path of the output .npy file
+        chunk_rows: Rows per chunk (default: derived from memory_budget)
+        memory_budget: Approximate bytes per chunk evaluation (default: 64 MiB)
+        checkpoint_path: Path of the checkpoint file (default: output_path + '.ckpt.json')
+        progress: Called as progress(completed_rows, n) after every chunk
+
+    Returns:
+        np.ndarray: The output values, memory-mapped read-only
+
+    Raises:
+        ValueError: If the input doesn't have shape (n, func.dim)
+    """
+    X = np.load(input_path, mmap_mode="r")
+    if X.ndim != 2 or X.shape[1] != func.dim:
+        raise ValueError(f"Input shape {X.shape} doesn't match (n, {func.dim})")
+    n = X.shape[0]
+
+    if chunk_rows is None:
+        chunk_rows = rows_for_budget(func.dim, memory_budget or DEFAULT_MEMORY_BUDGET, X.itemsize)
+    if checkpoint_path is None:
+        checkpoint_path = output_path + ".ckpt.json"
+
+    # Resume only if the checkpoint describes this very job
+    job = {"input": os.path.abspath(input_path), "n": n, "dim": func.dim, "function": type(func).__name__}
+    completed = 0
+    if os.path.exists(checkpoint_path) and os.path.exists(output_path):
+        with open(checkpoint_path) as f:
+            state = json.load(f)
+        if all(state.get(key) == value for key, value in job.items()):
+            completed = state["completed_rows"]
+
+    if completed:
+        out = np.lib.format.open_memmap(output_path, mode="r+")
+    else:
+        out = np.lib.format.open_memmap(output_path, mode="w+", dtype=func.dtype, shape=(n,))
+        _write_checkpoint(checkpoint_path, dict(job, completed_rows=0))
+
+    for start in range(completed, n, chunk_rows):
+        stop = min(start + chunk_rows, n)
+        out[start:stop] = func.evaluate_batch(X[start:stop])
+        out.flush()
+        _write_checkpoint(checkpoint_path, dict(job, completed_rows=stop))
+        if progress is not None:
+            progress(stop, n)
+
+    del out
+    os.remove(checkpoint_path)
+    return np.load(output_path, mmap_mode="r")
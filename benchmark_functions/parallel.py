@@ -0,0 +1,177 @@
+"""
+Process-pool evaluation of large batches through shared memory.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .base import BenchmarkFunction
+
+# Function evaluated by a worker process, installed once by _init_worker so
+# that it is not pickled again for every chunk
+_worker_func: Optional[BenchmarkFunction] = None
+
+
+def _init_worker(func: BenchmarkFunction):
+    global _worker_func
+    _worker_func = func
+
+
+def _evaluate_chunk(in_name: str, out_name: str, shape: Tuple[int, int], dtype: str, start: int, stop: int):
+    """Evaluate rows [start, stop) of the shared input into the shared output."""
+    in_shm = shared_memory.SharedMemory(name=in_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    try:
+        X = np.ndarray(shape, dtype=dtype, buffer=in_shm.buf)
+        out = np.ndarray((shape[0],), dtype=dtype, buffer=out_shm.buf)
+        out[start:stop] = _worker_func.evaluate_batch(X[start:stop])
+        del X, out
+    finally:
+        in_shm.close()
+        out_shm.close()
+
+
+class ParallelEvaluator:
+    """Evaluate a benchmark function over large batches with a process pool.
+
+    The batch is copied once into a shared memory block, split into row
+    chunks and evaluated by worker processes that write directly into a
+    shared output block, so no arrays are pickled. Workers and shared
+    buffers are kept alive between calls; close the evaluator (or use it
+    as a context manager) to release them.
+
+    The function is sent to each worker once when the pool starts, so later
+    changes to its settings are not seen by the workers. The shared blocks
+    hold inputs and values in the function dtype.
+
+    Example:
+        >>> with ParallelEvaluator(Rastrigin(dim=10), n_workers=4) as evaluator:
+        ...     values = evaluator(X)
+    """
+
+    def __init__(self, func: BenchmarkFunction, n_workers: Optional[int] = None,
+                 chunks_per_worker: int = 4, min_parallel_size: int = 10000):
+        """Initialize the evaluator.
+
+        Args:
+            func: Benchmark function to evaluate
+            n_workers: Number of worker processes (default: os.cpu_count())
+            chunks_per_worker: Number of row chunks per worker, for load
+                balancing (default: 4)
+            min_parallel_size: Batches with fewer rows are evaluated in the
+                calling process (default: 10000)
+        """
+        self.func = func
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.min_parallel_size = min_parallel_size
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_shm: Optional[shared_memory.SharedMemory] = None
+        self._out_shm: Optional[shared_memory.SharedMemory] = None
+
+    def __call__(self, X: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Evaluate the function at every row of X.
+
+        Args:
+            X: Batch of input points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Function values with shape (n,), in the order of the rows of X
+        """
+        X = self.func._as_batch(X)
+
+        n = len(X)
+        if n < self.min_parallel_size or self.n_workers == 1:
+            return self.func.evaluate_batch(X)
+
+        self._ensure_buffers(X.nbytes, n * X.itemsize)
+        shared_X = np.ndarray(X.shape, dtype=X.dtype, buffer=self._in_shm.buf)
+        shared_X[:] = X
+
+        n_chunks = min(n, self.n_workers * self.chunks_per_worker)
+        edges = np.linspace(0, n, n_chunks + 1).astype(int)
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_evaluate_chunk, self._in_shm.name, self._out_shm.name,
+                            X.shape, X.dtype.str, start, stop)
+            for start, stop in zip(edges[:-1], edges[1:])
+        ]
+        for future in futures:
+            future.result()
+
+        values = np.ndarray((n,), dtype=X.dtype, buffer=self._out_shm.buf).copy()
+        del shared_X
+        return values
+
+    evaluate = __call__
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker, initargs=(self.func,)
+            )
+        return self._executor
+
+    def _ensure_buffers(self, in_bytes: int, out_bytes: int):
+        """Grow the shared input/output blocks if they are too small."""
+        if self._in_shm is None or self._in_shm.size < in_bytes:
+            self._release(self._in_shm)
+            self._in_shm = shared_memory.SharedMemory(create=True, size=in_bytes)
+        if self._out_shm is None or self._out_shm.size < out_bytes:
+            self._release(self._out_shm)
+            self._out_shm = shared_memory.SharedMemory(create=True, size=out_bytes)
+
+    @staticmethod
+    def _release(shm: Optional[shared_memory.SharedMemory]):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def speedup(self, X: Union[List[List[float]], np.ndarray], repeat: int = 3) -> Dict[str, float]:
+        """Measure the speedup of parallel over serial evaluation on X.
+
+        The pool is warmed up first so worker start-up is not counted.
+
+        Args:
+            X: Batch of input points with shape (n, dim)
+            repeat: Number of timing repetitions, the best is kept (default: 3)
+
+        Returns:
+            Dict[str, float]: serial and parallel wall times in seconds and their ratio
+        """
+        X = self.func._as_batch(X)
+        self(X)
+
+        serial = min(self._time(self.func.evaluate_batch, X) for _ in range(repeat))
+        parallel = min(self._time(self, X) for _ in range(repeat))
+        return {"serial_s": serial, "parallel_s": parallel, "speedup": serial / parallel}
+
+    @staticmethod
+    def _time(fn, X: np.ndarray) -> float:
+        start = time.perf_counter()
+        fn(X)
+        return time.perf_counter() - start
+
+    def close(self):
+        """Shut down the worker processes and free the shared buffers."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._release(self._in_shm)
+        self._release(self._out_shm)
+        self._in_shm = self._out_shm = None
+
+    def __enter__(self) -> "ParallelEvaluator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ParallelEvaluator(func={self.func!r}, n_workers={self.n_workers})"
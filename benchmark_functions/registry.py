@@ -0,0 +1,171 @@
+"""
+Name-based registry of benchmark functions.
+
+Built-in functions are described by static metadata and their modules are
+only imported when a function is instantiated. Third-party packages can add
+functions through the 'benchmark_functions' entry point group, e.g. in
+their pyproject.toml:
+
+    [project.entry-points.benchmark_functions]
+    my_function = "my_package.functions:MyFunction"
+
+Entry points are discovered on the first lookup of an unknown name or the
+first listing, and are not imported until used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+if TYPE_CHECKING:  # Listing metadata doesn't need NumPy
+    from .base import BenchmarkFunction
+
+ENTRY_POINT_GROUP = "benchmark_functions"
+
+
+class FunctionInfo(NamedTuple):
+    """Metadata of a registered function.
+
+    Attributes:
+        name: Registry name
+        target: The class, or its 'module:attribute' import path
+        dim: Fixed dimension, None if the dimension is configurable
+        bounds: (min, max) shared by every coordinate, None if unknown
+        minimum: Known global minimum value, None if unknown
+    """
+    name: str
+    target: Union[str, Type["BenchmarkFunction"]]
+    dim: Optional[int] = None
+    bounds: Optional[Tuple[float, float]] = None
+    minimum: Optional[float] = None
+
+
+_BUILTINS = [
+    FunctionInfo("ackley", "benchmark_functions.ackley:Ackley", None, (-32.768, 32.768), 0.0),
+    FunctionInfo("forrester", "benchmark_functions.forrester:Forrester", 1, (0.0, 1.0), -6.0207),
+    FunctionInfo("gramacy_lee", "benchmark_functions.gramacy_lee:GramacyLee", 1, (0.5, 2.5), -0.869011134989500),
+    FunctionInfo("griewank", "benchmark_functions.griewank:Griewank", None, (-600.0, 600.0), 0.0),
+    FunctionInfo("rastrigin", "benchmark_functions.rastrigin:Rastrigin", None, (-5.12, 5.12), 0.0),
+    FunctionInfo("rosenbrock", "benchmark_functions.rosenbrock:Rosenbrock", None, (-2.048, 2.048), 0.0),
+    FunctionInfo("schubert", "benchmark_functions.schubert:Schubert", None, (-10.0, 10.0), -186.7309),
+    FunctionInfo("schwefel", "benchmark_functions.schwefel:Schwefel", None, (-500.0, 500.0), 0.0),
+]
+
+_registry: Dict[str, FunctionInfo] = {}
+_entry_points_loaded = False
+
+
+def _key(name: str) -> str:
+    """Normalize a name so 'GramacyLee', 'gramacy-lee' and 'gramacy_lee' match."""
+    return name.lower().replace("_", "").replace("-", "").replace(" ", "")
+
+
+def register_function(name: str, target: Union[str, Type["BenchmarkFunction"]], dim: Optional[int] = None,
+                      bounds: Optional[Tuple[float, float]] = None, minimum: Optional[float] = None,
+                      replace: bool = False):
+    """Register a benchmark function under a name.
+
+    Args:
+        name: Registry name, matched case-insensitively and ignoring '_', '-' and spaces
+        target: BenchmarkFunction subclass, or its 'module:attribute' path to import lazily
+        dim: Fixed dimension, None if the constructor takes dim (default: None)
+        bounds: (min, max) shared by every coordinate, for listings (default: None)
+        minimum: Known global minimum value, for listings (default: None)
+        replace: Allow replacing an existing registration (default: False)
+
+    Raises:
+        ValueError: If the name is already registered and replace is False
+    """
+    key = _key(name)
+    if key in _registry and not replace:
+        raise ValueError(f"A function named '{name}' is already registered")
+    _registry[key] = FunctionInfo(name, target, dim, bounds, minimum)
+
+
+def _load_entry_points():
+    """Register the functions advertised by installed packages, once."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+    found = entry_points()
+    if hasattr(found, "select"):
+        found = found.select(group=ENTRY_POINT_GROUP)
+    else:  # Python < 3.10 returns a dict of groups
+        found = found.get(ENTRY_POINT_GROUP, [])
+    for entry_point in found:
+        if _key(entry_point.name) not in _registry:
+            register_function(entry_point.name, entry_point.value)
+
+
+def _resolve(info: FunctionInfo) -> Type["BenchmarkFunction"]:
+    if isinstance(info.target, str):
+        module, _, attribute = info.target.partition(":")
+        return getattr(importlib.import_module(module), attribute)
+    return info.target
+
+
+def get_function_class(name: str) -> Type["BenchmarkFunction"]:
+    """Import and return the class registered under a name.
+
+    Args:
+        name: Registry name
+
+    Returns:
+        Type[BenchmarkFunction]: The function class
+
+    Raises:
+        KeyError: If no function is registered under the name
+    """
+    key = _key(name)
+    if key not in _registry:
+        _load_entry_points()
+    if key not in _registry:
+        raise KeyError(f"Unknown function '{name}', available: {', '.join(list_function_names())}")
+    return _resolve(_registry[key])
+
+
+def get_function(name: str, **kwargs) -> "BenchmarkFunction":
+    """Instantiate a registered function by name.
+
+    Only the module of the requested function is imported.
+
+    Args:
+        name: Registry name, e.g. 'rastrigin' or 'GramacyLee'
+        **kwargs: Constructor arguments, e.g. dim=50 or bounds_policy='clip'.
+            dim may be passed to fixed-dimension functions if it matches.
+
+    Returns:
+        BenchmarkFunction: The new instance
+
+    Raises:
+        KeyError: If no function is registered under the name
+        ValueError: If dim doesn't match a fixed-dimension function
+    """
+    cls = get_function_class(name)
+    fixed_dim = _registry[_key(name)].dim
+    if fixed_dim is not None and "dim" in kwargs:
+        dim = kwargs.pop("dim")
+        if dim != fixed_dim:
+            raise ValueError(f"{name} is only defined for dim={fixed_dim}, got dim={dim}")
+    return cls(**kwargs)
+
+
+def list_function_names() -> List[str]:
+    """Names of all registered functions, sorted."""
+    _load_entry_points()
+    return sorted(info.name for info in _registry.values())
+
+
+def list_functions() -> List[FunctionInfo]:
+    """Metadata of all registered functions, sorted by name, without importing them.
+
+    Returns:
+        List[FunctionInfo]: One entry per function
+    """
+    _load_entry_points()
+    return sorted(_registry.values(), key=lambda info: info.name)
+
+
+for _info in _BUILTINS:
+    register_function(*_info)
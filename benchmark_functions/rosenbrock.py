@@ -3,8 +3,12 @@ Rosenbrock function implementation.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import Optional, Tuple
+from numpy.typing import DTypeLike
 from .base import BenchmarkFunction
+from .bounds import Bounds
+from .utils import SharedTerms
+from .workspace import BLOCKED_MIN_DIM, blocked_reduce
 
 class Rosenbrock(BenchmarkFunction):
     """Rosenbrock function.
@@ -19,31 +23,96 @@ class Rosenbrock(BenchmarkFunction):
         
     Global minimum:
         f(1,1,...,1) = 0
+        
+    Precision:
+        float32 evaluation (dtype=np.float32) over uniform samples of the bounds:
+        Relative error against float64 below 2e-6 (dim 2 to 100); values reach 1e5,
+        so the absolute error is up to about 2e-2 at dim 100.
     """
     
-    def __init__(self, dim: int = 2):
+    __slots__ = ()
+    
+    _jit_kernel = "rosenbrock"
+    
+    def __init__(self, dim: int = 2, bounds_policy: str = "raise", backend: Optional[str] = None,
+                 dtype: DTypeLike = np.float64):
         """Initialize the Rosenbrock function.
         
         Args:
             dim: Dimension of the function (default: 2)
+            bounds_policy: Out-of-bounds policy, see BenchmarkFunction (default: 'raise')
+            backend: Evaluation backend, see BenchmarkFunction (default: None)
+            dtype: Computation dtype, float32 or float64 (default: float64)
         """
-        bounds = [(-2.048, 2.048) for _ in range(dim)]
-        super().__init__(name="Rosenbrock", dim=dim, bounds=bounds)
+        bounds = Bounds.uniform(-2.048, 2.048, dim)
+        super().__init__(name="Rosenbrock", dim=dim, bounds=bounds, bounds_policy=bounds_policy, backend=backend,
+                         dtype=dtype)
         
-    def __call__(self, x: List[float]) -> float:
-        """Evaluate the Rosenbrock function at point x.
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate the Rosenbrock function on a batch of points.
         
         Args:
-            x: Input point
+            X: Input points with shape (n, dim)
             
         Returns:
-            float: Function value at point x
+            np.ndarray: Function values with shape (n,)
         """
-        x = np.asarray(x)
-        if not self.check_bounds(x):
-            raise ValueError(f"Input point {x} is outside the function bounds")
+        if self.dim >= BLOCKED_MIN_DIM:
+            return self._evaluate_blocked(X)
+        return np.sum(100 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+    
+    def _evaluate_blocked(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate in cache-sized column blocks without dim-sized temporaries."""
+        def terms(start: int, stop: int, buf: np.ndarray):
+            head = X[:, start:stop]
+            rest = self._workspace.buffer("rest", buf.shape, X.dtype)
+            np.square(head, out=buf)
+            np.subtract(X[:, start + 1:stop + 1], buf, out=buf)
+            np.square(buf, out=buf)
+            buf *= 100
+            np.subtract(1, head, out=rest)
+            np.square(rest, out=rest)
+            buf += rest
+        
+        return blocked_reduce(self._workspace, X, self.dim - 1, terms)
+    
+    def _evaluate_shared(self, terms: SharedTerms) -> np.ndarray:
+        X = terms.X
+        return np.sum(100 * (X[:, 1:] - terms.square[:, :-1])**2 + (1 - X[:, :-1])**2, axis=1)
+    
+    def _value_and_grad(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate the Rosenbrock function and its gradient on a batch of points.
+        
+        Args:
+            X: Input points with shape (n, dim)
             
-        return np.sum(100 * (x[1:] - x[:-1]**2)**2 + (1 - x[:-1])**2)
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: values with shape (n,) and gradients with shape (n, dim)
+        """
+        head = X[:, :-1]
+        t = X[:, 1:] - head**2
+        u = 1 - head
+        values = np.sum(100 * t**2 + u**2, axis=1)
+        
+        # Each term couples x_i and x_{i+1}
+        grads = np.zeros_like(X, dtype=values.dtype)
+        grads[:, :-1] = -400 * head * t - 2 * u
+        grads[:, 1:] += 200 * t
+        
+        return values, grads
+    
+    def _affected_terms(self, idx: np.ndarray) -> np.ndarray:
+        # Term i couples x_i and x_{i+1}, so x_j enters terms j - 1 and j
+        terms = np.unique(np.concatenate([idx - 1, idx]))
+        return terms[(terms >= 0) & (terms < self.dim - 1)]
+    
+    def _incremental_terms(self, x: np.ndarray, terms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        head = x[terms]
+        values = 100 * (x[terms + 1] - head**2)**2 + (1 - head)**2
+        return values[np.newaxis, :], np.empty((0, len(terms)), dtype=x.dtype)
+    
+    def _combine_incremental(self, sums: np.ndarray, prods: np.ndarray) -> float:
+        return sums[0]
     
     def get_global_minimum(self) -> Tuple[float, np.ndarray]:
         """Get the global minimum value and its location.
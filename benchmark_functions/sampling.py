@@ -0,0 +1,342 @@
+"""
+Samplers drawing points in a function's domain.
+
+Every sampler is a reproducible stream. Each call to sample(n) returns the
+next n points, already scaled into the bounds box and in the requested
+dtype, and can write them into a caller-provided buffer. chunks() feeds
+evaluate_batch or evaluate_stream one chunk at a time, optionally reusing a
+single buffer. spawn() splits a stream for parallel workers.
+
+    UniformSampler         i.i.d. uniform points
+    LatinHypercubeSampler  every sample(n) call is an n-point Latin hypercube
+    HaltonSampler          Halton sequence, randomized by a random shift
+    SobolSampler           Sobol sequence (requires SciPy)
+
+Random streams are seeded with np.random.SeedSequence, so the points don't
+depend on how a stream is cut into chunks, and spawn() gives statistically
+independent children. Low-discrepancy sequences split into consecutive
+blocks of one sequence, which together keep its low discrepancy, or into
+independently randomized replicates.
+"""
+
+import importlib.util
+import math
+import warnings
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from .base import validate_dtype
+
+SeedLike = Union[None, int, Sequence[int], np.random.SeedSequence]
+
+
+def _first_primes(n: int) -> np.ndarray:
+    """The first n prime numbers."""
+    limit = max(16, int(n * (math.log(n) + math.log(math.log(n)))) + 1) if n >= 6 else 16
+    sieve = np.ones(limit, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, int(limit**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve)[:n]
+
+
+class Sampler:
+    """Base class of the samplers: bounds scaling, chunking and seeding.
+
+    Subclasses implement _fill_unit, writing the next points of the stream
+    in the unit cube into an array, and _reset, building their random state
+    from seed.
+    """
+
+    def __init__(self, domain, seed: SeedLike = None, dtype: Optional[DTypeLike] = None):
+        """Initialize the sampler.
+
+        Args:
+            domain: BenchmarkFunction whose bounds are sampled, or an array of
+                (min, max) pairs with shape (dim, 2)
+            seed: Seed of the stream, an int, a SeedSequence or None for fresh
+                entropy (default: None)
+            dtype: Dtype of the points, float32 or float64 (default: the
+                function's dtype, float64 for a plain box)
+
+        Raises:
+            ValueError: If the box is malformed or dtype isn't float32 or float64
+        """
+        if hasattr(domain, "_bounds_array"):
+            box, uniform = domain._bounds_array, domain._uniform_bounds
+            default_dtype = domain.dtype
+        else:
+            box, uniform = np.asarray(domain, dtype=np.float64), None
+            default_dtype = np.float64
+        if box.ndim != 2 or box.shape[1] != 2 or np.any(box[:, 0] > box[:, 1]):
+            raise ValueError(f"Expected (dim, 2) bounds with min <= max, got shape {box.shape}")
+        self.dim = box.shape[0]
+        self.dtype = validate_dtype(default_dtype if dtype is None else dtype)
+
+        # A uniform box scales with scalars instead of dim-sized arrays
+        lower, upper = (uniform[0], uniform[1]) if uniform is not None else (box[:, 0], box[:, 1])
+        self._lower = np.asarray(lower, dtype=self.dtype)
+        self._upper = np.asarray(upper, dtype=self.dtype)
+        self._scale = np.asarray(np.subtract(upper, lower, dtype=np.float64), dtype=self.dtype)
+
+        self.seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+        # Number of points drawn so far
+        self.index = 0
+
+    def _fill_unit(self, out: np.ndarray):
+        """Write the next len(out) points of the stream in [0, 1)^dim into out."""
+        raise NotImplementedError
+
+    def sample(self, n: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw the next n points of the stream.
+
+        Args:
+            n: Number of points
+            out: Optional C-contiguous array of shape (n, dim) and the sampler
+                dtype to write the points into
+
+        Returns:
+            np.ndarray: Points with shape (n, dim) inside the bounds
+
+        Raises:
+            ValueError: If out has the wrong shape or dtype
+        """
+        if out is None:
+            out = np.empty((n, self.dim), dtype=self.dtype)
+        elif out.shape != (n, self.dim) or out.dtype != self.dtype or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous {self.dtype} array of shape ({n}, {self.dim})")
+        if n:
+            self._fill_unit(out)
+            out *= self._scale
+            out += self._lower
+            # Rounding may land one ulp past the upper bound
+            np.minimum(out, self._upper, out=out)
+        self.index += n
+        return out
+
+    def chunks(self, n: int, chunk_size: int = 65536, reuse: bool = False) -> Iterator[np.ndarray]:
+        """Draw n points in chunks, e.g. for evaluate_stream.
+
+        Args:
+            n: Total number of points
+            chunk_size: Points per chunk; the last chunk may be smaller (default: 65536)
+            reuse: Write every chunk into the same buffer. Each chunk is then
+                only valid until the next one is requested (default: False)
+
+        Yields:
+            np.ndarray: Chunks with shape (chunk, dim)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        buffer = np.empty((min(n, chunk_size), self.dim), dtype=self.dtype) if reuse else None
+        for start in range(0, n, chunk_size):
+            size = min(chunk_size, n - start)
+            yield self.sample(size, None if buffer is None else buffer[:size])
+
+    def spawn(self, n: int) -> List["Sampler"]:
+        """Independent child streams, e.g. one per worker.
+
+        Args:
+            n: Number of children
+
+        Returns:
+            List[Sampler]: Samplers of the same kind and domain
+        """
+        return [self._child(seed) for seed in self.seed.spawn(n)]
+
+    def _child(self, seed: np.random.SeedSequence, **state) -> "Sampler":
+        child = object.__new__(type(self))
+        child.__dict__.update(self.__dict__)
+        child.seed = seed
+        child.index = 0
+        child.__dict__.update(state)
+        child._reset()
+        return child
+
+    def _reset(self):
+        """Rebuild the random state from seed, e.g. after spawning."""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dim={self.dim}, dtype={self.dtype}, index={self.index})"
+
+
+class UniformSampler(Sampler):
+    """Independent uniformly distributed points."""
+
+    def __init__(self, domain, seed: SeedLike = None, dtype: Optional[DTypeLike] = None):
+        super().__init__(domain, seed, dtype)
+        self._reset()
+
+    def _reset(self):
+        self._rng = np.random.default_rng(self.seed)
+
+    def _fill_unit(self, out: np.ndarray):
+        self._rng.random(out=out, dtype=out.dtype)
+
+
+class LatinHypercubeSampler(Sampler):
+    """Latin hypercube designs: each sample(n) call stratifies every axis into n cells.
+
+    Every coordinate of an n-point call takes exactly one value in each of
+    the n intervals [k/n, (k+1)/n) of the unit interval, in a random order
+    per coordinate.
+    """
+
+    def __init__(self, domain, seed: SeedLike = None, dtype: Optional[DTypeLike] = None):
+        super().__init__(domain, seed, dtype)
+        self._reset()
+
+    def _reset(self):
+        self._rng = np.random.default_rng(self.seed)
+
+    def _fill_unit(self, out: np.ndarray):
+        n = len(out)
+        # Column j is a random permutation of the strata 0..n-1
+        strata = self._rng.permuted(np.broadcast_to(np.arange(n, dtype=out.dtype), (self.dim, n)), axis=1)
+        self._rng.random(out=out, dtype=out.dtype)
+        out += strata.T
+        out /= n
+        # In float32, (n - 1 + u) / n can round up to 1
+        np.minimum(out, np.nextafter(out.dtype.type(1), out.dtype.type(0)), out=out)
+
+
+class _SequenceSampler(Sampler):
+    """Low-discrepancy sequences, split into blocks or randomized replicates."""
+
+    def __init__(self, domain, seed: SeedLike = None, dtype: Optional[DTypeLike] = None,
+                 scramble: bool = True):
+        super().__init__(domain, seed, dtype)
+        self.scramble = scramble
+
+        # Sequence index of the first point of the stream
+        self.start = 0
+        self._reset()
+
+    def spawn(self, n: int, block: Optional[int] = None) -> List["Sampler"]:
+        """Split the stream for parallel workers.
+
+        Args:
+            n: Number of children
+            block: If given, child k continues this sequence at index
+                index + k * block, so n children drawing block points each
+                cover one contiguous run of the sequence. Otherwise every
+                child is an independently randomized sequence (default: None)
+
+        Returns:
+            List[Sampler]: Samplers of the same kind and domain
+
+        Raises:
+            ValueError: If block is None for an unscrambled sequence, whose
+                replicates would all be identical
+        """
+        if block is None:
+            if not self.scramble:
+                raise ValueError("Unscrambled sequences can only be split into blocks")
+            return super().spawn(n)
+        return [self._child(self.seed, start=self.index + k * block) for k in range(n)]
+
+
+class HaltonSampler(_SequenceSampler):
+    """Halton sequence: radical inverses of the point index in the first dim primes.
+
+    With scramble (the default) every coordinate is shifted by a random
+    amount modulo 1 (Cranley-Patterson rotation). This decorrelates the
+    high-dimensional coordinates and makes the points unbiased. Unscrambled
+    sequences start at index 0, the lower corner of the box.
+    """
+
+    def _reset(self):
+        self._bases = _first_primes(self.dim)
+        self._shift = np.random.default_rng(self.seed).random(self.dim) if self.scramble else None
+
+    def _fill_unit(self, out: np.ndarray):
+        n = len(out)
+        first = self.start + self.index
+        remaining = np.broadcast_to(np.arange(first, first + n, dtype=np.int64)[:, np.newaxis], out.shape).copy()
+        out[...] = 0
+        weight = 1.0 / self._bases
+        # Larger bases run out of digits first, so the columns that still
+        # have digits are always a prefix
+        active = self.dim
+        while active:
+            digits = remaining[:, :active] % self._bases[:active]
+            remaining[:, :active] //= self._bases[:active]
+            out[:, :active] += digits * weight[:active]
+            weight[:active] /= self._bases[:active]
+            active = int(np.count_nonzero(remaining[-1]))
+        if self._shift is not None:
+            out += self._shift.astype(out.dtype)
+            np.subtract(out, 1, out=out, where=out >= 1)
+
+
+def sobol_available() -> bool:
+    """Return True if SciPy, needed by SobolSampler, is installed."""
+    return importlib.util.find_spec("scipy") is not None
+
+
+class SobolSampler(_SequenceSampler):
+    """Sobol sequence with Owen scrambling, generated by scipy.stats.qmc.
+
+    Balance properties hold for runs of 2^k points, so chunk sizes and
+    spawn blocks should be powers of two. Supports up to 21201 dimensions.
+
+    Raises:
+        ImportError: If SciPy is not installed
+    """
+
+    def _reset(self):
+        if not sobol_available():
+            raise ImportError("SobolSampler requires SciPy, install benchmark-functions[scipy]")
+        from scipy.stats import qmc
+
+        # SciPy spawns from the generator's SeedSequence; give it a copy so
+        # that seed, and the children spawned from it, stay untouched
+        seed = np.random.SeedSequence(self.seed.entropy, spawn_key=self.seed.spawn_key,
+                                      pool_size=self.seed.pool_size)
+        rng = np.random.default_rng(seed)
+        try:
+            self._engine = qmc.Sobol(self.dim, scramble=self.scramble, rng=rng)
+        except TypeError:  # SciPy < 1.15
+            self._engine = qmc.Sobol(self.dim, scramble=self.scramble, seed=rng)
+        if self.start:
+            self._engine.fast_forward(self.start)
+
+    def _fill_unit(self, out: np.ndarray):
+        with warnings.catch_warnings():
+            # Chunks of any size are allowed; powers of two are documented
+            warnings.filterwarnings("ignore", message=".*balance properties.*")
+            out[...] = self._engine.random(len(out))
+
+
+SAMPLERS = {
+    "uniform": UniformSampler,
+    "lhs": LatinHypercubeSampler,
+    "halton": HaltonSampler,
+    "sobol": SobolSampler,
+}
+
+
+def make_sampler(kind: str, domain, seed: SeedLike = None, dtype: Optional[DTypeLike] = None,
+                 **kwargs) -> Sampler:
+    """Create a sampler by name.
+
+    Args:
+        kind: One of 'uniform', 'lhs', 'halton' or 'sobol'
+        domain: BenchmarkFunction, or an array of (min, max) pairs with shape (dim, 2)
+        seed: Seed of the stream (default: None)
+        dtype: Dtype of the points (default: the function's dtype)
+        **kwargs: Further sampler options, e.g. scramble=False
+
+    Returns:
+        Sampler: The new sampler
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    if kind not in SAMPLERS:
+        raise ValueError(f"Unknown sampler '{kind}', expected one of {tuple(SAMPLERS)}")
+    return SAMPLERS[kind](domain, seed, dtype, **kwargs)
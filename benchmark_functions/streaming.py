@@ -0,0 +1,188 @@
+"""
+Streaming evaluation of unbounded point streams in bounded memory.
+
+evaluate_stream turns an iterable of (n_i, dim) point arrays into a lazy
+stream of (points, values) pairs. Stages are generators over such pairs and
+can be chained freely; reducers summarize a stream without keeping it.
+
+Example:
+    >>> best, stats = BestSoFar(), RunningStats()
+    >>> stream = func.evaluate_stream(chunks, memory_budget=64 * 2**20)
+    >>> stream = filter_below(stream, 10.0)
+    >>> for points, values in track(stream, best, stats):
+    ...     pass
+    >>> best.value, stats.mean
+"""
+
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+# Rough number of (n, dim) arrays alive at once while a kernel runs: the
+# input chunk plus the temporaries of a typical NumPy expression
+WORKING_SET_FACTOR = 4
+
+Chunk = Tuple[np.ndarray, np.ndarray]
+
+
+def rows_for_budget(dim: int, memory_budget: int, itemsize: int = 8) -> int:
+    """Largest number of rows whose evaluation fits in a memory budget.
+
+    Args:
+        dim: Number of columns
+        memory_budget: Budget in bytes
+        itemsize: Bytes per element (default: 8)
+
+    Returns:
+        int: Rows per chunk, at least 1
+    """
+    return max(1, memory_budget // (dim * itemsize * WORKING_SET_FACTOR))
+
+
+def rechunk(chunks: Iterable[np.ndarray], max_rows: int) -> Iterator[np.ndarray]:
+    """Split chunks so that none has more than max_rows rows.
+
+    The pieces are views of the original chunks, no data is copied.
+
+    Args:
+        chunks: Iterable of (n_i, dim) arrays
+        max_rows: Maximum rows per output chunk
+
+    Yields:
+        np.ndarray: Chunks with at most max_rows rows
+    """
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        for start in range(0, len(chunk), max_rows):
+            yield chunk[start:start + max_rows]
+
+
+def evaluate_stream(func, chunks: Iterable[np.ndarray],
+                    memory_budget: Optional[int] = None) -> Iterator[Chunk]:
+    """Lazily evaluate a function over a stream of point chunks.
+
+    Args:
+        func: Benchmark function
+        chunks: Iterable of (n_i, dim) arrays
+        memory_budget: If given, chunks are split so that evaluating one
+            needs roughly at most this many bytes
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: (points, values) for each chunk
+    """
+    if memory_budget is not None:
+        chunks = rechunk(chunks, rows_for_budget(func.dim, memory_budget, func.dtype.itemsize))
+    for chunk in chunks:
+        chunk = np.asarray(chunk)
+        if len(chunk):
+            yield chunk, func.evaluate_batch(chunk)
+
+
+def filter_stream(stream: Iterable[Chunk], predicate: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> Iterator[Chunk]:
+    """Keep the rows for which predicate(points, values) is True.
+
+    Args:
+        stream: Stream of (points, values) pairs
+        predicate: Returns a boolean mask of shape (n,)
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: Non-empty filtered (points, values) pairs
+    """
+    for points, values in stream:
+        mask = predicate(points, values)
+        if np.any(mask):
+            yield points[mask], values[mask]
+
+
+def filter_below(stream: Iterable[Chunk], threshold: float) -> Iterator[Chunk]:
+    """Keep the rows whose value is below threshold."""
+    return filter_stream(stream, lambda points, values: values < threshold)
+
+
+class BestSoFar:
+    """Running minimum of a stream and the point where it was found."""
+
+    def __init__(self):
+        self.value = np.inf
+        self.point: Optional[np.ndarray] = None
+
+    def update(self, points: np.ndarray, values: np.ndarray):
+        if not len(values) or np.all(np.isnan(values)):
+            return
+        i = np.nanargmin(values)
+        if values[i] < self.value:
+            self.value = float(values[i])
+            self.point = np.array(points[i])
+
+    def __repr__(self) -> str:
+        return f"BestSoFar(value={self.value}, point={self.point})"
+
+
+class RunningStats:
+    """Running count, mean, variance, min and max of the values of a stream.
+
+    Chunks are merged with Chan's parallel update, so the result doesn't
+    depend on how the stream is chunked beyond rounding. NaN values are
+    skipped.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, points: np.ndarray, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if not n:
+            return
+        mean = float(np.mean(values))
+        m2 = float(np.sum((values - mean)**2))
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta**2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, float(np.min(values)))
+        self.max = max(self.max, float(np.max(values)))
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far."""
+        return self._m2 / self.count if self.count else np.nan
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean}, min={self.min}, max={self.max})"
+
+
+def track(stream: Iterable[Chunk], *reducers) -> Iterator[Chunk]:
+    """Pass a stream through unchanged while updating reducers.
+
+    Args:
+        stream: Stream of (points, values) pairs
+        *reducers: Objects with an update(points, values) method
+
+    Yields:
+        Tuple[np.ndarray, np.ndarray]: The input pairs
+    """
+    for points, values in stream:
+        for reducer in reducers:
+            reducer.update(points, values)
+        yield points, values
+
+
+def reduce_stream(stream: Iterable[Chunk], *reducers):
+    """Consume a stream, updating reducers, without keeping any chunk.
+
+    Args:
+        stream: Stream of (points, values) pairs
+        *reducers: Objects with an update(points, values) method
+
+    Returns:
+        The reducers, for convenient unpacking
+    """
+    for _ in track(stream, *reducers):
+        pass
+    return reducers[0] if len(reducers) == 1 else reducers
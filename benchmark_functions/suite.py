@@ -0,0 +1,147 @@
+"""
+Evaluation of several benchmark functions on one batch.
+"""
+
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base import BenchmarkFunction
+from .bounds import inside_mask
+from .utils import SharedTerms
+
+
+def _contains(outer: np.ndarray, inner: np.ndarray) -> bool:
+    """Whether the box outer contains the box inner."""
+    return bool(np.all(outer[:, 0] <= inner[:, 0]) and np.all(inner[:, 1] <= outer[:, 1]))
+
+
+def _size_key(box: np.ndarray) -> Tuple[int, float]:
+    """Sort key placing every box after the boxes it contains.
+
+    Boxes with more zero-width axes come first; ties compare the log volume
+    over the other axes, so degenerate boxes need no log(0).
+    """
+    widths = box[:, 1] - box[:, 0]
+    flat = widths <= 0
+    return -int(np.count_nonzero(flat)), float(np.sum(np.log(widths[~flat])))
+
+
+class FunctionSuite:
+    """Evaluate a set of functions on the same batch of points.
+
+    Intermediates common to several kernels, such as sum(x_i^2) and
+    sum(cos(2 pi x_i)), are computed once per batch (see SharedTerms).
+    Bounds are checked once per distinct box, from the smallest box to the
+    largest. A box that contains an already checked one only checks the rows
+    that fell outside it, so for the usual case of a sample drawn inside the
+    smallest domain only one bounds check runs. Every function keeps its own
+    bounds policy and metrics.
+
+    Example:
+        >>> suite = FunctionSuite([Ackley(dim=10), Rastrigin(dim=10), Griewank(dim=10)])
+        >>> values = suite.evaluate_batch(X)  # shape (n, 3)
+    """
+
+    def __init__(self, functions: Sequence[BenchmarkFunction]):
+        """Initialize the suite.
+
+        Args:
+            functions: Benchmark functions sharing the same dim and dtype
+
+        Raises:
+            ValueError: If functions is empty or dims or dtypes differ
+        """
+        self.functions: List[BenchmarkFunction] = list(functions)
+        if not self.functions:
+            raise ValueError("A suite needs at least one function")
+        self.dim = self.functions[0].dim
+        self.dtype = self.functions[0].dtype
+        for func in self.functions:
+            if func.dim != self.dim or func.dtype != self.dtype:
+                raise ValueError(f"All functions must have dim={self.dim} and dtype={self.dtype}, "
+                                 f"got {func.name} with dim={func.dim} and dtype={func.dtype}")
+        self.names = [func.name for func in self.functions]
+
+        # Distinct bounds boxes, smallest first, each with the index of the
+        # largest earlier box it contains (None if there is none)
+        boxes: List[np.ndarray] = []
+        for func in self.functions:
+            if not any(np.array_equal(box, func._bounds_array) for box in boxes):
+                boxes.append(func._bounds_array)
+        boxes.sort(key=_size_key)
+        self._boxes = boxes
+        self._parents: List[Optional[int]] = []
+        for k, box in enumerate(boxes):
+            parents = [p for p in range(k) if _contains(box, boxes[p])]
+            self._parents.append(parents[-1] if parents else None)
+        self._box_index = [next(k for k, box in enumerate(boxes) if np.array_equal(box, func._bounds_array))
+                           for func in self.functions]
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+    def _inside(self, X: np.ndarray, k: int, masks: dict) -> np.ndarray:
+        """Mask of the rows of X inside box k, reusing masks of contained boxes."""
+        if k in masks:
+            return masks[k]
+        box = self._boxes[k].astype(X.dtype, copy=False)
+        parent = self._parents[k]
+        if parent is None:
+            mask = inside_mask(X, box)
+        else:
+            mask = self._inside(X, parent, masks)
+            if not mask.all():
+                rest = ~mask
+                mask = mask.copy()
+                mask[rest] = inside_mask(X[rest], box)
+        masks[k] = mask
+        return mask
+
+    def evaluate_batch(self, X: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Evaluate every function at every row of X.
+
+        Args:
+            X: Batch of input points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Values with shape (n, n_functions); column k holds the
+            values of functions[k]
+
+        Raises:
+            ValueError: If X has the wrong shape, or points are outside the
+                bounds of a function under the 'raise' policy
+        """
+        X = self.functions[0]._as_batch(X)
+        terms = SharedTerms(X)
+        masks: dict = {}
+        out = np.empty((len(X), len(self.functions)), dtype=X.dtype)
+
+        for k, func in enumerate(self.functions):
+            box = self._box_index[k]
+
+            def run(X: np.ndarray, with_grad: bool, func=func, box=box) -> np.ndarray:
+                if func.bounds_policy == "trusted":
+                    return func._run_shared(terms)
+                inside = self._inside(X, box, masks)
+                if inside.all():
+                    return func._run_shared(terms)
+                return func._apply_bounds_policy(X, inside=inside)
+
+            out[:, k] = func._evaluate_with_policy(X, run=run)
+        return out
+
+    def __call__(self, x: Union[List[float], np.ndarray]) -> np.ndarray:
+        """Evaluate every function at a single point.
+
+        Args:
+            x: Input point with shape (dim,)
+
+        Returns:
+            np.ndarray: Values with shape (n_functions,)
+        """
+        x = self.functions[0]._as_point(x)
+        return self.evaluate_batch(x[np.newaxis, :])[0]
+
+    def __repr__(self) -> str:
+        return f"FunctionSuite([{', '.join(self.names)}], dim={self.dim})"
@@ -0,0 +1,214 @@
+"""
+Shifted and rotated variants of benchmark functions.
+
+Following the CEC benchmark suites, a transformed function evaluates
+
+    f(x) = g(R (x - o) + x*)
+
+where g is the base function with global minimizer x*, o is the shift and
+R an orthogonal rotation. The optimum moves to x = o and the function is no
+longer separable or aligned with the coordinate axes.
+"""
+
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base import BenchmarkFunction
+
+# Shifts are drawn from the central part of the bounds: centre +/- this
+# fraction of the half-width, as in the CEC suites ([-80, 80] in [-100, 100])
+SHIFT_FRACTION = 0.8
+
+
+@lru_cache(maxsize=64)
+def rotation_matrix(dim: int, seed: int) -> np.ndarray:
+    """Seeded random orthogonal matrix, computed once per (dim, seed).
+
+    The QR decomposition of a Gaussian matrix with the signs of R's diagonal
+    folded into Q gives a rotation uniformly distributed over O(dim).
+
+    Args:
+        dim: Size of the matrix
+        seed: Seed of the random generator
+
+    Returns:
+        np.ndarray: Read-only float64 array of shape (dim, dim)
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(2)[0])
+    q, r = np.linalg.qr(rng.standard_normal((dim, dim)))
+    q *= np.sign(np.diag(r))
+    q.flags.writeable = False
+    return q
+
+
+def random_shift(func: BenchmarkFunction, seed: int) -> np.ndarray:
+    """Seeded random shift inside the central part of the bounds of func.
+
+    Args:
+        func: Benchmark function providing the bounds
+        seed: Seed of the random generator
+
+    Returns:
+        np.ndarray: Shift with shape (dim,)
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(2)[1])
+    lower, upper = func._bounds_array[:, 0].astype(float), func._bounds_array[:, 1].astype(float)
+    centre, half_width = (lower + upper) / 2, (upper - lower) / 2
+    return centre + SHIFT_FRACTION * half_width * rng.uniform(-1, 1, func.dim)
+
+
+class TransformedFunction(BenchmarkFunction):
+    """Shifted and/or rotated variant of a benchmark function.
+
+    The whole batch is mapped to the base coordinates with one matrix
+    multiply, Z = X @ R.T + (x* - R o), before the base kernel runs.
+    Transformed coordinates are clipped to the bounds of the base function,
+    whose global minimum is only guaranteed within them, so f(x) >= f(o)
+    everywhere. Without the clip, rotated Schwefel has lower values outside
+    its domain. Backend and dtype are those of the base function.
+
+    Example:
+        >>> func = TransformedFunction(Rastrigin(dim=10), seed=3)
+        >>> value, location = func.get_global_minimum()
+    """
+
+    __slots__ = ("func", "seed", "shift", "_optimum", "_rotation_source", "_rotation_t", "_offset")
+    _tables = ("_rotation_t", "_offset")
+
+    def __init__(self, func: BenchmarkFunction, shift: Union[bool, Sequence[float]] = True,
+                 rotation: Union[bool, np.ndarray] = True, seed: int = 0,
+                 bounds_policy: Optional[str] = None):
+        """Initialize the transformed function.
+
+        Args:
+            func: Base function with a known global minimizer (Ackley,
+                Rastrigin, Griewank, Schwefel, Rosenbrock, ...)
+            shift: True for a seeded random shift, False for none, or the
+                shift vector o itself (default: True)
+            rotation: True for a seeded random rotation, False for none, or
+                an orthogonal (dim, dim) matrix (default: True)
+            seed: Seed of the random shift and rotation (default: 0)
+            bounds_policy: Out-of-bounds policy (default: that of func)
+
+        Raises:
+            ValueError: If the minimizer of func is unknown, or the shift or
+                rotation is invalid
+        """
+        optimum, location = func.get_global_minimum()
+        if location is None:
+            raise ValueError(f"{func.name} has no known global minimizer to transform")
+
+        prefix = ("Shifted " if shift is not False else "") + ("Rotated " if rotation is not False else "")
+        super().__init__(name=prefix + func.name, dim=func.dim, bounds=func.bounds,
+                         bounds_policy=func.bounds_policy if bounds_policy is None else bounds_policy,
+                         backend=func.backend, dtype=func.dtype)
+        self.func = func
+        self.seed = seed
+        self._optimum = optimum
+
+        if shift is True:
+            shift = random_shift(func, seed)
+        elif shift is False:
+            shift = location
+        shift = np.asarray(shift, dtype=float)
+        if shift.shape != (self.dim,):
+            raise ValueError(f"Shift dimension {shift.shape} doesn't match function dimension {self.dim}")
+
+        if rotation is not True and rotation is not False:
+            rotation = np.asarray(rotation, dtype=float)
+            if rotation.shape != (self.dim, self.dim):
+                raise ValueError(f"Rotation shape {rotation.shape} doesn't match ({self.dim}, {self.dim})")
+            if not np.allclose(rotation @ rotation.T, np.eye(self.dim), atol=1e-8):
+                raise ValueError("Rotation matrix must be orthogonal")
+
+        self.shift = shift
+        # True for the seeded rotation, False for none, else the matrix
+        self._rotation_source = rotation
+        self._build_tables()
+
+    def _build_tables(self):
+        location = np.asarray(self.func.get_global_minimum()[1], dtype=float)
+        if self._rotation_source is False:
+            self._rotation_t = None
+            offset = location - self.shift
+        else:
+            if self._rotation_source is True:
+                rotation = rotation_matrix(self.dim, self.seed)
+            else:
+                rotation = self._rotation_source
+            # Stored transposed so the batch transform is a plain X @ R.T
+            self._rotation_t = np.ascontiguousarray(rotation.T, dtype=self.dtype)
+            offset = location - rotation @ self.shift
+        self._offset = offset.astype(self.dtype)
+
+    @property
+    def rotation(self) -> Optional[np.ndarray]:
+        """Rotation matrix R, None if the function is only shifted."""
+        return None if self._rotation_t is None else self._rotation_t.T
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Map points to the coordinates of the base function.
+
+        Args:
+            X: Batch of points with shape (n, dim)
+
+        Returns:
+            np.ndarray: R (x - o) + x* for every row, with shape (n, dim)
+        """
+        rotation_t = self._const("_rotation_t", X.dtype)
+        if rotation_t is None:
+            return X + self._const("_offset", X.dtype)
+        Z = X @ rotation_t
+        Z += self._const("_offset", X.dtype)
+        return Z
+
+    def _clip_inner(self, Z: np.ndarray) -> np.ndarray:
+        bounds = self.func._bounds.array(Z.dtype)
+        return np.clip(Z, bounds[:, 0], bounds[:, 1], out=Z)
+
+    def _evaluate(self, X: np.ndarray) -> np.ndarray:
+        """Evaluate the transformed function on a batch of points.
+
+        Args:
+            X: Input points with shape (n, dim)
+
+        Returns:
+            np.ndarray: Function values with shape (n,)
+        """
+        return self.func._evaluate(self._clip_inner(self.transform(X)))
+
+    def _run_kernel(self, X: np.ndarray) -> np.ndarray:
+        return self.func._run_kernel(self._clip_inner(self.transform(X)))
+
+    def _value_and_grad(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate the transformed function and its gradient on a batch of points.
+
+        The gradient is R.T applied to the base gradient, which is zero in
+        the coordinates clipped to the base bounds.
+
+        Args:
+            X: Input points with shape (n, dim)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: values with shape (n,) and gradients with shape (n, dim)
+        """
+        Z = self.transform(X)
+        bounds = self.func._bounds.array(Z.dtype)
+        clipped = (Z < bounds[:, 0]) | (Z > bounds[:, 1])
+        values, grads = self.func._value_and_grad(self._clip_inner(Z))
+        grads[clipped] = 0
+
+        rotation_t = self._const("_rotation_t", X.dtype)
+        if rotation_t is not None:
+            grads = grads @ rotation_t.T
+        return values, grads
+
+    def get_global_minimum(self) -> Tuple[float, np.ndarray]:
+        """Get the global minimum value and its location.
+
+        Returns:
+            Tuple[float, np.ndarray]: (minimum value of the base function, shift o)
+        """
+        return self._optimum, self.shift.copy()
@@ -0,0 +1,58 @@
+"""
+Shared numerical helpers for the benchmark function kernels.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+
+def exclusive_prod(A: np.ndarray) -> np.ndarray:
+    """Product of all other entries along the last axis.
+
+    Entry i of the result is prod(A[..., j] for j != i). It is computed from
+    prefix and suffix cumulative products rather than by dividing the total
+    product, so it stays exact when some factors are zero.
+
+    Args:
+        A: Array of factors with shape (..., dim)
+
+    Returns:
+        np.ndarray: Array with the same shape as A
+    """
+    out = np.ones_like(A)
+    np.cumprod(A[..., :-1], axis=-1, out=out[..., 1:])
+    suffix = np.cumprod(A[..., :0:-1], axis=-1)[..., ::-1]
+    out[..., :-1] *= suffix
+    return out
+
+
+class SharedTerms:
+    """Intermediates of one batch, computed on first use and then shared.
+
+    Kernels that need the same elementwise terms or row reductions (Ackley,
+    Rastrigin and Griewank all sum x_i^2; Ackley and Rastrigin both sum
+    cos(2 pi x_i)) read them from here, so evaluating several functions on
+    one batch computes each term once.
+
+    Args:
+        X: Batch of points with shape (n, dim)
+    """
+
+    def __init__(self, X: np.ndarray):
+        self.X = X
+
+    @cached_property
+    def square(self) -> np.ndarray:
+        """x_i^2, shape (n, dim)."""
+        return self.X**2
+
+    @cached_property
+    def sum_square(self) -> np.ndarray:
+        """sum_i x_i^2, shape (n,)."""
+        return np.sum(self.square, axis=1)
+
+    @cached_property
+    def sum_cos_2pi(self) -> np.ndarray:
+        """sum_i cos(2 pi x_i), shape (n,)."""
+        return np.sum(np.cos(2 * np.pi * self.X), axis=1)
@@ -0,0 +1,147 @@
+"""
+Scratch workspaces and blocked reductions for very high-dimensional kernels.
+
+At dim 1e6-1e7 every temporary of a NumPy expression is as large as the
+input. The blocked kernels instead walk the coordinates in cache-sized
+column blocks, compute each term in place into a reused scratch buffer and
+reduce it straight away, so peak memory stays a small constant over the
+input.
+
+Row sums are made independent of the block size: every row is cut into
+fixed leaves of LEAF_SIZE coordinates, each leaf is reduced on its own, and
+the leaf results are combined in a fixed pairwise tree. Blocks always hold
+whole leaves, so changing BLOCK_BYTES only changes how many leaves are
+processed at a time, never the order of the floating-point operations.
+"""
+
+import threading
+from typing import Callable, Dict, Iterator, Tuple
+
+import numpy as np
+
+# Coordinates per leaf of the reduction tree. Part of the numerical result,
+# so it is a fixed constant rather than a tuning knob
+LEAF_SIZE = 1024
+
+# Target size of one scratch buffer, and so of one column block
+BLOCK_BYTES = 1 << 18
+
+# Functions use their blocked kernels from this many dimensions on
+BLOCKED_MIN_DIM = 1 << 14
+
+
+class Workspace:
+    """Scratch buffers reused across calls, one set per thread.
+
+    Buffers grow to the largest size requested and are then handed out as
+    views, so steady-state evaluation doesn't allocate. Each thread gets its
+    own buffers, so concurrent evaluation of one instance is safe.
+    """
+
+    __slots__ = ("_local",)
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def buffer(self, key: str, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """Uninitialized C-contiguous scratch array.
+
+        Args:
+            key: Name of the buffer; different keys never alias
+            shape: Requested shape
+            dtype: Requested dtype
+
+        Returns:
+            np.ndarray: View of the thread's buffer with the given shape
+        """
+        buffers: Dict[Tuple[str, np.dtype], np.ndarray] = getattr(self._local, "buffers", None)
+        if buffers is None:
+            buffers = self._local.buffers = {}
+        size = int(np.prod(shape))
+        storage = buffers.get((key, dtype))
+        if storage is None or storage.size < size:
+            storage = buffers[(key, dtype)] = np.empty(size, dtype=dtype)
+        return storage[:size].reshape(shape)
+
+
+def column_blocks(n_rows: int, n_cols: int, itemsize: int) -> Iterator[Tuple[int, int]]:
+    """Column ranges of whole leaves that fit in BLOCK_BYTES for n_rows rows.
+
+    Args:
+        n_rows: Number of rows processed together
+        n_cols: Number of columns to cover
+        itemsize: Bytes per element
+
+    Yields:
+        Tuple[int, int]: (start, stop) column ranges
+    """
+    leaves = max(1, BLOCK_BYTES // (n_rows * LEAF_SIZE * itemsize))
+    width = leaves * LEAF_SIZE
+    for start in range(0, n_cols, width):
+        yield start, min(start + width, n_cols)
+
+
+def n_leaves(n_cols: int) -> int:
+    """Number of leaves covering n_cols columns."""
+    return -(-n_cols // LEAF_SIZE)
+
+
+def reduce_leaves(block: np.ndarray, out: np.ndarray, ufunc: np.ufunc = np.add):
+    """Reduce every leaf of a block of columns.
+
+    Args:
+        block: Array of shape (n, width) starting at a leaf boundary
+        out: Array of shape (n, n_leaves(width)) receiving the leaf results
+        ufunc: Binary ufunc of the reduction, np.add or np.multiply
+    """
+    n, width = block.shape
+    full = width // LEAF_SIZE
+    if full:
+        ufunc.reduce(block[:, :full * LEAF_SIZE].reshape(n, full, LEAF_SIZE), axis=2, out=out[:, :full])
+    if width % LEAF_SIZE:
+        ufunc.reduce(block[:, full * LEAF_SIZE:], axis=1, out=out[:, full])
+
+
+def pairwise_reduce(partials: np.ndarray, ufunc: np.ufunc = np.add) -> np.ndarray:
+    """Combine leaf results along axis 1 in a fixed pairwise tree.
+
+    Args:
+        partials: Array of shape (n, m) of leaf results
+        ufunc: Binary ufunc of the reduction, np.add or np.multiply
+
+    Returns:
+        np.ndarray: Reduced values with shape (n,)
+    """
+    while partials.shape[1] > 1:
+        m = partials.shape[1]
+        pairs = ufunc(partials[:, 0:m - 1:2], partials[:, 1:m:2])
+        if m % 2:
+            pairs = np.concatenate([pairs, partials[:, -1:]], axis=1)
+        partials = pairs
+    return partials[:, 0].copy()
+
+
+def blocked_reduce(workspace: Workspace, X: np.ndarray, n_cols: int,
+                   terms: Callable[[int, int, np.ndarray], None],
+                   ufunc: np.ufunc = np.add, key: str = "block") -> np.ndarray:
+    """Row-wise reduction of elementwise terms computed block by block.
+
+    Args:
+        workspace: Workspace providing the scratch buffers
+        X: Batch of points with shape (n, dim), used for its shape and dtype
+        n_cols: Number of terms per row
+        terms: Called as terms(start, stop, buf) to write the terms of
+            columns [start, stop) into buf, an (n, stop - start) scratch array
+        ufunc: Binary ufunc of the reduction, np.add or np.multiply
+        key: Workspace key of the buffers, distinct per concurrent reduction
+
+    Returns:
+        np.ndarray: Reduced values with shape (n,)
+    """
+    n = X.shape[0]
+    partials = workspace.buffer(key + "_leaves", (n, n_leaves(n_cols)), X.dtype)
+    for start, stop in column_blocks(n, n_cols, X.itemsize):
+        buf = workspace.buffer(key, (n, stop - start), X.dtype)
+        terms(start, stop, buf)
+        reduce_leaves(buf, partials[:, start // LEAF_SIZE:n_leaves(stop)], ufunc)
+    return pairwise_reduce(partials, ufunc)
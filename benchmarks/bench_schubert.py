@@ -0,0 +1,35 @@
+"""
+Benchmark the vectorized Schubert kernel against the per-coordinate loop.
+
+Usage:
+    python -m benchmarks.bench_schubert  (from the repository root)
+"""
+
+import timeit
+import numpy as np
+from benchmark_functions import Schubert
+
+def schubert_loop(x: np.ndarray) -> float:
+    """Reference implementation with a Python loop over the coordinates."""
+    j = np.arange(1, 6)
+    return np.prod([np.sum(j * np.cos((j + 1) * xi + j)) for xi in x])
+
+def main(n_points: int = 2000, repeat: int = 3):
+    """Time scalar and batched evaluation at dim 2, 10 and 100."""
+    rng = np.random.default_rng(0)
+    print(f"{'dim':>5} {'loop [us/pt]':>14} {'scalar [us/pt]':>15} {'batch [us/pt]':>14} {'speedup':>9}")
+    for dim in (2, 10, 100):
+        func = Schubert(dim=dim)
+        X = rng.uniform(-10, 10, size=(n_points, dim))
+        assert np.allclose(func.evaluate_batch(X), [schubert_loop(x) for x in X])
+        
+        loop = min(timeit.repeat(lambda: [schubert_loop(x) for x in X], number=1, repeat=repeat))
+        scalar = min(timeit.repeat(lambda: [func(x) for x in X], number=1, repeat=repeat))
+        batch = min(timeit.repeat(lambda: func.evaluate_batch(X), number=1, repeat=repeat))
+        
+        per_point = 1e6 / n_points
+        print(f"{dim:>5} {loop * per_point:>14.2f} {scalar * per_point:>15.2f} "
+              f"{batch * per_point:>14.3f} {loop / batch:>8.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -65,4 +65,49 @@ def test_ackley_string_representation():
     """Test Ackley function string representation."""
     func = Ackley()
     assert str(func) == "Ackley (dim=2)"
-    assert repr(func).startswith("Ackley(name='Ackley', dim=2") 
\ No newline at end of file
+    assert repr(func).startswith("Ackley(name='Ackley', dim=2") 
+
+def test_ackley_batch_evaluation():
+    """Test Ackley function batched evaluation."""
+    func = Ackley(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-32.768, 32.768, size=(50, 3))
+    
+    # Batched values match the scalar path row by row
+    values = func.evaluate_batch(X)
+    assert values.shape == (50,)
+    assert np.allclose(values, [func(x) for x in X])
+    
+    # Test with invalid shape
+    with pytest.raises(ValueError):
+        func.evaluate_batch(X[0])
+    
+    # Test with a point outside bounds
+    with pytest.raises(ValueError):
+        func.evaluate_batch([[0.0, 0.0, 0.0], [33.0, 0.0, 0.0]])
+
+
+def test_ackley_gradient():
+    """Test Ackley analytic gradient against central differences."""
+    func = Ackley(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-30, 30, size=(10, 3))
+    
+    values, grads = func.value_and_grad(X)
+    assert np.allclose(values, func.evaluate_batch(X))
+    
+    h = 1e-6
+    for i in range(func.dim):
+        step = np.zeros(func.dim)
+        step[i] = h
+        numeric = (func.evaluate_batch(X + step) - func.evaluate_batch(X - step)) / (2 * h)
+        assert np.allclose(grads[:, i], numeric, rtol=1e-5, atol=1e-5)
+    
+    # Single point returns a scalar and a (dim,) gradient
+    value, grad = func.value_and_grad(X[0])
+    assert np.isclose(value, func(X[0]))
+    assert np.allclose(func.gradient(X[0]), grad)
+    assert grad.shape == (func.dim,)
+    
+    # The gradient is defined as zero at the non-differentiable origin
+    assert np.allclose(func.gradient(np.zeros(3)), 0.0)
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+Tests for the asyncio evaluation interface.
+"""
+
+import asyncio
+import time
+import numpy as np
+import pytest
+from benchmark_functions import AsyncBenchmark, Forrester, GramacyLee
+
+def test_async_evaluate():
+    """Test single asynchronous evaluations."""
+    func = Forrester()
+    bench = AsyncBenchmark(func)
+    
+    assert np.isclose(asyncio.run(bench.evaluate([0.5])), func([0.5]))
+    with pytest.raises(ValueError):
+        asyncio.run(bench.evaluate([0.5, 0.5]))
+
+def test_async_evaluate_many_coalesces():
+    """Test that concurrent evaluations share one kernel call."""
+    func = GramacyLee()
+    bench = AsyncBenchmark(func)
+    points = np.linspace(0.5, 2.5, 50)[:, np.newaxis]
+    
+    values = asyncio.run(bench.evaluate_many(points))
+    assert np.allclose(values, func.evaluate_batch(points))
+    assert bench.evaluations == 50
+    assert bench.batch_calls == 1
+
+def test_async_out_of_bounds_fails_individually():
+    """Test that an offending point doesn't fail the rest of its batch."""
+    bench = AsyncBenchmark(Forrester())
+    
+    async def run():
+        return await asyncio.gather(bench.evaluate([0.5]), bench.evaluate([2.0]),
+                                    return_exceptions=True)
+    
+    good, bad = asyncio.run(run())
+    assert np.isclose(good, Forrester()([0.5]))
+    assert isinstance(bad, ValueError)
+
+class _Broken(Forrester):
+    """Forrester whose batch kernel fails with an unexpected error."""
+    
+    def _run_kernel(self, X):
+        raise RuntimeError("simulator crashed")
+
+def test_async_unexpected_error_fails_batch():
+    """Test that errors other than ValueError reach every waiting caller."""
+    bench = AsyncBenchmark(_Broken())
+    
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(bench.evaluate([0.2]), bench.evaluate([0.4]),
+                                                     return_exceptions=True), timeout=5)
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert bench.batch_calls == 1
+
+def test_async_latency_and_concurrency():
+    """Test the artificial latency and the concurrency limit."""
+    bench = AsyncBenchmark(Forrester(), latency=0.02, max_concurrency=2)
+    points = np.full((4, 1), 0.5)
+    
+    start = time.perf_counter()
+    asyncio.run(bench.evaluate_many(points))
+    elapsed = time.perf_counter() - start
+    
+    # Four evaluations, two at a time
+    assert elapsed >= 0.04
+    assert bench.batch_calls == 2
+
+@pytest.mark.parametrize("distribution", ["constant", "uniform", "exponential", "lognormal"])
+def test_latency_distributions(distribution):
+    """Test the latency distributions have the requested mean."""
+    bench = AsyncBenchmark(Forrester(), latency=1.0, distribution=distribution, seed=0)
+    samples = [bench.sample_latency() for _ in range(5000)]
+    assert min(samples) >= 0
+    assert np.isclose(np.mean(samples), 1.0, rtol=0.1)
+
+def test_latency_distribution_validation():
+    """Test custom and unknown latency distributions."""
+    bench = AsyncBenchmark(Forrester(), distribution=lambda rng: 0.25)
+    assert bench.sample_latency() == 0.25
+    with pytest.raises(ValueError):
+        AsyncBenchmark(Forrester(), distribution="pareto")
@@ -0,0 +1,87 @@
+"""
+Tests for the evaluation backends.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (
+    Ackley, Forrester, GramacyLee, Griewank, Rastrigin, Rosenbrock, Schubert, Schwefel,
+)
+from benchmark_functions import backends
+
+def _functions(**kwargs):
+    return [
+        Ackley(dim=7, **kwargs), Griewank(dim=7, **kwargs), Rastrigin(dim=7, **kwargs),
+        Rosenbrock(dim=7, **kwargs), Schubert(dim=7, **kwargs), Schwefel(dim=7, **kwargs),
+        Forrester(**kwargs), GramacyLee(**kwargs),
+    ]
+
+def test_backend_validation():
+    """Test that unknown backends are rejected."""
+    with pytest.raises(ValueError):
+        Ackley(backend="cuda")
+    with pytest.raises(ValueError):
+        backends.set_default_backend("cuda")
+
+def test_default_backend():
+    """Test selecting the backend globally."""
+    previous = backends.get_default_backend()
+    try:
+        backends.set_default_backend("auto")
+        assert backends.get_default_backend() == "auto"
+        
+        func = Rastrigin()
+        assert func.backend is None
+        assert np.isclose(func([0.0, 0.0]), 0.0)
+    finally:
+        backends.set_default_backend(previous)
+
+def test_numpy_backend_skips_kernel():
+    """Test that the NumPy backend never uses the compiled kernel."""
+    assert not backends.use_numba("numpy")
+
+@pytest.mark.skipif(not backends.numba_available(), reason="Numba is not installed")
+def test_numba_backend_matches_numpy():
+    """Test the compiled kernels against the NumPy path."""
+    rng = np.random.default_rng(0)
+    for numpy_func, numba_func in zip(_functions(backend="numpy"), _functions(backend="numba")):
+        lower, upper = numpy_func._bounds_array[:, 0], numpy_func._bounds_array[:, 1]
+        X = rng.uniform(lower, upper, size=(100, numpy_func.dim))
+        
+        expected = numpy_func.evaluate_batch(X)
+        assert np.allclose(numba_func.evaluate_batch(X), expected, rtol=1e-12, atol=1e-10)
+        assert np.isclose(numba_func(X[0]), expected[0], rtol=1e-12, atol=1e-10)
+
+@pytest.mark.skipif(backends.numba_available(), reason="Numba is installed")
+def test_numba_backend_falls_back():
+    """Test the NumPy fallback when Numba is missing."""
+    with pytest.warns(RuntimeWarning):
+        func = Rastrigin(backend="numba")
+    assert np.isclose(func([0.0, 0.0]), 0.0)
+
+class _DoubledRastrigin(Rastrigin):
+    """Subclass overriding the formula, keeping the inherited _jit_kernel."""
+    
+    def _evaluate(self, X):
+        return 2 * super()._evaluate(X)
+
+class _ShiftedForrester(Forrester):
+    """Subclass overriding the scalar formula of a 1D function."""
+    
+    @staticmethod
+    def _formula(x):
+        return Forrester._formula(x) + 1
+
+def test_overridden_formula_skips_kernel():
+    """Test that subclasses overriding the formula never run the parent kernel."""
+    assert Rastrigin()._follows_formula("_jit_kernel")
+    assert not _DoubledRastrigin()._follows_formula("_jit_kernel")
+    assert not _ShiftedForrester()._follows_formula("_jit_kernel")
+    
+    X = np.random.default_rng(0).uniform(0, 1, size=(20, 2))
+    for backend in ("numpy", "numba") if backends.numba_available() else ("numpy",):
+        doubled = _DoubledRastrigin(backend=backend)
+        assert np.allclose(doubled.evaluate_batch(X), 2 * Rastrigin().evaluate_batch(X))
+        assert np.isclose(doubled(X[0]), 2 * Rastrigin()(X[0]))
+        shifted = _ShiftedForrester(backend=backend)
+        assert np.allclose(shifted.evaluate_batch(X[:, :1]), Forrester().evaluate_batch(X[:, :1]) + 1)
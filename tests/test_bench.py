@@ -0,0 +1,72 @@
+"""
+Tests for the performance benchmark suite.
+"""
+
+import json
+import pytest
+from benchmark_functions import bench
+
+def _run(**kwargs):
+    options = dict(dims=(1, 3), batch_sizes=(1, 10), repeat=1, min_time=0.0, import_repeat=0)
+    options.update(kwargs)
+    return bench.run_suite(**options)
+
+def test_run_suite():
+    """Test the benchmark matrix and result fields."""
+    report = _run(functions=["Rastrigin", "Forrester"])
+    
+    cases = {(r["function"], r["dim"], r["batch_size"], r["mode"]) for r in report["results"]}
+    assert ("Rastrigin", 3, 10, "batch") in cases
+    assert ("Rastrigin", 3, 1, "scalar") in cases
+    assert ("Rastrigin", 3, 10, "scalar") not in cases
+    assert not any(name == "Forrester" and dim == 3 for name, dim, _, _ in cases)
+    
+    for result in report["results"]:
+        assert result["points_per_s"] > 0
+        assert result["latency_s"] > 0
+        assert result["peak_bytes"] >= 0
+    assert "numpy" in report["metadata"]
+    
+    assert not _run(functions=["Ackley"], dims=(100,), max_elements=50)["results"]
+    with pytest.raises(ValueError):
+        _run(functions=["Sphere"])
+
+def test_compare_against_baseline():
+    """Test regression detection with thresholds."""
+    current = _run(functions=["Ackley"], dims=(2,), batch_sizes=(10,), modes=("batch",))
+    assert bench.compare(current, current) == []
+    
+    baseline = json.loads(json.dumps(current))
+    baseline["results"][0]["points_per_s"] *= 2
+    regressions = bench.compare(current, baseline, threshold=0.2)
+    assert len(regressions) == 1
+    assert regressions[0]["metric"] == "points_per_s"
+    assert bench.compare(current, baseline, threshold=0.6) == []
+    
+    baseline["results"][0]["peak_bytes"] = current["results"][0]["peak_bytes"] / 2
+    assert len(bench.compare(current, baseline, threshold=0.6, memory_threshold=0.1)) == 1
+
+def test_main_writes_json(tmp_path):
+    """Test the command line entry point."""
+    output = tmp_path / "results.json"
+    args = ["--functions", "Rastrigin", "--dims", "2", "--batch-sizes", "5",
+            "--repeat", "1", "--min-time", "0", "--import-repeat", "0", "--output", str(output)]
+    assert bench.main(args) == 0
+    assert json.loads(output.read_text())["results"]
+    
+    assert bench.main(args + ["--baseline", str(output), "--threshold", "1.0"]) == 0
+
+def test_import_time_cases():
+    """Test that import times are measured and compared."""
+    current = _run(functions=["Rastrigin"], dims=(2,), batch_sizes=(1,), modes=("batch",), import_repeat=1)
+    cases = {r["case"]: r for r in current["imports"]}
+    assert set(cases) == set(bench.IMPORT_CASES)
+    assert all(0 < r["import_s"] < 30 for r in cases.values())
+    
+    baseline = json.loads(json.dumps(current))
+    baseline["imports"][0]["import_s"] /= 10
+    regressions = bench.compare(current, baseline, threshold=0.5)
+    assert [r["metric"] for r in regressions] == ["import_s"]
+    
+    del baseline["imports"]
+    assert bench.compare(current, baseline, threshold=0.5) == []
@@ -0,0 +1,184 @@
+"""
+Tests for the out-of-bounds policies.
+"""
+
+import copy
+import pickle
+import numpy as np
+import pytest
+from benchmark_functions import Griewank, Rastrigin, GramacyLee
+from benchmark_functions.bounds import Bounds
+
+def test_bounds_policy_validation():
+    """Test that unknown policies are rejected."""
+    with pytest.raises(ValueError):
+        Rastrigin(bounds_policy="ignore")
+    
+    func = Rastrigin()
+    assert func.bounds_policy == "raise"
+    with pytest.raises(ValueError):
+        func.bounds_policy = "ignore"
+
+def test_bounds_policy_raise():
+    """Test the default 'raise' policy."""
+    func = Rastrigin()
+    with pytest.raises(ValueError):
+        func([6.0, 0.0])
+    with pytest.raises(ValueError):
+        func.evaluate_batch([[0.0, 0.0], [6.0, 0.0]])
+
+def test_bounds_policy_clip():
+    """Test the 'clip' policy."""
+    func = Rastrigin(bounds_policy="clip")
+    assert np.isclose(func([6.0, 0.0]), Rastrigin()([5.12, 0.0]))
+    
+    values = func.evaluate_batch([[0.0, 0.0], [-9.0, 7.0]])
+    assert np.allclose(values, [0.0, Rastrigin()([-5.12, 5.12])])
+
+def test_bounds_policy_penalty():
+    """Test the 'penalty' policy."""
+    func = Rastrigin(bounds_policy="penalty")
+    values = func.evaluate_batch([[0.0, 0.0], [8.12, 0.0], [9.12, 0.0]])
+    
+    assert np.isclose(values[0], 0.0)
+    assert np.isclose(values[1], func.penalty + 3.0)
+    assert values[2] > values[1]  # Penalty grows with the distance to the box
+
+def test_bounds_policy_nan():
+    """Test the 'nan' policy."""
+    func = GramacyLee(bounds_policy="nan")
+    values = func.evaluate_batch([[1.0], [0.0], [3.0]])
+    
+    assert np.isclose(values[0], GramacyLee()([1.0]))
+    assert np.all(np.isnan(values[1:]))
+
+def test_bounds_policy_trusted():
+    """Test the 'trusted' policy skips the bounds check."""
+    func = Rastrigin(bounds_policy="trusted")
+    assert np.isfinite(func([6.0, 0.0]))
+    
+    # Shape is still validated
+    with pytest.raises(ValueError):
+        func([0.0])
+
+def test_check_bounds_batch():
+    """Test batched bounds checking."""
+    func = Rastrigin(dim=3)
+    mask = func.check_bounds_batch([[0.0, 0.0, 0.0], [0.0, 5.2, 0.0], [-5.12, 5.12, 0.0]])
+    assert mask.tolist() == [True, False, True]
+
+
+def test_bounds_policy_gradient():
+    """Test that gradients follow the bounds policy."""
+    X = np.array([[0.5, 0.5], [8.12, 0.0]])
+    
+    with pytest.raises(ValueError):
+        Rastrigin().gradient(X)
+    
+    values, grads = Rastrigin(bounds_policy="nan").value_and_grad(X)
+    assert np.isfinite(values[0]) and np.all(np.isfinite(grads[0]))
+    assert np.isnan(values[1]) and np.all(np.isnan(grads[1]))
+    
+    func = Rastrigin(bounds_policy="penalty")
+    values, grads = func.value_and_grad(X)
+    assert np.isclose(values[1], func.penalty + 3.0)
+    assert np.allclose(grads[1], [1.0, 0.0])  # Points back towards the box
+
+def test_compact_uniform_bounds():
+    """Test that uniform boxes are stored as two scalars."""
+    bounds = Bounds.uniform(-5.12, 5.12, dim=10**7)
+    assert bounds.is_uniform
+    assert len(bounds) == 10**7
+    assert bounds[0] == bounds[-1] == (-5.12, 5.12)
+    with pytest.raises(IndexError):
+        bounds[10**7]
+    
+    array = bounds.array()
+    assert array.shape == (10**7, 2) and array.strides == (0, 8)
+    assert not array.flags.writeable
+    assert bounds.array(np.float32).dtype == np.float32
+    assert "Bounds.uniform(-5.12, 5.12, dim=10000000)" == repr(bounds)
+    assert len(pickle.dumps(bounds)) < 200
+
+def test_heterogeneous_bounds():
+    """Test per-dimension bounds and list compatibility."""
+    pairs = [(0, 1), (-2, 2), (5, 6), (0, 1)]
+    bounds = Bounds(pairs)
+    assert not bounds.is_uniform
+    assert bounds == pairs and list(bounds) == pairs
+    assert bounds[1:3] == [(-2.0, 2.0), (5.0, 6.0)]
+    assert np.array_equal(bounds.array(), pairs)
+    assert "1 more" in repr(bounds)
+    assert pickle.loads(pickle.dumps(bounds)) == bounds
+    assert Bounds([(1, 2), (1, 2)]) == Bounds.uniform(1, 2, 2)
+    assert bounds != Bounds.uniform(0, 1, 4)
+    with pytest.raises(ValueError):
+        Bounds([1, 2, 3])
+
+def test_function_bounds_attribute():
+    """Test that the bounds attribute stays list-compatible and settable."""
+    func = Rastrigin(dim=3)
+    assert func.bounds == [(-5.12, 5.12)] * 3
+    assert func.bounds.is_uniform
+    
+    func.bounds = [(-1, 1), (-2, 2), (-3, 3)]
+    assert not func.check_bounds([1.5, 0.0, 0.0])
+    assert func.check_bounds([0.5, 1.5, 2.5])
+    with pytest.raises(ValueError):
+        func.bounds = [(-1, 1)]
+    
+    big = Rastrigin(dim=10**6)
+    assert len(repr(big)) < 200
+
+def test_slotted_instances_pickle_compactly():
+    """Test __slots__ and the constructor-level pickle state."""
+    func = Griewank(dim=10**5, bounds_policy="clip")
+    func.penalty = 5.0
+    assert not hasattr(func, "__dict__")
+    with pytest.raises(AttributeError):
+        func.extra = 1
+    
+    data = pickle.dumps(func)
+    assert len(data) < 1000
+    restored = pickle.loads(data)
+    assert restored.bounds_policy == "clip" and restored.penalty == 5.0
+    X = np.random.default_rng(0).uniform(-600, 600, size=(4, 10**5))
+    assert np.array_equal(restored.evaluate_batch(X), func.evaluate_batch(X))
+    assert copy.deepcopy(func)(X[0]) == func(X[0])
+
+class _Scaled(Rastrigin):
+    """Subclass without __slots__ keeping its own attributes."""
+    
+    def __init__(self, dim: int, scale: float):
+        super().__init__(dim=dim)
+        self.scale = scale
+    
+    def _evaluate(self, X):
+        return self.scale * super()._evaluate(X)
+
+def test_unslotted_subclass_pickle_keeps_attributes():
+    """Test that instance attributes of a subclass survive a pickle round trip."""
+    func = _Scaled(dim=3, scale=2.0)
+    func.extra = "kept"
+    restored = pickle.loads(pickle.dumps(func))
+    assert restored.scale == 2.0 and restored.extra == "kept"
+    assert restored([1.0, 2.0, 3.0]) == func([1.0, 2.0, 3.0])
+
+def test_bounds_views_cached_and_contains():
+    """Test per-dtype caching of the views and the single-point check."""
+    bounds = Bounds.uniform(-5.12, 5.12, dim=3)
+    assert bounds.array(np.float32) is bounds.array(np.float32)
+    assert bounds.uniform_pair(np.float64) is bounds.uniform_pair(np.float64)
+    assert not bounds.uniform_pair(np.float64).flags.writeable
+    assert bounds.contains(np.zeros(3)) and not bounds.contains(np.array([0.0, 6.0, 0.0]))
+    assert not bounds.contains(np.array([np.nan, 0.0, 0.0]))
+
+    # The float32 rounding of 0.1 is above 0.1 yet inside the float32 box
+    edge = np.float32(0.1)
+    assert float(edge) > 0.1 and Bounds.uniform(-1, 0.1, dim=3).contains(np.array([edge, 0, 0], dtype=np.float32))
+    func = Rastrigin(dim=3, dtype=np.float32)
+    func.bounds = Bounds.uniform(-1, 0.1, dim=3)
+    assert func([edge, 0, 0]) == func.evaluate_batch([[edge, 0, 0]])[0]
+
+    mixed = Bounds([(0, 1), (-1, 2)])
+    assert mixed.contains(np.array([0.5, 2.0])) and not mixed.contains(np.array([1.5, 0.0]))
@@ -0,0 +1,93 @@
+"""
+Tests for the LRU memoization wrapper.
+"""
+
+import pickle
+import numpy as np
+import pytest
+from benchmark_functions import CachedFunction, Rastrigin
+
+def test_cached_call():
+    """Test hits and misses for single points."""
+    func = CachedFunction(Rastrigin())
+    
+    assert np.isclose(func([1.0, 1.0]), 2.0)
+    assert np.isclose(func(np.array([1.0, 1.0])), 2.0)
+    assert np.isclose(func([0.0, -0.0]), 0.0)
+    assert np.isclose(func([-0.0, 0.0]), 0.0)
+    
+    stats = func.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 2
+    assert stats["entries"] == 2
+    assert np.isclose(stats["hit_rate"], 0.5)
+
+def test_cached_batch_evaluates_only_misses():
+    """Test that batched lookups only evaluate missing points once."""
+    calls = []
+    
+    class CountingRastrigin(Rastrigin):
+        def _evaluate(self, X):
+            calls.append(len(X))
+            return super()._evaluate(X)
+    
+    func = CachedFunction(CountingRastrigin())
+    func([1.0, 1.0])
+    X = np.array([[1.0, 1.0], [0.5, 0.5], [0.5, 0.5], [2.0, 2.0]])
+    
+    assert np.allclose(func.evaluate_batch(X), Rastrigin().evaluate_batch(X))
+    assert calls == [1, 2]
+    assert func.stats()["hits"] == 1
+    assert func.stats()["misses"] == 4
+    
+    func.evaluate_batch(X)
+    assert calls == [1, 2]
+
+def test_cache_eviction():
+    """Test LRU eviction by entry count and by memory budget."""
+    func = CachedFunction(Rastrigin(), max_entries=2)
+    func([1.0, 1.0])
+    func([2.0, 2.0])
+    func([1.0, 1.0])  # Refresh so [2, 2] is least recently used
+    func([3.0, 3.0])
+    
+    assert len(func) == 2
+    assert func.stats()["evictions"] == 1
+    func([1.0, 1.0])
+    assert func.stats()["hits"] == 2
+    
+    func = CachedFunction(Rastrigin(), max_entries=None, max_bytes=500)
+    func.evaluate_batch(np.random.default_rng(0).uniform(-5, 5, size=(100, 2)))
+    assert func.stats()["bytes"] <= 500
+    assert len(func) < 100
+
+def test_cache_quantization():
+    """Test that quantized keys share entries."""
+    func = CachedFunction(Rastrigin(), quantum=1e-3)
+    first = func([1.0, 1.0])
+    assert func([1.0 + 1e-5, 1.0]) == first
+    assert func.stats()["hits"] == 1
+    
+    with pytest.raises(ValueError):
+        CachedFunction(Rastrigin(), quantum=0.0)
+
+def test_cache_forwards_attributes():
+    """Test attribute forwarding, clearing and pickling."""
+    func = CachedFunction(Rastrigin(dim=3))
+    assert func.dim == 3
+    assert func.get_global_minimum()[0] == 0.0
+    
+    func([0.0, 0.0, 0.0])
+    func.clear()
+    assert len(func) == 0 and func.stats()["misses"] == 0
+    
+    restored = pickle.loads(pickle.dumps(func))
+    assert restored.dim == 3
+
+def test_cached_batch_dtype():
+    """Test that batches come back in the function's dtype."""
+    func = CachedFunction(Rastrigin(dtype=np.float32))
+    X = np.array([[1.0, 1.0], [0.5, 0.5]])
+    func([1.0, 1.0])
+    values = func.evaluate_batch(X)
+    assert values.dtype == np.float32
+    assert np.array_equal(values, Rastrigin(dtype=np.float32).evaluate_batch(X))
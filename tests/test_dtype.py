@@ -0,0 +1,93 @@
+"""
+Tests for the configurable computation dtype.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (Ackley, Forrester, GramacyLee, Griewank, Rastrigin,
+                                 Rosenbrock, Schubert, Schwefel)
+from benchmark_functions.backends import numba_available
+
+FUNCTIONS = [
+    (Ackley, 1e-5), (Forrester, 1e-5), (GramacyLee, 1e-5), (Griewank, 1e-5),
+    (Rastrigin, 1e-5), (Rosenbrock, 1e-5), (Schubert, 1e-2), (Schwefel, 1e-4),
+]
+
+def _make(cls, **kwargs):
+    if cls in (Forrester, GramacyLee):
+        return cls(**kwargs)
+    return cls(dim=5, **kwargs)
+
+def _sample(func, n=500):
+    rng = np.random.default_rng(0)
+    bounds = func._bounds_array
+    return rng.uniform(bounds[:, 0], bounds[:, 1], size=(n, func.dim)).astype(func.dtype)
+
+def test_dtype_validation():
+    """Test that only float32 and float64 are accepted."""
+    assert Rastrigin().dtype == np.float64
+    assert Rastrigin(dtype="float32").dtype == np.float32
+    with pytest.raises(ValueError):
+        Rastrigin(dtype=np.int64)
+    with pytest.raises(ValueError):
+        Rastrigin(dtype=np.float16)
+    with pytest.raises(ValueError):
+        Rastrigin().evaluate_batch(np.zeros((2, 2)), dtype=np.complex128)
+
+@pytest.mark.parametrize("cls, rtol", FUNCTIONS)
+def test_float32_matches_float64(cls, rtol):
+    """Test that float32 results stay in float32 and agree with float64."""
+    func32 = _make(cls, dtype=np.float32)
+    func64 = _make(cls)
+    X = _sample(func32)
+
+    values = func32.evaluate_batch(X)
+    assert values.dtype == np.float32
+    expected = func64.evaluate_batch(X.astype(np.float64))
+    assert np.all(np.abs(values - expected) <= rtol * np.maximum(np.abs(expected), 1))
+
+    values, grads = func32.value_and_grad(X)
+    assert values.dtype == np.float32 and grads.dtype == np.float32
+    assert isinstance(func32(X[0]), np.float32)
+
+@pytest.mark.parametrize("cls, rtol", FUNCTIONS)
+def test_per_call_dtype(cls, rtol):
+    """Test that the dtype can be overridden for a single call."""
+    func = _make(cls)
+    X = _sample(func)
+
+    values = func.evaluate_batch(X, dtype=np.float32)
+    assert values.dtype == np.float32
+    assert func.evaluate_batch(X).dtype == np.float64
+    assert func.gradient(X, dtype=np.float32).dtype == np.float32
+    assert func.evaluate_threaded(X, n_threads=2, chunk_rows=64, dtype=np.float32).dtype == np.float32
+
+def test_float32_bounds_edges():
+    """Test that points on the float32 bounds are inside the box."""
+    func = Rastrigin(dim=3, dtype=np.float32)
+    X = np.array([[-5.12, 5.12, 0.0]])
+    assert func.check_bounds_batch(X).all()
+    assert func.evaluate_batch(X).dtype == np.float32
+
+@pytest.mark.parametrize("policy", ["clip", "penalty", "nan"])
+def test_float32_bounds_policies(policy):
+    """Test that the bounds policies keep the computation dtype."""
+    func = Rastrigin(bounds_policy=policy, dtype=np.float32)
+    values, grads = func.value_and_grad([[0.0, 0.0], [6.0, 0.0]])
+    assert values.dtype == np.float32 and grads.dtype == np.float32
+
+def test_float32_grid():
+    """Test that grids are built in the function dtype."""
+    for func in (Rastrigin(dtype=np.float32), Rosenbrock(dtype=np.float32)):
+        x, y, Z = func.evaluate_grid(16)
+        assert x.dtype == np.float32 and Z.dtype == np.float32
+
+@pytest.mark.skipif(not numba_available(), reason="Numba is not installed")
+def test_float32_numba():
+    """Test that the compiled kernels return float32 for float32 input."""
+    for cls, rtol in FUNCTIONS:
+        func = _make(cls, dtype=np.float32, backend="numba")
+        X = _sample(func)
+        values = func.evaluate_batch(X)
+        assert values.dtype == np.float32
+        assert np.allclose(values, _make(cls).evaluate_batch(X.astype(np.float64)), rtol=rtol, atol=rtol)
@@ -62,4 +62,42 @@ def test_forrester_string_representation():
     """Test Forrester function string representation."""
     func = Forrester()
     assert str(func) == "Forrester(dim=1)"
-    assert repr(func).startswith("Forrester(name='Forrester', dim=1") 
\ No newline at end of file
+    assert repr(func).startswith("Forrester(name='Forrester', dim=1") 
+
+def test_forrester_batch_evaluation():
+    """Test Forrester function batched evaluation."""
+    func = Forrester()
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0, 1, size=(50, 1))
+    
+    # Batched values match the scalar path row by row
+    values = func.evaluate_batch(X)
+    assert values.shape == (50,)
+    assert np.allclose(values, [func(x) for x in X])
+    
+    # Test with invalid shape
+    with pytest.raises(ValueError):
+        func.evaluate_batch(X[0])
+
+
+def test_forrester_gradient():
+    """Test Forrester analytic gradient against central differences."""
+    func = Forrester()
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0.01, 0.99, size=(10, 1))
+    
+    values, grads = func.value_and_grad(X)
+    assert np.allclose(values, func.evaluate_batch(X))
+    
+    h = 1e-6
+    for i in range(func.dim):
+        step = np.zeros(func.dim)
+        step[i] = h
+        numeric = (func.evaluate_batch(X + step) - func.evaluate_batch(X - step)) / (2 * h)
+        assert np.allclose(grads[:, i], numeric, rtol=1e-5, atol=1e-5)
+    
+    # Single point returns a scalar and a (dim,) gradient
+    value, grad = func.value_and_grad(X[0])
+    assert np.isclose(value, func(X[0]))
+    assert np.allclose(func.gradient(X[0]), grad)
+    assert grad.shape == (func.dim,)
\ No newline at end of file
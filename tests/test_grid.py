@@ -0,0 +1,81 @@
+"""
+Tests for grid and landscape evaluation.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (
+    Ackley, Forrester, GramacyLee, Griewank, Rastrigin, Rosenbrock, Schubert, Schwefel,
+)
+
+def _mesh_reference(func, x, y, axes=(0, 1), base_point=None):
+    if base_point is None:
+        base_point = func._bounds_array.mean(axis=1)
+    XX, YY = np.meshgrid(x, y)
+    points = np.tile(base_point, (XX.size, 1))
+    points[:, axes[0]] = XX.ravel()
+    points[:, axes[1]] = YY.ravel()
+    return func.evaluate_batch(points).reshape(XX.shape)
+
+@pytest.mark.parametrize("func", [Ackley(), Griewank(), Rastrigin(), Rosenbrock(), Schubert(), Schwefel()],
+                         ids=lambda f: type(f).__name__)
+def test_surface_matches_meshgrid(func):
+    """Test 2D surfaces against a flattened meshgrid evaluation."""
+    x, y, Z = func.evaluate_grid((31, 17))
+    assert x.shape == (31,) and y.shape == (17,)
+    assert Z.shape == (17, 31)
+    assert np.allclose(Z, _mesh_reference(func, x, y))
+
+@pytest.mark.parametrize("func", [Forrester(), GramacyLee()], ids=lambda f: type(f).__name__)
+def test_curve(func):
+    """Test 1D curves."""
+    x, values = func.evaluate_grid(101)
+    assert np.isclose(x[0], func.bounds[0][0]) and np.isclose(x[-1], func.bounds[0][1])
+    assert np.allclose(values, func.evaluate_batch(x[:, np.newaxis]))
+
+@pytest.mark.parametrize("func", [Ackley(dim=5), Griewank(dim=5), Schubert(dim=5)],
+                         ids=lambda f: type(f).__name__)
+def test_slice_of_higher_dimension(func):
+    """Test 2D slices with a custom region, axes and base point."""
+    base_point = np.linspace(-1, 1, 5)
+    region = ((-2, 2), (-1, 3))
+    x, y, Z = func.evaluate_grid(20, region=region, axes=(3, 1), base_point=base_point)
+    
+    assert x[0] == -2 and y[-1] == 3
+    assert np.allclose(Z, _mesh_reference(func, x, y, axes=(3, 1), base_point=base_point))
+
+def test_tiled_evaluation():
+    """Test that tiling doesn't change the result."""
+    func = Ackley()
+    _, _, whole = func.evaluate_grid(40)
+    _, _, tiled = func.evaluate_grid(40, tile_rows=7)
+    assert np.allclose(whole, tiled)
+
+def test_grid_bounds_and_axes():
+    """Test region validation and invalid axes."""
+    with pytest.raises(ValueError):
+        Rastrigin().evaluate_grid(10, region=((-10, 10), (-1, 1)))
+    with pytest.raises(ValueError):
+        Rastrigin().evaluate_grid(10, axes=(0, 0))
+    
+    # Outside the bounds the separable path falls back to the policy
+    x, y, Z = Rastrigin(bounds_policy="nan").evaluate_grid(11, region=((-10, 10), (-1, 1)))
+    assert np.isnan(Z[:, 0]).all() and not np.isnan(Z[:, 5]).any()
+
+class _DoubledRastrigin(Rastrigin):
+    """Subclass overriding _evaluate but inheriting the term decomposition."""
+    
+    def _evaluate(self, X):
+        return 2 * super()._evaluate(X)
+
+def test_grid_overridden_formula_and_metrics():
+    """Test that overrides and metrics take the generic path."""
+    x, y, Z = _DoubledRastrigin().evaluate_grid(20)
+    X, Y = np.meshgrid(x, y)
+    expected = Rastrigin().evaluate_batch(np.column_stack([X.ravel(), Y.ravel()])).reshape(Z.shape)
+    assert np.allclose(Z, 2 * expected)
+    
+    func = Rastrigin()
+    metrics = func.enable_metrics()
+    func.evaluate_grid(20)
+    assert metrics.points == 400
@@ -65,4 +65,48 @@ def test_griewank_string_representation():
     """Test Griewank function string representation."""
     func = Griewank()
     assert str(func) == "Griewank (dim=2)"
-    assert repr(func).startswith("Griewank(name='Griewank', dim=2") 
\ No newline at end of file
+    assert repr(func).startswith("Griewank(name='Griewank', dim=2") 
+
+def test_griewank_batch_evaluation():
+    """Test Griewank function batched evaluation."""
+    func = Griewank(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-600, 600, size=(50, 3))
+    
+    # Batched values match the scalar path row by row
+    values = func.evaluate_batch(X)
+    assert values.shape == (50,)
+    assert np.allclose(values, [func(x) for x in X])
+    
+    # Test with invalid shape
+    with pytest.raises(ValueError):
+        func.evaluate_batch(X[0])
+
+
+def test_griewank_gradient():
+    """Test Griewank analytic gradient against central differences."""
+    func = Griewank(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-600, 600, size=(10, 3))
+    
+    values, grads = func.value_and_grad(X)
+    assert np.allclose(values, func.evaluate_batch(X))
+    
+    h = 1e-6
+    for i in range(func.dim):
+        step = np.zeros(func.dim)
+        step[i] = h
+        numeric = (func.evaluate_batch(X + step) - func.evaluate_batch(X - step)) / (2 * h)
+        assert np.allclose(grads[:, i], numeric, rtol=1e-5, atol=1e-5)
+    
+    # Single point returns a scalar and a (dim,) gradient
+    value, grad = func.value_and_grad(X[0])
+    assert np.isclose(value, func(X[0]))
+    assert np.allclose(func.gradient(X[0]), grad)
+    assert grad.shape == (func.dim,)
+    
+    # A zero cosine factor is handled without dividing by it
+    x = np.array([np.pi / 2, 1.0, 2.0])
+    _, grad = func.value_and_grad(x)
+    assert np.all(np.isfinite(grad))
+    assert np.isclose(grad[0], x[0] / 2000 + np.cos(1.0 / np.sqrt(2)) * np.cos(2.0 / np.sqrt(3)))
\ No newline at end of file
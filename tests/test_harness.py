@@ -0,0 +1,112 @@
+"""
+Tests for the optimizer benchmarking harness.
+"""
+
+import importlib.util
+
+import numpy as np
+import pytest
+from benchmark_functions import Rastrigin, Schubert, Schwefel
+from benchmark_functions.harness import (DEFAULT_PRECISIONS, BudgetExhausted, Problem, RandomSearch, RunRecord,
+                                         ScipyGlobal, ScipyMinimize, ecdf, expected_running_time,
+                                         reference_minimum, run_experiment, run_single, summarize)
+
+PRECISIONS = np.array([10.0, 1.0, 0.1])
+
+def _record(hits, evaluations=100, optimizer="opt", function="f", dim=2):
+    return RunRecord(optimizer, function, dim, 0, 100, evaluations, 0.0, 0.0, PRECISIONS,
+                     np.array(hits, dtype=float), 0.0)
+
+def test_problem_tracks_hits_and_budget():
+    """Test evaluations-to-target counting, truncation at the budget and early stop."""
+    problem = Problem(Rastrigin(dim=2), budget=6, precisions=PRECISIONS, seed=0)
+    assert problem.f_opt == 0
+    assert Rastrigin(dim=2).check_bounds(problem.x0)
+
+    # Rastrigin(0, 0) = 0 and Rastrigin(1, 0) = 1
+    far = [3.5, 3.5]
+    problem.evaluate_batch([far, [1.0, 0.0], far])
+    assert list(problem.hits) == [2, 2, np.inf]
+    assert problem(far) > 1 and problem.evaluations == 4
+
+    values = problem.evaluate_batch([far, [0.0, 0.0], far])
+    assert len(values) == 2
+    assert list(problem.hits) == [2, 2, 6]
+    assert problem.best_value == 0
+    with pytest.raises(BudgetExhausted):
+        problem([0.0, 0.0])
+
+    problem = Problem(Rastrigin(dim=2), budget=100, precisions=PRECISIONS, seed=0)
+    problem([0.0, 0.0])
+    with pytest.raises(BudgetExhausted):
+        problem([0.0, 0.0])
+    assert problem.evaluations == 1
+
+def test_reference_minimum_per_dimension():
+    """Test references from the minimum location, and rejection without one."""
+    # Schwefel's stated minimum 0 is below f(x*) ~ 1.27e-5 dim, out of reach of the fine targets
+    func = Schwefel(dim=5)
+    assert reference_minimum(func) == func(func.get_global_minimum()[1]) > 5e-5
+    problem = Problem(func, budget=10, precisions=DEFAULT_PRECISIONS, seed=0)
+    problem(func.get_global_minimum()[1])
+    assert np.all(np.isfinite(problem.hits))
+
+    # Schubert states its 2D value without a location, so no dim has a valid reference
+    with pytest.raises(ValueError):
+        Problem(Schubert(dim=5), budget=10, precisions=PRECISIONS, seed=0)
+    with pytest.warns(UserWarning, match="schubert"):
+        records = run_experiment({"random": RandomSearch()}, ["schubert", "schwefel"], dims=[2, 5],
+                                 seeds=[0], processes=1, budget_per_dim=20)
+    assert [(r.function, r.dim) for r in records] == [("schwefel", 2), ("schwefel", 5)]
+    assert records[1].f_opt == reference_minimum(Schwefel(dim=5))
+
+def test_expected_running_time_and_ecdf():
+    """Test ERT and ECDF on hand-made records."""
+    records = [_record([1, 10, 40]), _record([2, 20, np.inf], evaluations=100), _record([3, np.inf, np.inf])]
+    erts = expected_running_time(records, precision=1.0)
+    assert erts[("opt", "f", 2)] == pytest.approx((10 + 20 + 100) / 2)
+    assert expected_running_time(records, precision=0.1)[("opt", "f", 2)] == 40 + 100 + 100
+    assert expected_running_time(records[2:], precision=0.1)[("opt", "f", 2)] == np.inf
+    with pytest.raises(ValueError):
+        expected_running_time(records, precision=0.5)
+
+    budgets, fractions = ecdf(records, budgets=[0.5, 1.5, 10, 25])[("opt", 2)]
+    # Runtimes per dimension: 0.5, 1, 1.5, 5, 10, 20 out of 9 (run, target) pairs
+    assert list(fractions * 9) == pytest.approx([1, 3, 5, 6])
+
+    rows = summarize(records, precisions=(10.0, 0.1))
+    assert rows[0]["runs"] == 3 and rows[0]["successes"] == 1
+    assert rows[0]["ert_10"] == 2 and rows[0]["ert_0.1"] == 240
+
+def test_run_experiment_matrix():
+    """Test the run matrix, fixed-dimension functions and reproducibility."""
+    options = dict(budget_per_dim=50, precisions=PRECISIONS)
+    records = run_experiment({"random": RandomSearch(batch_size=20)}, ["rastrigin", "forrester"],
+                             dims=(1, 3), seeds=range(2), processes=1, **options)
+    assert [(r.function, r.dim, r.seed) for r in records] == [
+        ("rastrigin", 1, 0), ("rastrigin", 1, 1), ("rastrigin", 3, 0), ("rastrigin", 3, 1),
+        ("forrester", 1, 0), ("forrester", 1, 1)]
+    for record in records:
+        assert record.evaluations <= record.budget == 50 * record.dim
+        assert np.all(np.diff(record.hits[np.isfinite(record.hits)]) >= 0)
+
+    again = run_single("random", RandomSearch(batch_size=20), "rastrigin", 3, 1, **options)
+    assert np.array_equal(again.hits, records[3].hits) and again.best_value == records[3].best_value
+
+def test_run_experiment_process_pool():
+    """Test that pooled runs match the inline ones."""
+    args = ({"random": RandomSearch(batch_size=10)}, ["rastrigin"], (2,), range(3))
+    inline = run_experiment(*args, processes=1, budget_per_dim=30)
+    pooled = run_experiment(*args, processes=2, budget_per_dim=30)
+    assert [r.best_value for r in inline] == [r.best_value for r in pooled]
+
+@pytest.mark.skipif(importlib.util.find_spec("scipy") is None, reason="SciPy not installed")
+def test_scipy_adapters():
+    """Test local and global SciPy optimizers with restarts."""
+    records = run_experiment({"lbfgsb": ScipyMinimize("L-BFGS-B"), "nm": ScipyMinimize("Nelder-Mead"),
+                              "de": ScipyGlobal("differential_evolution", maxiter=20)},
+                             ["rosenbrock"], dims=(2,), seeds=[0], processes=1, budget_per_dim=500)
+    by_name = {record.optimizer: record for record in records}
+    assert np.isfinite(by_name["lbfgsb"].hits[-1]) and np.isfinite(by_name["nm"].hits[-1])
+    assert by_name["de"].evaluations > 0
+    assert all(r.evaluations <= r.budget for r in records)
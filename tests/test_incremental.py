@@ -0,0 +1,140 @@
+"""
+Tests for incremental re-evaluation of a point under coordinate moves.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (Ackley, Forrester, Griewank, IncrementalEvaluator, Rastrigin,
+                                 Rosenbrock, Schubert, Schwefel, TransformedFunction)
+from benchmark_functions.incremental import _Aggregates
+
+CLASSES = [Ackley, Griewank, Rastrigin, Rosenbrock, Schubert, Schwefel]
+
+def _uniform(rng, func, idx=None):
+    bounds = func._bounds_array if idx is None else func._bounds_array[idx]
+    return rng.uniform(bounds[..., 0], bounds[..., 1])
+
+@pytest.mark.parametrize("cls", CLASSES)
+def test_updates_match_full_evaluation(cls):
+    """Test random moves of one or several coordinates against __call__."""
+    rng = np.random.default_rng(0)
+    func = cls(dim=12)
+    state = func.incremental(_uniform(rng, func))
+    assert np.isclose(state.value, func(state.x), rtol=1e-12, atol=1e-12)
+
+    for step in range(200):
+        idx = rng.choice(func.dim, size=1 + step % 4, replace=False)
+        values = _uniform(rng, func, idx)
+        proposed = state.propose(idx, values)
+        assert np.isclose(state.update(idx, values), proposed, rtol=1e-12, atol=1e-12)
+        assert np.isclose(state.value, func(state.x), rtol=1e-10, atol=1e-10)
+
+def test_propose_leaves_state_unchanged():
+    """Test that propose only previews a move."""
+    func = Rosenbrock(dim=6)
+    state = func.incremental(np.zeros(6))
+    x, value = state.x.copy(), state.value
+    assert state.propose([0, 5], [1.0, 1.0]) != value
+    assert np.array_equal(state.x, x)
+    assert state.value == value
+    with pytest.raises(ValueError):
+        state.x[0] = 1
+
+def test_zero_factors():
+    """Test that factors of exactly zero can be moved in and out of a product."""
+    prods = np.array([[2.0, 0.0, 3.0, 0.5]])
+    aggregates = _Aggregates(np.empty((0, 4)), prods)
+    assert aggregates.zeros == [1]
+    assert aggregates.products()[0] == 0
+
+    empty = np.empty((0, 1))
+    nonzero = aggregates.replaced((empty, prods[:, 1:2]), (empty, np.array([[4.0]])))
+    assert nonzero.zeros == [0]
+    assert nonzero.products()[0] == 12
+    assert nonzero.replaced((empty, np.array([[4.0]])), (empty, np.array([[0.0]]))).products()[0] == 0
+
+    # A Griewank factor near zero is divided out without losing the rest
+    func = Griewank(dim=4)
+    state = func.incremental(np.zeros(4))
+    assert np.isclose(state.update([0], [np.pi / 2]), func([np.pi / 2, 0, 0, 0]))
+    assert np.isclose(state.update([0], [0.0]), 0.0, atol=1e-15)
+
+def test_long_products_neither_underflow_nor_drift():
+    """Test products of many small factors and many moves at a large dim."""
+    rng = np.random.default_rng(1)
+    func = Griewank(dim=5000)
+    x = _uniform(rng, func)
+    state = func.incremental(x)
+    assert np.isclose(state.value, func(x), rtol=1e-12)
+
+    for _ in range(6000):
+        i = int(rng.integers(func.dim))
+        state.update([i], [rng.uniform(-600, 600)])
+    assert np.isclose(state.value, func(state.x), rtol=1e-12)
+
+def test_ackley_and_rosenbrock_edges():
+    """Test Ackley's means and Rosenbrock's neighbor terms at the ends."""
+    ackley = Ackley(dim=3)
+    state = ackley.incremental([0.0, 0.0, 0.0])
+    assert np.isclose(state.value, 0, atol=1e-12)
+    assert np.isclose(state.update([1], [1.0]), ackley([0.0, 1.0, 0.0]))
+
+    rosenbrock = Rosenbrock(dim=3)
+    state = rosenbrock.incremental([1.0, 1.0, 1.0])
+    assert state.value == 0
+    assert np.isclose(state.update([2], [0.0]), rosenbrock([1.0, 1.0, 0.0]))
+    assert np.isclose(state.update([0], [0.0]), rosenbrock([0.0, 1.0, 0.0]))
+
+def test_bounds_policies():
+    """Test out-of-bounds moves under the raise and clip policies."""
+    state = Rastrigin(dim=3).incremental(np.zeros(3))
+    with pytest.raises(ValueError):
+        state.update([0], [6.0])
+    assert state.value == 0
+
+    func = Rastrigin(dim=3, bounds_policy="clip")
+    state = func.incremental(np.zeros(3))
+    assert np.isclose(state.update([0], [6.0]), func([6.0, 0.0, 0.0]))
+    assert np.isclose(state.update([0], [1.0]), func([1.0, 0.0, 0.0]))
+
+def test_invalid_moves_and_unsupported_functions():
+    """Test argument validation and functions without a decomposition."""
+    state = Schwefel(dim=3).incremental(np.zeros(3))
+    for idx, values in [([0, 0], [1.0, 2.0]), ([3], [1.0]), ([-1], [1.0]), ([0, 1], [1.0])]:
+        with pytest.raises(ValueError):
+            state.update(idx, values)
+    assert isinstance(state, IncrementalEvaluator)
+    assert state.update([], []) == state.value
+
+    with pytest.raises(NotImplementedError):
+        Forrester().incremental([0.5])
+    with pytest.raises(NotImplementedError):
+        TransformedFunction(Rastrigin(dim=3)).incremental(np.zeros(3))
+
+def test_float32():
+    """Test that the evaluator works in the function's dtype."""
+    rng = np.random.default_rng(2)
+    func = Rastrigin(dim=50, dtype=np.float32)
+    state = func.incremental(_uniform(rng, func))
+    assert state.x.dtype == np.float32
+    state.update([3, 7], [0.25, -1.5])
+    assert np.isclose(state.value, func(state.x), rtol=1e-5)
+
+class _DoubledRastrigin(Rastrigin):
+    __slots__ = ()
+
+    def _evaluate(self, X):
+        return 2 * super()._evaluate(X)
+
+def test_overridden_formula_and_metrics():
+    """Test that overridden formulas are rejected and metrics count every value."""
+    with pytest.raises(NotImplementedError):
+        _DoubledRastrigin(dim=3).incremental(np.zeros(3))
+
+    func = Rastrigin(dim=4)
+    metrics = func.enable_metrics()
+    state = func.incremental(np.zeros(4))
+    assert metrics.points == 1
+    state.propose([1], [0.5])
+    assert np.isclose(state.update([2], [0.25]), func([0.0, 0.0, 0.25, 0.0]))
+    assert metrics.points == 4
@@ -0,0 +1,80 @@
+"""
+Tests for evaluation metrics and hooks.
+"""
+
+import threading
+import numpy as np
+import pytest
+from benchmark_functions import Ackley, Rastrigin
+
+def test_metrics_disabled_by_default():
+    """Test that metrics are opt-in."""
+    func = Ackley()
+    assert func.metrics is None
+    func([0.0, 0.0])
+    assert func.metrics is None
+
+def test_metrics_counts():
+    """Test evaluation, point, gradient and violation counts."""
+    func = Rastrigin(bounds_policy="nan")
+    metrics = func.enable_metrics()
+    assert func.enable_metrics() is metrics
+    
+    func([0.0, 0.0])
+    func.evaluate_batch(np.zeros((10, 2)))
+    func.evaluate_batch([[0.0, 0.0], [6.0, 0.0], [0.0, -6.0]])
+    func.value_and_grad(np.zeros((4, 2)))
+    func.evaluate_threaded(np.zeros((100, 2)), n_threads=2, chunk_rows=10)
+    
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"] == 5
+    assert snapshot["points"] == 1 + 10 + 3 + 4 + 100
+    assert snapshot["gradient_calls"] == 1
+    assert snapshot["violations"] == 2
+    assert snapshot["total_time"] > 0
+    assert sum(count for _, count in snapshot["latency_histogram"]) == 5
+    assert snapshot["latency_histogram"][-1][0] == float("inf")
+    
+    metrics.reset()
+    assert metrics.snapshot()["calls"] == 0
+    
+    func.disable_metrics()
+    assert func.metrics is None
+
+def test_metrics_violations_under_raise():
+    """Test that rejected points are counted."""
+    func = Rastrigin()
+    metrics = func.enable_metrics()
+    with pytest.raises(ValueError):
+        func.evaluate_batch([[6.0, 0.0], [0.0, 0.0]])
+    assert metrics.snapshot()["violations"] == 1
+
+def test_metrics_hooks():
+    """Test pre and post hooks."""
+    func = Rastrigin()
+    seen = []
+    func.enable_metrics().add_hook(
+        pre=lambda f, X: seen.append(("pre", len(X))),
+        post=lambda f, X, values, elapsed: seen.append(("post", float(values.sum()))),
+    )
+    func.evaluate_batch([[0.0, 0.0], [1.0, 1.0]])
+    assert seen == [("pre", 2), ("post", 2.0)]
+
+def test_metrics_snapshot_from_thread():
+    """Test polling snapshots while another thread evaluates."""
+    func = Ackley()
+    metrics = func.enable_metrics()
+    snapshots = []
+    
+    def poll():
+        for _ in range(100):
+            snapshots.append(metrics.snapshot()["points"])
+    
+    thread = threading.Thread(target=poll)
+    thread.start()
+    for _ in range(100):
+        func.evaluate_batch(np.zeros((3, 2)))
+    thread.join()
+    
+    assert snapshots == sorted(snapshots)
+    assert metrics.snapshot()["points"] == 300
@@ -0,0 +1,67 @@
+"""
+Tests for out-of-core evaluation of .npy files.
+"""
+
+import os
+import numpy as np
+import pytest
+from benchmark_functions import Griewank, Rastrigin, evaluate_npy
+
+def _write_plan(tmp_path, n=1000, dim=3):
+    X = np.random.default_rng(0).uniform(-5, 5, size=(n, dim))
+    path = str(tmp_path / "plan.npy")
+    np.save(path, X)
+    return X, path
+
+def test_evaluate_npy(tmp_path):
+    """Test chunked evaluation into a memory-mapped output."""
+    X, input_path = _write_plan(tmp_path)
+    output_path = str(tmp_path / "values.npy")
+    func = Rastrigin(dim=3)
+    
+    calls = []
+    values = evaluate_npy(func, input_path, output_path, chunk_rows=300,
+                          progress=lambda done, total: calls.append((done, total)))
+    
+    assert isinstance(values, np.memmap)
+    assert np.allclose(values, func.evaluate_batch(X))
+    assert calls == [(300, 1000), (600, 1000), (900, 1000), (1000, 1000)]
+    assert not os.path.exists(output_path + ".ckpt.json")
+
+def test_evaluate_npy_resumes(tmp_path):
+    """Test resuming from the checkpoint after an interruption."""
+    X, input_path = _write_plan(tmp_path)
+    output_path = str(tmp_path / "values.npy")
+    func = Rastrigin(dim=3)
+    
+    def interrupt(done, total):
+        if done >= 400:
+            raise KeyboardInterrupt
+    
+    with pytest.raises(KeyboardInterrupt):
+        evaluate_npy(func, input_path, output_path, chunk_rows=200, progress=interrupt)
+    assert os.path.exists(output_path + ".ckpt.json")
+    
+    resumed = []
+    values = evaluate_npy(func, input_path, output_path, chunk_rows=200,
+                          progress=lambda done, total: resumed.append(done))
+    assert resumed == [600, 800, 1000]
+    assert np.allclose(values, func.evaluate_batch(X))
+
+def test_evaluate_npy_ignores_foreign_checkpoint(tmp_path):
+    """Test that a checkpoint for another function restarts the job."""
+    X, input_path = _write_plan(tmp_path)
+    output_path = str(tmp_path / "values.npy")
+    
+    with pytest.raises(KeyboardInterrupt):
+        evaluate_npy(Griewank(dim=3), input_path, output_path, chunk_rows=500,
+                     progress=lambda done, total: (_ for _ in ()).throw(KeyboardInterrupt))
+    
+    values = evaluate_npy(Rastrigin(dim=3), input_path, output_path, chunk_rows=500)
+    assert np.allclose(values, Rastrigin(dim=3).evaluate_batch(X))
+
+def test_evaluate_npy_shape_mismatch(tmp_path):
+    """Test that the input dimension is validated."""
+    _, input_path = _write_plan(tmp_path, dim=2)
+    with pytest.raises(ValueError):
+        evaluate_npy(Rastrigin(dim=3), input_path, str(tmp_path / "values.npy"))
@@ -0,0 +1,59 @@
+"""
+Tests for the process-pool evaluator.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (
+    Ackley, Forrester, GramacyLee, Griewank, Rastrigin, Rosenbrock, Schubert, Schwefel,
+    ParallelEvaluator,
+)
+
+FUNCTIONS = [
+    Ackley(dim=4), Griewank(dim=4), Rastrigin(dim=4), Rosenbrock(dim=4),
+    Schubert(dim=4), Schwefel(dim=4), Forrester(), GramacyLee(),
+]
+
+@pytest.mark.parametrize("func", FUNCTIONS, ids=lambda f: type(f).__name__)
+def test_parallel_matches_serial(func):
+    """Test that parallel results match serial evaluation in order."""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(func._bounds_array[:, 0], func._bounds_array[:, 1], size=(1000, func.dim))
+    
+    with ParallelEvaluator(func, n_workers=2, min_parallel_size=0) as evaluator:
+        assert np.allclose(evaluator(X), func.evaluate_batch(X))
+        # Second call reuses the warm pool and buffers
+        assert np.allclose(evaluator(X[:500]), func.evaluate_batch(X[:500]))
+
+def test_parallel_float32():
+    """Test that float32 functions share and return float32 buffers."""
+    func = Griewank(dim=5, dtype=np.float32)
+    X = np.random.default_rng(0).uniform(-600, 600, size=(1000, 5))
+    with ParallelEvaluator(func, n_workers=2, min_parallel_size=0) as evaluator:
+        values = evaluator(X)
+        assert values.dtype == np.float32
+        assert np.array_equal(values, func.evaluate_batch(X))
+        assert evaluator._in_shm.size < X.nbytes
+
+def test_parallel_small_batch_runs_serially():
+    """Test that small batches don't start the pool."""
+    evaluator = ParallelEvaluator(Rastrigin(), n_workers=2)
+    assert np.allclose(evaluator([[0.0, 0.0], [1.0, 1.0]]), [0.0, 2.0])
+    assert evaluator._executor is None
+    evaluator.close()
+
+def test_parallel_errors():
+    """Test shape validation and propagation of worker errors."""
+    with ParallelEvaluator(Rastrigin(), n_workers=2, min_parallel_size=0) as evaluator:
+        with pytest.raises(ValueError):
+            evaluator(np.zeros((10, 3)))
+        with pytest.raises(ValueError):
+            evaluator(np.full((10, 2), 6.0))
+
+def test_parallel_speedup_report():
+    """Test the speedup report."""
+    X = np.random.default_rng(0).uniform(-5, 5, size=(2000, 2))
+    with ParallelEvaluator(Rastrigin(), n_workers=2, min_parallel_size=0) as evaluator:
+        report = evaluator.speedup(X, repeat=1)
+    assert set(report) == {"serial_s", "parallel_s", "speedup"}
+    assert report["speedup"] > 0
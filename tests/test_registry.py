@@ -0,0 +1,104 @@
+"""
+Tests for the function registry and lazy imports.
+"""
+
+import subprocess
+import sys
+import numpy as np
+import pytest
+import benchmark_functions
+from benchmark_functions import (BenchmarkFunction, Rastrigin, get_function, list_functions, register_function,
+                                 registry)
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    """Let a test register functions without affecting the others."""
+    monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+
+def test_get_function():
+    """Test lookup by name with constructor arguments."""
+    func = get_function("rastrigin", dim=50)
+    assert isinstance(func, Rastrigin) and func.dim == 50
+    assert get_function("GramacyLee").name == "Gramacy and Lee"
+    assert get_function("gramacy-lee", dim=1).dim == 1
+    assert get_function("Ackley", bounds_policy="clip").bounds_policy == "clip"
+    
+    with pytest.raises(ValueError):
+        get_function("forrester", dim=3)
+    with pytest.raises(KeyError):
+        get_function("sphere")
+
+def test_list_functions_metadata():
+    """Test that the listed metadata matches the classes."""
+    infos = {info.name: info for info in list_functions()}
+    assert {"ackley", "forrester", "gramacy_lee", "griewank", "rastrigin",
+            "rosenbrock", "schubert", "schwefel"} <= set(infos)
+    for info in infos.values():
+        if not isinstance(info.target, str) or not info.target.startswith("benchmark_functions."):
+            continue
+        func = get_function(info.name, dim=info.dim or 2)
+        assert info.dim is None or info.dim == func.dim
+        assert np.allclose(func._bounds_array, info.bounds)
+        assert np.isclose(func.get_global_minimum()[0], info.minimum)
+
+def test_register_function(isolated_registry):
+    """Test registering classes and lazy import paths."""
+    register_function("my_rastrigin", Rastrigin, bounds=(-5.12, 5.12), minimum=0.0)
+    assert get_function("My-Rastrigin", dim=3).dim == 3
+    register_function("lazy_ackley", "benchmark_functions.ackley:Ackley")
+    assert get_function("lazy_ackley").name == "Ackley"
+    
+    with pytest.raises(ValueError):
+        register_function("rastrigin", Rastrigin)
+    register_function("rastrigin", Rastrigin, replace=True)
+
+class LegacySphere(BenchmarkFunction):
+    """Third-party function written against the earlier API: only __call__."""
+    
+    def __init__(self, dim: int = 2):
+        super().__init__(name="Sphere", dim=dim, bounds=[(-5.0, 5.0)] * dim)
+    
+    def __call__(self, x):
+        x = np.asarray(x)
+        if not self.check_bounds(x):
+            raise ValueError(f"Input point {x} is outside the function bounds")
+        return float(np.sum(x**2))
+
+def test_legacy_call_only_subclass(isolated_registry):
+    """Test that subclasses overriding only __call__ still instantiate and batch."""
+    register_function("sphere", LegacySphere)
+    func = get_function("sphere", dim=3)
+    assert func([1.0, 2.0, 2.0]) == 9.0
+    assert np.array_equal(func.evaluate_batch([[1.0, 2.0, 2.0], [0.0, 0.0, 3.0]]), [9.0, 9.0])
+    assert func.evaluate_batch(np.empty((0, 3))).shape == (0,)
+    
+    class Empty(BenchmarkFunction):
+        pass
+    
+    with pytest.raises(NotImplementedError):
+        Empty("empty", 1, [(0, 1)]).evaluate_batch([[0.5]])
+
+def test_entry_points(isolated_registry, tmp_path, monkeypatch):
+    """Test that functions advertised through entry points are found."""
+    dist_info = tmp_path / "third_party-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: third-party\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[benchmark_functions]\nplugin_griewank = benchmark_functions.griewank:Griewank\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    
+    assert "plugin_griewank" in registry.list_function_names()
+    assert get_function("plugin_griewank", dim=4).name == "Griewank"
+
+def test_lazy_package_import():
+    """Test that importing the package doesn't import the submodules or NumPy."""
+    code = ("import sys, benchmark_functions; "
+            "print(any(name in sys.modules for name in "
+            "('numpy', 'numba', 'benchmark_functions.base', 'benchmark_functions.ackley')))")
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert output.strip() == "False"
+    
+    assert "Ackley" in dir(benchmark_functions)
+    with pytest.raises(AttributeError):
+        benchmark_functions.Sphere
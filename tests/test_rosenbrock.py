@@ -65,4 +65,42 @@ def test_rosenbrock_string_representation():
     """Test Rosenbrock function string representation."""
     func = Rosenbrock()
     assert str(func) == "Rosenbrock (dim=2)"
-    assert repr(func).startswith("Rosenbrock(name='Rosenbrock', dim=2") 
\ No newline at end of file
+    assert repr(func).startswith("Rosenbrock(name='Rosenbrock', dim=2") 
+
+def test_rosenbrock_batch_evaluation():
+    """Test Rosenbrock function batched evaluation."""
+    func = Rosenbrock(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-2.048, 2.048, size=(50, 3))
+    
+    # Batched values match the scalar path row by row
+    values = func.evaluate_batch(X)
+    assert values.shape == (50,)
+    assert np.allclose(values, [func(x) for x in X])
+    
+    # Test with invalid shape
+    with pytest.raises(ValueError):
+        func.evaluate_batch(X[0])
+
+
+def test_rosenbrock_gradient():
+    """Test Rosenbrock analytic gradient against central differences."""
+    func = Rosenbrock(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-2, 2, size=(10, 3))
+    
+    values, grads = func.value_and_grad(X)
+    assert np.allclose(values, func.evaluate_batch(X))
+    
+    h = 1e-6
+    for i in range(func.dim):
+        step = np.zeros(func.dim)
+        step[i] = h
+        numeric = (func.evaluate_batch(X + step) - func.evaluate_batch(X - step)) / (2 * h)
+        assert np.allclose(grads[:, i], numeric, rtol=1e-5, atol=1e-5)
+    
+    # Single point returns a scalar and a (dim,) gradient
+    value, grad = func.value_and_grad(X[0])
+    assert np.isclose(value, func(X[0]))
+    assert np.allclose(func.gradient(X[0]), grad)
+    assert grad.shape == (func.dim,)
\ No newline at end of file
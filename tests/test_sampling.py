@@ -0,0 +1,108 @@
+"""
+Tests for the samplers drawing points in a function's domain.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import Griewank, Rastrigin, Rosenbrock
+from benchmark_functions.sampling import (SAMPLERS, HaltonSampler, LatinHypercubeSampler, SobolSampler,
+                                          UniformSampler, make_sampler, sobol_available)
+
+KINDS = [kind for kind in SAMPLERS if kind != "sobol" or sobol_available()]
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_points_inside_bounds(kind, dtype):
+    """Test shapes, dtypes and bounds for uniform and per-axis boxes."""
+    func = Rosenbrock(dim=6, dtype=dtype)
+    points = make_sampler(kind, func, seed=0).sample(256)
+    assert points.shape == (256, 6) and points.dtype == dtype
+    assert func.check_bounds_batch(points).all()
+
+    box = np.array([[0.0, 1.0], [-10.0, -5.0], [3.0, 3.5]])
+    points = make_sampler(kind, box, seed=0, dtype=dtype).sample(100)
+    assert np.all(points >= box[:, 0].astype(dtype)) and np.all(points <= box[:, 1].astype(dtype))
+
+@pytest.mark.parametrize("kind", [kind for kind in KINDS if kind != "lhs"])
+def test_streams_are_reproducible_and_chunk_invariant(kind):
+    """Test that a seed fixes the stream however it is cut into chunks."""
+    func = Rastrigin(dim=4)
+    whole = make_sampler(kind, func, seed=42).sample(64)
+    chunked = np.concatenate(list(make_sampler(kind, func, seed=42).chunks(64, chunk_size=16)))
+    assert np.array_equal(whole, chunked)
+    assert not np.array_equal(whole, make_sampler(kind, func, seed=43).sample(64))
+
+def test_chunks_reuse_buffer_and_feed_streaming():
+    """Test chunking with a reused buffer, feeding evaluate_stream."""
+    func = Griewank(dim=3)
+    sampler = UniformSampler(func, seed=0)
+    chunks = list(sampler.chunks(10, chunk_size=4, reuse=True))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert np.shares_memory(chunks[0], chunks[1])
+    assert sampler.index == 10
+
+    stream = func.evaluate_stream(UniformSampler(func, seed=0).chunks(10, chunk_size=4, reuse=True))
+    values = np.concatenate([values for _, values in stream])
+    assert np.allclose(values, func.evaluate_batch(UniformSampler(func, seed=0).sample(10)))
+
+    out = np.empty((5, 3))
+    assert sampler.sample(5, out=out) is out
+    with pytest.raises(ValueError):
+        sampler.sample(5, out=np.empty((5, 3), dtype=np.float32))
+
+def test_latin_hypercube_stratification():
+    """Test that every axis has one point per stratum in each call."""
+    sampler = LatinHypercubeSampler([[0.0, 1.0]] * 5, seed=0, dtype=np.float32)
+    for n in (7, 50):
+        strata = np.floor(sampler.sample(n) * n).astype(int)
+        for column in strata.T:
+            assert sorted(column) == list(range(n))
+
+def test_halton_sequence():
+    """Test the unscrambled sequence and the random shift."""
+    points = HaltonSampler([[0.0, 1.0]] * 3, scramble=False).sample(5)
+    expected = [[0, 0, 0], [1 / 2, 1 / 3, 1 / 5], [1 / 4, 2 / 3, 2 / 5], [3 / 4, 1 / 9, 3 / 5], [1 / 8, 4 / 9, 4 / 5]]
+    assert np.allclose(points, expected)
+
+    points = HaltonSampler([[0.0, 1.0]] * 50, seed=0).sample(1000)
+    assert np.all((points >= 0) & (points < 1))
+    assert np.allclose(points.mean(axis=0), 0.5, atol=0.05)
+
+@pytest.mark.skipif(not sobol_available(), reason="SciPy not installed")
+def test_sobol_sequence():
+    """Test the unscrambled Sobol points and their balance."""
+    points = SobolSampler([[0.0, 1.0]] * 2, scramble=False).sample(4)
+    assert np.allclose(points, [[0, 0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75]])
+
+    points = SobolSampler(Rastrigin(dim=8), seed=0).sample(256)
+    strata = np.floor((points + 5.12) / 10.24 * 16).astype(int)
+    assert all(np.all(np.bincount(column, minlength=16) == 16) for column in strata.T)
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_spawn_independent_streams(kind):
+    """Test that children are reproducible and differ from each other."""
+    func = Rastrigin(dim=3)
+    children = make_sampler(kind, func, seed=7).spawn(3)
+    again = make_sampler(kind, func, seed=7).spawn(3)
+    draws = [child.sample(32) for child in children]
+    assert all(np.array_equal(a, b.sample(32)) for a, b in zip(draws, again))
+    assert not np.array_equal(draws[0], draws[1])
+
+@pytest.mark.parametrize("cls", [HaltonSampler] + ([SobolSampler] if sobol_available() else []))
+def test_spawn_sequence_blocks(cls):
+    """Test that blocks of a sequence reassemble the parent stream."""
+    whole = cls(Rastrigin(dim=4), seed=3).sample(48)
+    blocks = cls(Rastrigin(dim=4), seed=3).spawn(3, block=16)
+    assert np.array_equal(np.concatenate([block.sample(16) for block in blocks]), whole)
+
+    with pytest.raises(ValueError):
+        cls(Rastrigin(dim=4), scramble=False).spawn(2)
+
+def test_invalid_arguments():
+    """Test unknown kinds, malformed boxes and dtypes."""
+    with pytest.raises(ValueError):
+        make_sampler("grid", Rastrigin())
+    with pytest.raises(ValueError):
+        UniformSampler([[1.0, 0.0]])
+    with pytest.raises(ValueError):
+        UniformSampler(Rastrigin(), dtype=np.int32)
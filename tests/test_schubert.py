@@ -67,4 +67,53 @@ def test_schubert_string_representation():
     """Test Schubert function string representation."""
     func = Schubert()
     assert str(func) == "Schubert(dim=2)"
-    assert repr(func).startswith("Schubert(name='Schubert', dim=2") 
\ No newline at end of file
+    assert repr(func).startswith("Schubert(name='Schubert', dim=2") 
+
+def test_schubert_batch_evaluation():
+    """Test Schubert function batched evaluation."""
+    func = Schubert(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-10, 10, size=(50, 3))
+    
+    # Batched values match the scalar path row by row
+    values = func.evaluate_batch(X)
+    assert values.shape == (50,)
+    assert np.allclose(values, [func(x) for x in X])
+    
+    # Test with invalid shape
+    with pytest.raises(ValueError):
+        func.evaluate_batch(X[0])
+
+def test_schubert_matches_reference():
+    """Test the broadcast kernel against the per-coordinate formula."""
+    func = Schubert(dim=10)
+    rng = np.random.default_rng(1)
+    X = rng.uniform(-10, 10, size=(20, 10))
+    
+    j = np.arange(1, 6)
+    expected = [np.prod([np.sum(j * np.cos((j + 1) * xi + j)) for xi in x]) for x in X]
+    assert np.allclose(func.evaluate_batch(X), expected)
+
+
+
+def test_schubert_gradient():
+    """Test Schubert analytic gradient against central differences."""
+    func = Schubert(dim=3)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-9, 9, size=(10, 3))
+    
+    values, grads = func.value_and_grad(X)
+    assert np.allclose(values, func.evaluate_batch(X))
+    
+    h = 1e-6
+    for i in range(func.dim):
+        step = np.zeros(func.dim)
+        step[i] = h
+        numeric = (func.evaluate_batch(X + step) - func.evaluate_batch(X - step)) / (2 * h)
+        assert np.allclose(grads[:, i], numeric, rtol=1e-5, atol=1e-5)
+    
+    # Single point returns a scalar and a (dim,) gradient
+    value, grad = func.value_and_grad(X[0])
+    assert np.isclose(value, func(X[0]))
+    assert np.allclose(func.gradient(X[0]), grad)
+    assert grad.shape == (func.dim,)
\ No newline at end of file
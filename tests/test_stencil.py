@@ -0,0 +1,120 @@
+"""
+Tests for batched evaluation of axis-aligned stencils.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (Ackley, Forrester, Griewank, Rastrigin, Rosenbrock, Schubert,
+                                 Schwefel, TransformedFunction)
+from benchmark_functions import stencil
+
+def _reference(func, x, offsets):
+    offsets = np.broadcast_to(np.asarray(offsets, dtype=float).reshape(len(offsets), -1), (len(offsets), func.dim))
+    values = np.empty(offsets.shape)
+    for j in range(len(offsets)):
+        for i in range(func.dim):
+            point = np.array(x, dtype=float)
+            point[i] += offsets[j, i]
+            values[j, i] = func(point)
+    return values
+
+@pytest.mark.parametrize("func", [Ackley(dim=7), Griewank(dim=7), Rastrigin(dim=7), Schwefel(dim=7),
+                                  Schubert(dim=4), Rosenbrock(dim=7), Forrester(),
+                                  TransformedFunction(Rastrigin(dim=5))])
+def test_stencil_matches_pointwise(func):
+    """Test the fast and batched paths against separate evaluations."""
+    rng = np.random.default_rng(0)
+    bounds = func._bounds_array
+    x = rng.uniform(0.8 * bounds[:, 0], 0.8 * bounds[:, 1])
+    offsets = [-0.1, 0.05, 0.1]
+    values = func.evaluate_stencil(x, offsets)
+    assert values.shape == (3, func.dim)
+    assert np.allclose(values, _reference(func, x, offsets), rtol=1e-12, atol=1e-12)
+
+    per_axis = rng.uniform(-0.1, 0.1, size=(2, func.dim))
+    assert np.allclose(func.evaluate_stencil(x, per_axis), _reference(func, x, per_axis), rtol=1e-12, atol=1e-12)
+
+class _DoubledAckley(Ackley):
+    """Subclass overriding _evaluate but inheriting the per-coordinate terms."""
+    
+    def _evaluate(self, X):
+        return 2 * super()._evaluate(X)
+
+def test_overridden_formula():
+    """Test that overriding subclasses aren't evaluated from the parent's terms."""
+    func = _DoubledAckley(dim=4)
+    x = np.array([0.5, -1.0, 2.0, 0.25])
+    assert np.allclose(func.evaluate_stencil(x, [-0.1, 0.1]), _reference(func, x, [-0.1, 0.1]))
+    assert np.allclose(func.evaluate_stencil(x, [0.1]), 2 * Ackley(dim=4).evaluate_stencil(x, [0.1]))
+
+def test_griewank_vanishing_factor():
+    """Test a perturbation that makes a cosine factor of the product vanish."""
+    func = Griewank(dim=3)
+    x = np.array([0.0, 0.0, 0.0])
+    # cos(x_3 / sqrt(3)) is zero at x_3 = pi sqrt(3) / 2
+    shift = np.pi * np.sqrt(3) / 2
+    values = func.evaluate_stencil(x, [shift])
+    assert np.allclose(values, _reference(func, x, [shift]))
+
+def test_out_of_bounds_points():
+    """Test stencil points leaving the bounds under several policies."""
+    x = np.array([5.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        Rastrigin(dim=3).evaluate_stencil(x, [0.5])
+
+    for policy in ("clip", "nan", "penalty", "trusted"):
+        func = Rastrigin(dim=3, bounds_policy=policy)
+        values = func.evaluate_stencil(x, [-0.5, 0.5])
+        assert np.allclose(values, _reference(func, x, [-0.5, 0.5]), equal_nan=True)
+    assert np.isnan(Rastrigin(dim=3, bounds_policy="nan").evaluate_stencil(x, [0.5])[0, 0])
+
+def test_out_of_bounds_points_in_chunks(monkeypatch):
+    """Test that offending points are evaluated in bounded chunks."""
+    monkeypatch.setattr(stencil, "CHUNK_BYTES", 64)
+    batches = []
+    
+    class Counting(Rastrigin):
+        def _evaluate_with_policy(self, X, with_grad=False, run=None):
+            batches.append(len(X))
+            return super()._evaluate_with_policy(X, with_grad, run)
+    
+    func = Counting(dim=6, bounds_policy="penalty")
+    x = np.full(6, 5.0)
+    values = func.evaluate_stencil(x, [-0.5, 0.5, np.nan])
+    assert np.allclose(values, _reference(Rastrigin(dim=6, bounds_policy="penalty"), x, [-0.5, 0.5, np.nan]),
+                       equal_nan=True)
+    assert sum(batches) == 12 and max(batches) <= 64 // (6 * 8)
+
+    # A centre outside the box takes the chunked generic path
+    calls = []
+    monkeypatch.setattr(stencil, "_batched_stencil", lambda f, x, T: calls.append(T.shape) or np.zeros(T.shape))
+    Rastrigin(dim=6, bounds_policy="nan").evaluate_stencil(np.full(6, 6.0), [0.5])
+    assert calls == [(1, 6)]
+
+def test_batched_path_chunks_and_metrics(monkeypatch):
+    """Test chunked evaluation, and that metrics see every stencil point."""
+    monkeypatch.setattr(stencil, "CHUNK_BYTES", 1)
+    func = Rosenbrock(dim=5)
+    x = np.full(5, 0.5)
+    assert np.allclose(func.evaluate_stencil(x, [-0.1, 0.1]), _reference(func, x, [-0.1, 0.1]))
+
+    rastrigin = Rastrigin(dim=4)
+    metrics = rastrigin.enable_metrics()
+    seen = []
+    metrics.add_hook(pre=lambda f, X: seen.append(len(X)))
+    values = rastrigin.evaluate_stencil(np.zeros(4), [0.25])
+    assert np.allclose(values, _reference(Rastrigin(dim=4), np.zeros(4), [0.25]))
+    assert metrics.points == 4 and sum(seen) == 4
+
+def test_dtype_and_validation():
+    """Test the per-call dtype and malformed offsets."""
+    func = Ackley(dim=6)
+    values = func.evaluate_stencil(np.zeros(6), [0.1], dtype=np.float32)
+    assert values.dtype == np.float32
+    assert np.allclose(values, _reference(func, np.zeros(6), [0.1]), rtol=1e-5)
+    assert func.evaluate_stencil(np.zeros(6), 0.1).shape == (1, 6)
+
+    with pytest.raises(ValueError):
+        func.evaluate_stencil(np.zeros(6), np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        func.evaluate_stencil(np.zeros(5), [0.1])
@@ -0,0 +1,81 @@
+"""
+Tests for streaming evaluation.
+"""
+
+import numpy as np
+from benchmark_functions import (
+    Rastrigin, BestSoFar, RunningStats, filter_below, filter_stream, reduce_stream, track,
+)
+from benchmark_functions.streaming import rechunk, rows_for_budget
+
+def _chunks(n_chunks=5, rows=200, dim=3, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n_chunks):
+        yield rng.uniform(-5.12, 5.12, size=(rows, dim))
+
+def test_evaluate_stream_is_lazy():
+    """Test that chunks are consumed on demand."""
+    func = Rastrigin(dim=3)
+    consumed = []
+    
+    def source():
+        for chunk in _chunks():
+            consumed.append(len(chunk))
+            yield chunk
+    
+    stream = func.evaluate_stream(source())
+    assert consumed == []
+    points, values = next(stream)
+    assert consumed == [200]
+    assert np.allclose(values, func.evaluate_batch(points))
+
+def test_evaluate_stream_memory_budget():
+    """Test re-chunking to a memory budget."""
+    func = Rastrigin(dim=3)
+    budget = 50 * 3 * 8 * 4
+    assert rows_for_budget(3, budget) == 50
+    
+    sizes = [len(points) for points, _ in func.evaluate_stream(_chunks(), memory_budget=budget)]
+    assert sizes == [50] * 20
+    assert [len(c) for c in rechunk([np.zeros((7, 1))], 3)] == [3, 3, 1]
+
+def test_stream_stages():
+    """Test filters and running reductions against the materialized result."""
+    func = Rastrigin(dim=3)
+    X = np.concatenate(list(_chunks()))
+    values = func.evaluate_batch(X)
+    
+    best, stats = BestSoFar(), RunningStats()
+    kept = []
+    stream = filter_below(func.evaluate_stream(_chunks()), 20.0)
+    for points, chunk_values in track(stream, best, stats):
+        assert np.all(chunk_values < 20.0)
+        kept.append(len(points))
+    
+    below = values[values < 20.0]
+    assert sum(kept) == len(below)
+    assert np.isclose(best.value, below.min())
+    assert np.allclose(best.point, X[np.argmin(values)])
+    assert stats.count == len(below)
+    assert np.isclose(stats.mean, below.mean())
+    assert np.isclose(stats.variance, below.var())
+    assert stats.min == below.min() and stats.max == below.max()
+
+def test_reduce_stream():
+    """Test consuming a stream with reducers only."""
+    func = Rastrigin(dim=3)
+    stats = reduce_stream(func.evaluate_stream(_chunks()), RunningStats())
+    assert stats.count == 1000
+    
+    stream = filter_stream(func.evaluate_stream(_chunks()), lambda points, values: points[:, 0] > 0)
+    best, stats = reduce_stream(stream, BestSoFar(), RunningStats())
+    assert best.point[0] > 0
+    assert 0 < stats.count < 1000
+
+def test_reducers_skip_nan():
+    """Test that NaN values (e.g. from the 'nan' bounds policy) are ignored."""
+    func = Rastrigin(bounds_policy="nan")
+    best, stats = reduce_stream(func.evaluate_stream([[[0.0, 0.0], [9.0, 9.0]], [[10.0, 0.0]]]),
+                                BestSoFar(), RunningStats())
+    assert best.value == 0.0
+    assert stats.count == 1
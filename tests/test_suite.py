@@ -0,0 +1,105 @@
+"""
+Tests for multi-function suite evaluation.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (Ackley, FunctionSuite, Griewank, Rastrigin, Rosenbrock,
+                                 Schubert, Schwefel, TransformedFunction)
+from benchmark_functions.utils import SharedTerms
+
+def _functions(dim, **kwargs):
+    return [Ackley(dim=dim, **kwargs), Rastrigin(dim=dim, **kwargs), Griewank(dim=dim, **kwargs),
+            Schwefel(dim=dim, **kwargs), Rosenbrock(dim=dim, **kwargs), Schubert(dim=dim, **kwargs)]
+
+def test_suite_matches_individual_evaluation():
+    """Test that suite columns equal the separate evaluations."""
+    functions = _functions(7)
+    suite = FunctionSuite(functions)
+    X = np.random.default_rng(0).uniform(-2, 2, size=(300, 7))
+    values = suite.evaluate_batch(X)
+    
+    assert values.shape == (300, len(functions))
+    for k, func in enumerate(functions):
+        assert np.allclose(values[:, k], func.evaluate_batch(X))
+    assert np.allclose(suite(X[0]), values[0])
+    assert suite.names == [func.name for func in functions]
+
+def test_suite_shares_intermediates():
+    """Test that the shared terms are computed once per batch."""
+    X = np.random.default_rng(1).uniform(-2, 2, size=(10, 4))
+    terms = SharedTerms(X)
+    values = [func._run_shared(terms) for func in _functions(4)]
+    assert terms.sum_square is terms.sum_square
+    assert {"square", "sum_square", "sum_cos_2pi"} <= set(vars(terms))
+    for func, value in zip(_functions(4), values):
+        assert np.allclose(value, func.evaluate_batch(X))
+
+def test_suite_nested_bounds_checks():
+    """Test bounds checks across nested domains and per-function policies."""
+    functions = [Rastrigin(dim=2, bounds_policy="nan"), Ackley(dim=2, bounds_policy="nan"),
+                 Schwefel(dim=2, bounds_policy="penalty"), Griewank(dim=2)]
+    suite = FunctionSuite(functions)
+    assert suite._parents == [None, 0, 1, 2]
+    
+    X = np.array([[0.0, 0.0], [10.0, 0.0], [100.0, 0.0], [550.0, 0.0]])
+    values = suite.evaluate_batch(X)
+    assert np.isnan(values[1:, 0]).all() and not np.isnan(values[0, 0])
+    assert np.isnan(values[2:, 1]).all() and not np.isnan(values[:2, 1]).any()
+    assert values[3, 2] > 1e10 and values[2, 2] < 1e10
+    assert np.allclose(values[:, 3], functions[3].evaluate_batch(X))
+    
+    with pytest.raises(ValueError):
+        suite.evaluate_batch([[700.0, 0.0]])
+
+def test_suite_degenerate_boxes(recwarn):
+    """Test ordering boxes with zero-width axes without log(0) warnings."""
+    pinned = Rastrigin(dim=2, bounds_policy="nan")
+    pinned.bounds = [(0.0, 0.0), (-1.0, 1.0)]
+    point = Rastrigin(dim=2, bounds_policy="nan")
+    point.bounds = [(0.0, 0.0), (0.0, 0.0)]
+    suite = FunctionSuite([Ackley(dim=2, bounds_policy="nan"), pinned, point])
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+    assert suite._parents == [None, 0, 1]
+    
+    values = suite.evaluate_batch([[0.0, 0.0], [0.0, 0.5], [1.0, 0.0]])
+    assert np.isnan(values[:, 2]).tolist() == [False, True, True]
+    assert np.isnan(values[:, 1]).tolist() == [False, False, True]
+    assert not np.isnan(values[:, 0]).any()
+
+class _DoubledRastrigin(Rastrigin):
+    """Subclass overriding _evaluate but inheriting _evaluate_shared."""
+    
+    def _evaluate(self, X):
+        return 2 * super()._evaluate(X)
+
+def test_suite_overridden_formula():
+    """Test that an overriding subclass isn't evaluated with the parent's shared kernel."""
+    X = np.random.default_rng(0).uniform(-5, 5, size=(10, 3))
+    func = _DoubledRastrigin(dim=3)
+    values = FunctionSuite([func, Rastrigin(dim=3)]).evaluate_batch(X)
+    assert np.allclose(values[:, 0], func.evaluate_batch(X))
+    assert np.allclose(values[:, 0], 2 * values[:, 1])
+
+def test_suite_metrics_and_transformed():
+    """Test that metrics are recorded and wrappers fall back to their kernel."""
+    rastrigin = Rastrigin(dim=3)
+    metrics = rastrigin.enable_metrics()
+    rotated = TransformedFunction(Ackley(dim=3), seed=1)
+    suite = FunctionSuite([rastrigin, rotated])
+    X = np.random.default_rng(2).uniform(-1, 1, size=(20, 3))
+    values = suite.evaluate_batch(X)
+    
+    assert metrics.snapshot()["points"] == 20
+    assert np.allclose(values[:, 1], rotated.evaluate_batch(X))
+
+def test_suite_validation():
+    """Test that mismatched functions are rejected."""
+    with pytest.raises(ValueError):
+        FunctionSuite([])
+    with pytest.raises(ValueError):
+        FunctionSuite([Rastrigin(dim=2), Ackley(dim=3)])
+    with pytest.raises(ValueError):
+        FunctionSuite([Rastrigin(dim=2), Ackley(dim=2, dtype=np.float32)])
+    with pytest.raises(ValueError):
+        FunctionSuite([Rastrigin(dim=2)]).evaluate_batch(np.zeros((3, 4)))
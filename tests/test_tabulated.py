@@ -0,0 +1,93 @@
+"""
+Tests for the tabulated approximate mode of the 1D functions.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+from benchmark_functions import Forrester, GramacyLee, get_function
+from benchmark_functions import tabulated
+
+# Documented maximum absolute errors of approximate mode, float64 and float32
+MAX_ERRORS = {Forrester: (5e-14, 1.1e-5), GramacyLee: (1e-12, 3.5e-6)}
+
+@pytest.mark.parametrize("cls", [Forrester, GramacyLee])
+def test_documented_maximum_error(cls):
+    """Test the approximation error over a dense grid of the bounds."""
+    lower, upper = cls._table_domain
+    X = np.linspace(lower, upper, 1_000_001)[:, np.newaxis]
+    exact = cls().evaluate_batch(X)
+    for dtype, tolerance in zip((np.float64, np.float32), MAX_ERRORS[cls]):
+        values = cls(dtype=dtype, approximate=True).evaluate_batch(X)
+        assert values.dtype == dtype
+        assert np.max(np.abs(values - exact)) < tolerance
+
+@pytest.mark.parametrize("cls", [Forrester, GramacyLee])
+def test_switch_back_to_exact(cls):
+    """Test toggling the mode on an instance, through get_function and pickling."""
+    func = cls()
+    x = [np.mean(cls._table_domain) + 0.123]
+    exact = func(x)
+    func.approximate = True
+    assert func.approximate and isinstance(func(x), float)
+    assert func(x) != exact and np.isclose(func(x), exact, rtol=0, atol=1e-12)
+    assert pickle.loads(pickle.dumps(func)).approximate
+    func.approximate = False
+    assert func(x) == exact
+
+    assert get_function(cls.__name__, approximate=True).approximate
+    assert not cls().approximate
+
+class _ScaledForrester(Forrester):
+    __slots__ = ("scale",)
+
+    def __init__(self, scale, **kwargs):
+        super().__init__(**kwargs)
+        self.scale = scale
+
+    def _table_key(self):
+        return self.scale
+
+    def _evaluate(self, X):
+        return self.scale * super()._evaluate(X)
+
+    def _value_and_grad(self, X):
+        values, grads = super()._value_and_grad(X)
+        return self.scale * values, self.scale * grads
+
+def test_tables_cached_per_class_and_dtype():
+    """Test that tables are built once per class and dtype."""
+    table = tabulated.hermite_table(Forrester(), np.dtype(np.float64))
+    assert tabulated.hermite_table(Forrester(dtype=np.float32), np.dtype(np.float64)) is table
+    assert table.coefficients.shape == (4, tabulated.TABLE_INTERVALS)
+    assert tabulated.hermite_table(Forrester(), np.dtype(np.float32)).coefficients.dtype == np.float32
+    assert tabulated.hermite_table(GramacyLee(), np.dtype(np.float64)) is not table
+
+def test_tables_built_from_the_instance():
+    """Test tables of a subclass with constructor parameters, keyed on _table_key."""
+    X = np.linspace(0, 1, 101)[:, np.newaxis]
+    for scale in (2.0, 3.0):
+        func = _ScaledForrester(scale, approximate=True)
+        exact = _ScaledForrester(scale).evaluate_batch(X)
+        assert np.allclose(func.evaluate_batch(X), exact, rtol=0, atol=1e-12)
+        assert np.isclose(func([0.3]), _ScaledForrester(scale)([0.3]), rtol=0, atol=1e-12)
+    assert _ScaledForrester(2.0)([0.3]) == 2 * Forrester()([0.3])
+    assert (tabulated.hermite_table(_ScaledForrester(2.0), np.dtype(np.float64))
+            is tabulated.hermite_table(_ScaledForrester(2.0), np.dtype(np.float64)))
+
+def test_chunks_and_edge_points(monkeypatch):
+    """Test chunked evaluation, the domain ends, empty batches and NaN."""
+    func = GramacyLee(approximate=True)
+    X = np.random.default_rng(0).uniform(0.5, 2.5, size=(1000, 1))
+    values = func.evaluate_batch(X)
+    monkeypatch.setattr(tabulated, "CHUNK_SIZE", 7)
+    assert np.array_equal(func.evaluate_batch(X), values)
+
+    ends = np.array([[0.5], [2.5]])
+    assert np.allclose(func.evaluate_batch(ends), GramacyLee().evaluate_batch(ends), rtol=0, atol=1e-12)
+    assert func.evaluate_batch(np.empty((0, 1))).shape == (0,)
+
+    func = Forrester(bounds_policy="trusted", approximate=True)
+    assert np.isnan(func.evaluate_batch([[np.nan], [0.5]])).tolist() == [True, False]
+    assert np.isclose(Forrester(bounds_policy="clip", approximate=True)([1.5]), Forrester()([1.0]))
@@ -0,0 +1,36 @@
+"""
+Tests for thread-pool chunked evaluation.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import Ackley, Rosenbrock, Schubert
+from benchmark_functions.threads import auto_chunk_rows, auto_threads
+
+@pytest.mark.parametrize("func", [Ackley(dim=5), Rosenbrock(dim=5), Schubert(dim=5)],
+                         ids=lambda f: type(f).__name__)
+def test_threaded_matches_batch(func):
+    """Test threaded evaluation against evaluate_batch."""
+    rng = np.random.default_rng(0)
+    X = rng.uniform(func._bounds_array[:, 0], func._bounds_array[:, 1], size=(5003, func.dim))
+    
+    expected = func.evaluate_batch(X)
+    assert np.allclose(func.evaluate_threaded(X), expected)
+    assert np.allclose(func.evaluate_threaded(X, n_threads=3, chunk_rows=100), expected)
+
+def test_threaded_errors():
+    """Test shape validation and bounds errors in threaded evaluation."""
+    func = Ackley()
+    with pytest.raises(ValueError):
+        func.evaluate_threaded(np.zeros((10, 3)))
+    
+    X = np.zeros((1000, 2))
+    X[700] = 40.0
+    with pytest.raises(ValueError):
+        func.evaluate_threaded(X, n_threads=4, chunk_rows=50)
+
+def test_auto_tuning():
+    """Test chunk size and thread count heuristics."""
+    assert auto_chunk_rows(2) > auto_chunk_rows(100) >= auto_chunk_rows(100000)
+    assert auto_chunk_rows(100000) == 16
+    assert auto_threads(10, 2, auto_chunk_rows(2)) == 1
@@ -0,0 +1,89 @@
+"""
+Tests for the shifted and rotated function variants.
+"""
+
+import numpy as np
+import pytest
+from benchmark_functions import (Ackley, Griewank, Rastrigin, Rosenbrock, Schubert,
+                                 Schwefel, TransformedFunction)
+from benchmark_functions.transforms import rotation_matrix
+
+BASES = [Ackley, Griewank, Rastrigin, Rosenbrock, Schwefel]
+
+def _sample(func, n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    bounds = func._bounds_array
+    return rng.uniform(bounds[:, 0], bounds[:, 1], size=(n, func.dim))
+
+def test_rotation_matrix():
+    """Test that rotations are orthogonal, seeded and cached."""
+    R = rotation_matrix(6, 1)
+    assert np.allclose(R @ R.T, np.eye(6))
+    assert rotation_matrix(6, 1) is R
+    assert not np.allclose(rotation_matrix(6, 2), R)
+    assert not R.flags.writeable
+
+@pytest.mark.parametrize("cls", BASES)
+def test_transformed_global_minimum(cls):
+    """Test that the optimum moves to the shift and stays the minimum."""
+    func = TransformedFunction(cls(dim=6), seed=4)
+    value, location = func.get_global_minimum()
+    assert func.check_bounds(location)
+    assert np.isclose(func(location), value, atol=1e-3)
+    assert np.all(func.evaluate_batch(_sample(func)) >= value - 1e-3)
+    assert not np.allclose(location, cls(dim=6).get_global_minimum()[1])
+
+@pytest.mark.parametrize("cls", BASES)
+def test_transformed_matches_definition(cls):
+    """Test the batch transform against f(x) = g(R (x - o) + x*)."""
+    base = cls(dim=4, bounds_policy="clip")
+    func = TransformedFunction(base, seed=2)
+    X = _sample(func, n=50)
+    Z = (X - func.shift) @ func.rotation.T + base.get_global_minimum()[1]
+    assert np.allclose(func.evaluate_batch(X), base.evaluate_batch(Z))
+
+@pytest.mark.parametrize("cls", BASES)
+def test_transformed_gradient(cls):
+    """Test the chain-rule gradient against finite differences."""
+    func = TransformedFunction(cls(dim=5), seed=1)
+    x = func.get_global_minimum()[1] + 0.05 * np.arange(1, 6)
+    eps = 1e-6
+    numeric = np.array([(func(x + eps * e) - func(x - eps * e)) / (2 * eps) for e in np.eye(5)])
+    assert np.allclose(func.gradient(x), numeric, rtol=1e-4, atol=1e-4)
+
+def test_shift_and_rotation_options():
+    """Test explicit, disabled and invalid shifts and rotations."""
+    base = Rastrigin(dim=3)
+    shift = np.array([1.0, -2.0, 0.5])
+    func = TransformedFunction(base, shift=shift, rotation=False)
+    assert func.name == "Shifted Rastrigin"
+    assert func.rotation is None
+    assert np.isclose(func(shift), 0.0)
+    assert np.isclose(func([0.0, 0.0, 0.0]), base(-shift))
+
+    func = TransformedFunction(base, shift=False)
+    assert func.name == "Rotated Rastrigin"
+    assert np.allclose(func.get_global_minimum()[1], 0.0)
+
+    with pytest.raises(ValueError):
+        TransformedFunction(base, rotation=np.ones((3, 3)))
+    with pytest.raises(ValueError):
+        TransformedFunction(base, shift=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        TransformedFunction(Schubert(dim=2))
+
+def test_transformed_seed_reproducible():
+    """Test that equal seeds give the same function."""
+    X = _sample(Ackley(dim=8), n=10)
+    a = TransformedFunction(Ackley(dim=8), seed=7).evaluate_batch(X)
+    b = TransformedFunction(Ackley(dim=8), seed=7).evaluate_batch(X)
+    c = TransformedFunction(Ackley(dim=8), seed=8).evaluate_batch(X)
+    assert np.array_equal(a, b)
+    assert not np.allclose(a, c)
+
+def test_transformed_bounds_policy_and_dtype():
+    """Test that the wrapper applies its own bounds policy and keeps the dtype."""
+    func = TransformedFunction(Rastrigin(dim=2, dtype=np.float32), bounds_policy="nan")
+    values = func.evaluate_batch([[0.0, 0.0], [9.0, 0.0]])
+    assert values.dtype == np.float32
+    assert not np.isnan(values[0]) and np.isnan(values[1])
@@ -0,0 +1,103 @@
+"""
+Tests for the blocked high-dimensional kernels and their scratch workspace.
+"""
+
+import pickle
+import threading
+import tracemalloc
+
+import numpy as np
+import pytest
+from benchmark_functions import Ackley, Griewank, Rosenbrock
+from benchmark_functions import workspace
+from benchmark_functions.workspace import BLOCKED_MIN_DIM, Workspace, pairwise_reduce
+
+DIM = BLOCKED_MIN_DIM + 1500
+
+def _reference(func, X):
+    if isinstance(func, Ackley):
+        return (-20 * np.exp(-0.2 * np.sqrt(np.mean(X**2, axis=1)))
+                - np.exp(np.mean(np.cos(2 * np.pi * X), axis=1)) + 20 + np.e)
+    if isinstance(func, Griewank):
+        return 1 + np.sum(X**2, axis=1) / 4000 - np.prod(np.cos(X / np.sqrt(np.arange(1, X.shape[1] + 1))), axis=1)
+    return np.sum(100 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+
+@pytest.mark.parametrize("cls", [Ackley, Griewank, Rosenbrock])
+def test_blocked_matches_plain_kernel(cls):
+    """Test the blocked kernels against the direct formulas."""
+    X = np.random.default_rng(0).uniform(-2, 2, size=(3, DIM))
+    func = cls(dim=DIM)
+    assert np.allclose(func.evaluate_batch(X), _reference(func, X), rtol=1e-12)
+    assert np.isclose(func(X[1]), _reference(func, X[1:2])[0], rtol=1e-12)
+
+    X32 = X.astype(np.float32)
+    assert np.allclose(cls(dim=DIM, dtype=np.float32).evaluate_batch(X32), _reference(func, X), rtol=1e-4)
+
+@pytest.mark.parametrize("cls", [Ackley, Griewank, Rosenbrock])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_blocked_results_independent_of_block_size(cls, dtype, monkeypatch):
+    """Test that the block size doesn't change a single bit of the result."""
+    X = np.random.default_rng(1).uniform(-2, 2, size=(4, DIM)).astype(dtype)
+    func = cls(dim=DIM, dtype=dtype)
+    results = []
+    for block_bytes in (1, 1 << 14, 1 << 18, 1 << 26):
+        monkeypatch.setattr(workspace, "BLOCK_BYTES", block_bytes)
+        results.append(func.evaluate_batch(X))
+    for result in results[1:]:
+        assert np.array_equal(result, results[0])
+
+def test_blocked_peak_memory():
+    """Test that evaluation allocates a small constant amount of memory."""
+    dim = 1_000_000
+    x = np.random.default_rng(2).uniform(-2, 2, dim)
+    for func in (Ackley(dim=dim), Griewank(dim=dim), Rosenbrock(dim=dim)):
+        func(x)
+        tracemalloc.start()
+        func(x)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert peak < x.nbytes / 20
+
+def test_workspace_buffers():
+    """Test that buffers are reused per key and not shared between threads."""
+    ws = Workspace()
+    a = ws.buffer("a", (4, 8), np.dtype(np.float64))
+    assert a.shape == (4, 8)
+    assert np.shares_memory(a, ws.buffer("a", (2, 3), np.dtype(np.float64)))
+    assert not np.shares_memory(a, ws.buffer("b", (4, 8), np.dtype(np.float64)))
+    assert ws.buffer("a", (4, 8), np.dtype(np.float32)).dtype == np.float32
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(ws.buffer("a", (4, 8), np.dtype(np.float64))))
+    thread.start()
+    thread.join()
+    assert not np.shares_memory(a, other[0])
+
+def test_pairwise_reduce():
+    """Test the fixed pairwise combination of leaf results."""
+    partials = np.arange(1.0, 8.0)[np.newaxis, :]
+    assert pairwise_reduce(partials)[0] == 28
+    assert pairwise_reduce(partials, np.multiply)[0] == 5040
+    assert pairwise_reduce(partials[:, :1])[0] == 1
+
+def test_concurrent_and_pickled_evaluation():
+    """Test threads sharing an instance, and that the workspace isn't pickled."""
+    X = np.random.default_rng(3).uniform(-2, 2, size=(2, DIM))
+    func = Rosenbrock(dim=DIM)
+    expected = func.evaluate_batch(X)
+    results = [None] * 4
+
+    def work(k):
+        for _ in range(3):
+            results[k] = func.evaluate_batch(X)
+
+    threads = [threading.Thread(target=work, args=(k,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(np.array_equal(result, expected) for result in results)
+
+    clone = pickle.loads(pickle.dumps(func))
+    assert clone._workspace is not func._workspace
+    assert np.array_equal(clone.evaluate_batch(X), expected)